@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Arrow-backed CSV ingest for the large national source files.
+Column projection and row filtering run inside pyarrow's streaming CSV
+reader, and the result stays Arrow-backed (pd.ArrowDtype) in pandas, so
+string columns are not materialized as Python objects. Conversion to
+NumPy/object columns only happens where a consumer forces it (e.g. HTML
+rendering).
+
+pyarrow is optional; without it the same calls fall back to a chunked
+pandas reader with the same projection and filters.
+"""
+import codecs
+import csv
+import io
+import pathlib
+from typing import Callable, Dict, IO, Iterable, Optional, Union
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # Optional dependency
+    pa = None
+
+Source = Union[str, pathlib.Path, Callable[[], IO[bytes]]]
+
+# pandas dtype name -> Arrow type for explicit column dtypes
+_ARROW_TYPES = {
+    "string": "string",
+    "str": "string",
+    "float64": "float64",
+    "Int64": "int64",
+    "int64": "int64",
+}
+
+
+def available() -> bool:
+    """True when pyarrow is installed."""
+    return pa is not None
+
+
+def _open(source: Source) -> IO[bytes]:
+    return source() if callable(source) else open(source, "rb")
+
+
+def read_header(source: Source, encoding: str = "utf8"):
+    """Column names from the first CSV line."""
+    with _open(source) as f:
+        text = codecs.getreader(encoding)(f, errors="replace")
+        return next(csv.reader(io.StringIO(text.readline())), [])
+
+
+def read_csv_table(source: Source, columns: Iterable[str], where: Optional[Dict[str, list]] = None,
+                   dtypes: Optional[Dict[str, str]] = None, encoding: str = "utf8",
+                   block_size: int = 1 << 20):
+    """
+    Stream a CSV into a pyarrow Table with only `columns` (absent ones skipped) and
+    only rows whose `where` columns hold one of the allowed values.
+    Columns without an explicit dtype are read as strings (like dtype=str).
+    """
+    header = read_header(source, encoding)
+    keep = [c for c in columns if c in header]
+    dtypes = dtypes or {}
+    column_types = {c: _ARROW_TYPES.get(dtypes.get(c, "string"), "string") for c in keep}
+
+    batches = []
+    with _open(source) as f:
+        reader = pacsv.open_csv(
+            f,
+            read_options=pacsv.ReadOptions(encoding=encoding, block_size=block_size),
+            convert_options=pacsv.ConvertOptions(include_columns=keep, column_types=column_types,
+                                                 strings_can_be_null=True),
+        )
+        for batch in reader:
+            if where:
+                mask = None
+                for col, allowed in where.items():
+                    cond = pc.is_in(batch.column(col), value_set=pa.array(allowed))
+                    mask = cond if mask is None else pc.and_(mask, cond)
+                batch = batch.filter(mask)
+            if batch.num_rows:
+                batches.append(batch)
+    return pa.Table.from_batches(batches, schema=reader.schema)
+
+
+def to_pandas(table) -> pd.DataFrame:
+    """Arrow table -> pandas with Arrow-backed columns (no object copies)."""
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def read_csv_filtered(source: Source, columns: Iterable[str], where: Optional[Dict[str, list]] = None,
+                      dtypes: Optional[Dict[str, str]] = None, encoding: str = "utf8",
+                      chunksize: int = 100_000) -> pd.DataFrame:
+    """
+    Projected + filtered CSV read. Arrow-backed frame when pyarrow is available,
+    otherwise a chunked pandas read with the same projection and filters.
+
+    Args:
+        source: Path, or a zero-arg callable returning a binary file object
+                (called more than once, e.g. lambda: zf.open(member))
+        columns: Columns to keep (missing ones are ignored)
+        where: {column: allowed values} row filter, applied while parsing
+        dtypes: Explicit dtypes; other columns are strings
+        encoding: Text encoding of the file
+        chunksize: Rows per chunk for the pandas fallback
+    """
+    columns = list(columns)
+    if pa is not None:
+        return to_pandas(read_csv_table(source, columns, where, dtypes, encoding))
+
+    wanted = set(columns)
+    dtypes = {c: dtypes.get(c, str) for c in columns} if dtypes else str
+    parts = []
+    with _open(source) as f:
+        for chunk in pd.read_csv(f, usecols=lambda c: c in wanted, dtype=dtypes,
+                                 encoding=encoding, chunksize=chunksize):
+            for col, allowed in (where or {}).items():
+                chunk = chunk[chunk[col].isin(allowed)]
+            parts.append(chunk)
+    if not parts:  # header-only file
+        return pd.DataFrame(columns=[c for c in columns if c in read_header(source, encoding)])
+    return pd.concat(parts, ignore_index=True)
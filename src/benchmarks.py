@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmarks for the county scorecard (no network).
+Builds synthetic national-shaped source tables for 5 / 67 / ~3,100 / ~31,000
+counties and times the name -> FIPS match and the FIPS-keyed join + scoring.
+Time per county should stay roughly flat as the county count grows.
+Also times batched what-if scoring (many weight configurations in one call)
+and HTML page rendering for 1k-100k schools.
+
+Usage:
+    python src/benchmarks.py
+"""
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+import counties
+import pipeline
+import schools_html
+import scoring
+
+SIZES = [5, 67, 3143, 31430]
+WEIGHT_CONFIGS = [1, 100, 1000]
+HTML_SIZES = [1_000, 10_000, 100_000]
+REPEATS = 5
+
+
+def synthetic_reference(n: int) -> pd.DataFrame:
+    """County reference shaped like load_county_reference(), ~n counties over 50 states."""
+    i = np.arange(n)
+    state_fips = (i % 50 + 1).astype(str)
+    ref = pd.DataFrame({
+        "fips": pd.Series(state_fips).str.zfill(2) + pd.Series(i // 50).astype(str).str.zfill(3),
+        "state_fips": pd.Series(state_fips).str.zfill(2),
+        "state_abbr": "S" + pd.Series(state_fips),
+        "state": "State " + pd.Series(state_fips),
+        "county": "Saint County " + pd.Series(i).astype(str),
+    })
+    ref["county_key"] = counties.county_key(ref["county"])
+    return ref
+
+
+def synthetic_sources(ref: pd.DataFrame, rng) -> dict:
+    """Per-source frames for every county in ref, already keyed by FIPS."""
+    n = len(ref)
+    states = ref["state"].unique()
+    return {
+        "aqi": pd.DataFrame({"fips": ref["fips"], "unhealthy_or_worse_days": rng.integers(0, 40, n)}),
+        "hpsa": pd.DataFrame({"fips": ref["fips"], "hpsa_primary_care_max": rng.uniform(0, 25, n),
+                              "hpsa_primary_care_flag": 1}),
+        "places": pd.DataFrame({"fips": ref["fips"], "chronic_disease_prev": rng.uniform(5, 40, n)}),
+        "fema": pd.DataFrame({"fips": ref["fips"], "risk_score": rng.uniform(0, 100, n),
+                              "risk_rating": "Relatively Moderate"}),
+        "respiratory": pd.DataFrame({"state": states, "respiratory_activity_level": "Low",
+                                     "respiratory_score": 3.5}),
+        "airnow": pd.DataFrame(),
+    }
+
+
+def best_of(fn, repeats=REPEATS):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run():
+    rng = np.random.default_rng(0)
+    print(f"{'counties':>9} {'fips match':>12} {'join+score':>12} {'µs/county':>10}")
+    for n in SIZES:
+        ref = synthetic_reference(n)
+        # Source rows spelled the way EPA/HRSA spell them ("St. County 12")
+        raw = pd.DataFrame({
+            "State": ref["state"],
+            "County": ref["county"].str.replace("Saint ", "St. ", regex=False),
+        })
+        sources = synthetic_sources(ref, rng)
+        seed = ref[["fips", "state", "county"]]
+
+        t_match = best_of(lambda: counties.attach_fips(raw, "State", "County", ref=ref))
+        t_score = best_of(lambda: pipeline.score_counties(seed, sources))
+        matched = counties.attach_fips(raw, "State", "County", ref=ref)["fips"].notna().mean()
+        assert matched == 1.0, f"only {matched:.0%} of names matched"
+
+        per_county = (t_match + t_score) / n * 1e6
+        print(f"{n:>9,} {t_match * 1000:>10.1f}ms {t_score * 1000:>10.1f}ms {per_county:>10.1f}")
+
+
+def run_batched(n=3143):
+    """Batched what-if scoring vs. one scoring.score() call per weight configuration."""
+    rng = np.random.default_rng(0)
+    ref = synthetic_reference(n)
+    scored = pipeline.score_counties(ref[["fips", "state", "county"]], synthetic_sources(ref, rng))
+    spec = scoring.readiness_spec(scored)
+    print(f"\n{'configs':>9} {'batched':>12} {'one by one':>12}   ({n:,} counties)")
+    for m in WEIGHT_CONFIGS:
+        configs = rng.dirichlet(np.ones(len(spec)), size=m) * 100
+
+        def one_by_one():
+            for weights in configs:
+                scoring.score(scored.copy(), [c._replace(weight=w) for c, w in zip(spec, weights)])
+
+        t_batch = best_of(lambda: scoring.score_many(scored, configs, spec))
+        t_loop = best_of(one_by_one, repeats=1)
+        print(f"{m:>9,} {t_batch * 1000:>10.1f}ms {t_loop * 1000:>10.1f}ms")
+
+
+def synthetic_schools(n: int, rng) -> pd.DataFrame:
+    """School scorecard rows shaped like data/school_scorecard.csv."""
+    scored = pd.DataFrame({
+        "school_id": np.arange(n).astype(str),
+        "school_name": "School " + pd.Series(np.arange(n)).astype(str),
+        "county": rng.choice(["Duval", "Clay", "St. Johns", "Nassau", "Baker"], n),
+        "school_type": rng.choice(["Elementary", "Middle", "High"], n),
+        "enrollment": np.where(rng.random(n) < 0.1, np.nan, rng.integers(100, 2000, n)),
+        "chronic_disease_prev": np.where(rng.random(n) < 0.2, np.nan, rng.uniform(5, 40, n)),
+        "hpsa_primary_care_max": rng.integers(0, 25, n).astype(float),
+        "risk_score": rng.uniform(0, 100, n),
+        "unhealthy_or_worse_days": rng.integers(0, 30, n),
+        "respiratory_activity": "Low",
+        "tract": (12031000000 + np.arange(n)).astype(str),
+    })
+    scored["respiratory_score"] = scoring.respiratory_score(scored["respiratory_activity"])
+    return scoring.score(scored).sort_values("readiness_score", ascending=False)
+
+
+def run_html():
+    """School page rendering time; µs/school should stay flat from 1k to 100k."""
+    rng = np.random.default_rng(0)
+    print(f"\n{'schools':>9} {'schools.html':>13} {'µs/school':>10} {'MB':>6} {'virtual+json MB':>16}")
+    for n in HTML_SIZES:
+        df = synthetic_schools(n, rng)
+        t = best_of(lambda: schools_html.generate_school_html(df), repeats=3)
+        size = len(schools_html.generate_school_html(df).encode()) / 1e6
+        virtual = len(schools_html.generate_school_html(df, virtual=True).encode()) + len(
+            json.dumps(schools_html.school_table_data(df), separators=(",", ":")).encode())
+        print(f"{n:>9,} {t * 1000:>11.1f}ms {t / n * 1e6:>10.1f} {size:>6.1f} {virtual / 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("County scorecard scaling benchmark")
+    print("=" * 60)
+    run()
+    run_batched()
+    run_html()
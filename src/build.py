@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Incremental daily build.
+Runs the whole scorecard as a declared stage graph:
+
+    fetch, school source -> county score -> school join -> school score -> nurse model -> HTML -> archive -> publish
+
+Each stage records content hashes of its inputs and outputs in
+data/raw/build_state.json. A stage whose inputs hash the same as last run,
+and whose published files are still on disk unchanged, is skipped and its
+cached outputs are reused, so a day with no upstream changes only pays for
+the (conditional, mostly 304) fetch. Every stage runs in this one process and
+frames pass between stages in memory; CSVs are only written as published
+artifacts.
+
+Usage:
+    python src/build.py           # incremental
+    python src/build.py --force   # rerun every stage
+    python src/build.py --sharded # also publish per-county / per-school pages
+"""
+import hashlib
+import json
+import pathlib
+import pickle
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime
+
+import pandas as pd
+
+import nurse_data
+import pipeline
+import publish
+import schools
+import schools_dashboard
+import schools_html
+import search_index
+import shards
+import trends
+
+BASE = pathlib.Path(__file__).resolve().parents[1]
+OUT = BASE / "data"
+DOCS = BASE / "docs"
+RAW = OUT / "raw"
+STAGE_DIR = RAW / "build"
+STATE_PATH = RAW / "build_state.json"
+
+# inputs:    names of upstream outputs (in-memory values) this stage reads
+# outputs:   names of values this stage produces (cached for reuse when skipped)
+# artifacts: files the stage publishes (list of paths, or a callable returning one)
+# always:    run even when inputs are unchanged (e.g. network fetch)
+Stage = namedtuple("Stage", "name inputs outputs artifacts run always", defaults=((), False))
+
+
+# -----------------------------
+# Fingerprints
+# -----------------------------
+
+def fingerprint(value) -> str:
+    """Content hash of a stage input/output value."""
+    h = hashlib.sha256()
+    if isinstance(value, pd.DataFrame):
+        h.update(json.dumps([list(map(str, value.columns)), list(map(str, value.dtypes))]).encode())
+        h.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, dict):
+        for key in sorted(value):
+            h.update(str(key).encode())
+            h.update(fingerprint(value[key]).encode())
+    elif isinstance(value, pathlib.Path):
+        h.update(value.read_bytes() if value.exists() else b"<missing>")
+    else:
+        h.update(json.dumps(value, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+def _artifacts(stage: Stage):
+    return list(stage.artifacts() if callable(stage.artifacts) else stage.artifacts)
+
+
+def _load_state():
+    if STATE_PATH.exists():
+        try:
+            return json.loads(STATE_PATH.read_text())
+        except ValueError:
+            pass
+    return {}
+
+
+def _save_state(state):
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    STATE_PATH.write_text(json.dumps(state, indent=2))
+
+
+# -----------------------------
+# Stage bodies
+# -----------------------------
+
+def run_fetch(ctx):
+    print("Fetching data sources...")
+    return {"sources": pipeline.fetch_all_sources()}
+
+
+def run_county_score(ctx):
+    return {"county": pipeline.build_scorecard(ctx["sources"])}
+
+
+def run_school_source(ctx):
+    school_list = schools.load_schools()
+    if school_list.empty:
+        raise RuntimeError("No schools found")
+    return {"school_list": school_list}
+
+
+def run_school_join(ctx):
+    return {"schools_joined": schools.join_health_data_to_schools(ctx["school_list"].copy(), ctx["county"])}
+
+
+def run_school_score(ctx):
+    scored = schools.calculate_school_readiness_scores(ctx["schools_joined"].copy())
+    school_scorecard = schools.finalize_school_scorecard(scored)
+    schools.save_schools(school_scorecard, "school_scorecard.csv")
+    return {"school_scorecard": school_scorecard}
+
+
+def run_nurse_model(ctx):
+    return {"schools_with_nurses": nurse_data.assign_nurse_staffing(ctx["school_scorecard"].copy())}
+
+
+def run_html(ctx):
+    pipeline.write_html_table(ctx["county"])
+    schools_dashboard.write_dashboard(ctx["schools_with_nurses"])
+    # Full table: virtualized (page + JSON) above schools_html.VIRTUAL_MIN_SCHOOLS
+    table = schools_html.write_school_html(ctx["school_scorecard"])
+    publish.publish_pages([DOCS / "counties.html", DOCS / "schools.html"] + table)
+    return {}
+
+
+def run_shards(ctx):
+    shards.write_sharded_site(ctx["schools_with_nurses"])
+    return {}
+
+
+def run_publish(ctx):
+    publish.publish()
+    return {}
+
+
+def run_archive(ctx):
+    trends.archive_current_scores(ctx["county"], ctx["school_scorecard"])
+    trends.generate_trend_summary()
+    return {}
+
+
+def _archive_artifacts():
+    stamp = datetime.utcnow().strftime("%Y%m%d")
+    return [trends.HISTORY_DIR / f"county_{stamp}.csv", trends.HISTORY_DIR / f"schools_{stamp}.csv"]
+
+
+STAGES = [
+    Stage("fetch", (), ("sources",), (), run_fetch, always=True),
+    Stage("county_score", ("sources",), ("county",), (pipeline.scorecard_path(),), run_county_score),
+    # Always read (cheap CSV load) so school_join is fingerprinted on the school list itself
+    Stage("school_source", (), ("school_list",), (OUT / "schools_phase4.csv",), run_school_source, always=True),
+    Stage("school_join", ("county", "school_list"), ("schools_joined",), (), run_school_join),
+    Stage("school_score", ("schools_joined",), ("school_scorecard",), (OUT / "school_scorecard.csv",), run_school_score),
+    Stage("nurse_model", ("school_scorecard",), ("schools_with_nurses",), (), run_nurse_model),
+    Stage("html", ("county", "school_scorecard", "schools_with_nurses"), (),
+          (DOCS / "counties.html", DOCS / "schools.html", DOCS / search_index.SEARCH_INDEX_FILE,
+           DOCS / schools_html.SCHOOL_TABLE_FILE, DOCS / schools_html.SCHOOL_DATA_FILE), run_html),
+    Stage("archive", ("county", "school_scorecard"), (), _archive_artifacts, run_archive),
+    # Cheap when nothing changed: only rewrites pages/siblings whose bytes differ
+    Stage("publish", (), (), (), run_publish, always=True),
+]
+
+# Optional sharded publishing (--sharded), run after the single-page HTML.
+# Always runs: one index.html cannot vouch for thousands of pages, and the
+# manifest's per-page hashes already make an unchanged run write nothing.
+SHARD_STAGE = Stage("shards", ("schools_with_nurses",), (), (shards.MANIFEST_PATH,), run_shards, always=True)
+
+
+# -----------------------------
+# Runner
+# -----------------------------
+
+def run(force: bool = False, stages=STAGES):
+    """
+    Run the stage graph, skipping stages whose inputs are unchanged.
+
+    Returns:
+        (ctx, failed): stage outputs by name, and names of stages that raised
+    """
+    state = _load_state()
+    ctx = {}
+    failed = []
+    start = time.perf_counter()
+    STAGE_DIR.mkdir(parents=True, exist_ok=True)
+
+    for stage in stages:
+        missing = [name for name in stage.inputs if name not in ctx]
+        if missing:
+            print(f"⏭️  {stage.name}: skipped (upstream failed: {', '.join(missing)})")
+            continue
+
+        inputs = {name: fingerprint(ctx[name]) for name in stage.inputs}
+        cache_path = STAGE_DIR / f"{stage.name}.pkl"
+        prev = state.get(stage.name, {})
+        artifacts = _artifacts(stage)
+
+        unchanged = (
+            not force
+            and not stage.always
+            and prev.get("inputs") == inputs
+            and (not stage.outputs or cache_path.exists())
+            and all(prev.get("artifacts", {}).get(str(p)) == fingerprint(p) for p in artifacts)
+        )
+        if unchanged:
+            if stage.outputs:
+                with open(cache_path, "rb") as f:
+                    ctx.update(pickle.load(f))
+            print(f"⏭️  {stage.name}: inputs unchanged, skipped")
+            continue
+
+        print(f"\n{'=' * 60}\n▶️  {stage.name}\n{'=' * 60}")
+        t0 = time.perf_counter()
+        try:
+            outputs = stage.run(ctx)
+        except Exception as e:
+            print(f"⚠️  {stage.name} failed: {e}")
+            failed.append(stage.name)
+            state.pop(stage.name, None)
+            _save_state(state)
+            continue
+        ctx.update(outputs)
+
+        if stage.outputs:
+            with open(cache_path, "wb") as f:
+                pickle.dump(outputs, f)
+        state[stage.name] = {
+            "inputs": inputs,
+            "outputs": {name: fingerprint(value) for name, value in outputs.items()},
+            "artifacts": {str(p): fingerprint(p) for p in _artifacts(stage)},
+            "ran_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        }
+        _save_state(state)
+        print(f"✅ {stage.name} done in {time.perf_counter() - t0:.1f}s")
+
+    if failed:
+        print(f"\n❌ Build failed in {time.perf_counter() - start:.1f}s ({', '.join(failed)})")
+    else:
+        print(f"\n🏁 Build finished in {time.perf_counter() - start:.1f}s")
+    return ctx, failed
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    stages = list(STAGES)
+    if "--sharded" in args:
+        stages.insert([s.name for s in stages].index("html") + 1, SHARD_STAGE)
+    _, failed = run(force="--force" in args, stages=stages)
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+County reference table for statewide / national scorecards.
+One row per US county (FIPS, state, county name) from the Census 2020 code
+lists, used to turn county *names* in source files into 5-digit FIPS with a
+single vectorized merge instead of hand-maintained name maps.
+"""
+import pathlib
+from functools import lru_cache
+
+import pandas as pd
+
+from http_cache import cached_fetch, TTL_FOREVER
+
+BASE = pathlib.Path(__file__).resolve().parents[1]
+RAW = BASE / "data" / "raw"
+
+CENSUS_CODES = "https://www2.census.gov/geo/docs/reference/codes2020"
+COUNTY_LIST_URL = f"{CENSUS_CODES}/national_county2020.txt"
+STATE_LIST_URL = f"{CENSUS_CODES}/national_state2020.txt"
+
+# Trailing words that differ between sources ("St. Johns County" vs "St. Johns")
+COUNTY_SUFFIXES = r"\s+(county|parish|borough|census area|city and borough|municipality|municipio)$"
+
+
+def county_key(names: pd.Series) -> pd.Series:
+    """
+    Join key for county names: lower-case, punctuation dropped, "Saint" -> "st",
+    type suffix removed. e.g. "St. Johns County" and "Saint Johns" -> "st johns"
+    """
+    key = names.astype("string").str.lower().str.replace(r"[.'’]", "", regex=True)
+    key = key.str.replace(r"^saint\s+", "st ", regex=True)
+    key = key.str.replace(COUNTY_SUFFIXES, "", regex=True)
+    return key.str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+@lru_cache(maxsize=None)
+def load_county_reference() -> pd.DataFrame:
+    """
+    All US counties (and equivalents) with FIPS, state abbreviation and name.
+
+    Returns:
+        DataFrame with fips, state_fips, state_abbr, state, county, county_key
+    """
+    counties = pd.read_csv(
+        cached_fetch(COUNTY_LIST_URL, path=RAW / "national_county2020.txt", ttl=TTL_FOREVER),
+        sep="|", dtype=str, usecols=["STATE", "STATEFP", "COUNTYFP", "COUNTYNAME"],
+    )
+    states = pd.read_csv(
+        cached_fetch(STATE_LIST_URL, path=RAW / "national_state2020.txt", ttl=TTL_FOREVER),
+        sep="|", dtype=str, usecols=["STATEFP", "STATE_NAME"],
+    )
+    ref = counties.merge(states, on="STATEFP", how="left")
+    ref = pd.DataFrame({
+        "fips": ref["STATEFP"] + ref["COUNTYFP"],
+        "state_fips": ref["STATEFP"],
+        "state_abbr": ref["STATE"],
+        "state": ref["STATE_NAME"],
+        "county": ref["COUNTYNAME"].str.replace(COUNTY_SUFFIXES, "", case=False, regex=True),
+    })
+    ref["county_key"] = county_key(ref["county"])
+    return ref
+
+
+def attach_fips(df: pd.DataFrame, state_col: str, county_col: str, ref: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Add a "fips" column by matching (state name, county name) against the reference.
+
+    Args:
+        df: Source rows with state and county name columns
+        state_col: Column holding the full state name (e.g. "Florida")
+        county_col: Column holding the county name (any common spelling)
+        ref: County reference (default: load_county_reference())
+
+    Returns:
+        df with "fips" added (NA where the name is unknown)
+    """
+    ref = load_county_reference() if ref is None else ref
+    keys = pd.DataFrame({
+        "_state": df[state_col].astype("string").str.strip().str.lower().to_numpy(),
+        "_key": county_key(df[county_col]).to_numpy(),
+    })
+    lookup = pd.DataFrame({
+        "_state": ref["state"].str.lower(),
+        "_key": ref["county_key"],
+        "fips": ref["fips"],
+    }).drop_duplicates(["_state", "_key"])
+    matched = keys.merge(lookup, on=["_state", "_key"], how="left")
+    df = df.drop(columns="fips", errors="ignore").copy()
+    df["fips"] = matched["fips"].to_numpy()
+    return df
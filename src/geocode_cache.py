@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Persistent geocode cache (SQLite) keyed by normalized address.
+School addresses rarely change, so only new or edited addresses need the
+Census geocoder; everything else is answered from data/raw/geocode_cache.sqlite.
+"""
+import pathlib
+import re
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional
+
+BASE = pathlib.Path(__file__).resolve().parents[1]
+RAW = BASE / "data" / "raw"
+DB_PATH = RAW / "geocode_cache.sqlite"
+
+# Unmatched addresses are remembered too, but retried after this long
+NEGATIVE_TTL_DAYS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocodes (
+    address_key   TEXT PRIMARY KEY,
+    match_address TEXT,
+    tract         TEXT,
+    lat           REAL,
+    lon           REAL,
+    vintage       TEXT,
+    geocoded_at   REAL
+)
+"""
+
+
+def normalize_address(street, city, state, zipcode) -> str:
+    """
+    Canonical cache key for an address: upper-case, punctuation stripped,
+    whitespace collapsed, ZIP cut to 5 digits.
+    e.g. ("6135 Arlington Expy.", "Jacksonville", "fl", "32211-1234")
+      -> "6135 ARLINGTON EXPY|JACKSONVILLE|FL|32211"
+    """
+    def clean(value):
+        if value is None or value != value:  # None or NaN
+            return ""
+        value = re.sub(r"[^\w\s]", " ", str(value).upper())
+        return " ".join(value.split())
+
+    digits = re.sub(r"\D", "", "" if zipcode is None or zipcode != zipcode else str(zipcode))
+    return "|".join([clean(street), clean(city), clean(state), digits[:5]])
+
+
+class GeocodeCache:
+    """SQLite-backed address -> tract cache with hit/miss counters."""
+
+    def __init__(self, path: pathlib.Path = DB_PATH, vintage: str = ""):
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.vintage = vintage
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute(SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def lookup_many(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Return {key: entry} for every usable cached key and update hit/miss counts.
+        entry["tract"] is None for addresses known not to match.
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        negative_cutoff = time.time() - NEGATIVE_TTL_DAYS * 86400
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT address_key, match_address, tract, lat, lon, vintage, geocoded_at "
+                f"FROM geocodes WHERE address_key IN ({placeholders})", chunk
+            )
+            for key, match_address, tract, lat, lon, vintage, geocoded_at in rows:
+                if vintage != self.vintage:
+                    continue
+                if tract is None and geocoded_at < negative_cutoff:
+                    continue
+                found[key] = {"match_address": match_address, "tract": tract, "lat": lat, "lon": lon}
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def store(self, key: str, result: Optional[Dict]):
+        """Remember a geocoder result (or a miss, when result is None)."""
+        result = result if result and result.get("tract") else {}
+        self.conn.execute(
+            "INSERT OR REPLACE INTO geocodes VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, result.get("match_address"), result.get("tract"), result.get("lat"),
+             result.get("lon"), self.vintage, time.time()),
+        )
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Shared on-disk HTTP response cache for all fetchers.
+Stores each response body under data/raw with its ETag/Last-Modified headers,
+revalidates with conditional requests and serves 304s straight from disk.
+"""
+import hashlib
+import json
+import math
+import pathlib
+import time
+from typing import Dict, Optional
+
+import requests
+
+import http_client
+
+BASE = pathlib.Path(__file__).resolve().parents[1]
+RAW = BASE / "data" / "raw"
+CACHE_DIR = RAW / "http_cache"
+
+# Per-source TTLs (seconds). Within the TTL the cached body is used without
+# touching the network; after it expires we revalidate with a conditional GET.
+TTL_NONE = 0                 # Always revalidate
+TTL_HOUR = 60 * 60
+TTL_DAY = 24 * TTL_HOUR
+TTL_WEEK = 7 * TTL_DAY
+TTL_FOREVER = math.inf       # Immutable files (e.g. a closed year of EPA data)
+
+
+def cache_path_for(url: str, params: Optional[Dict] = None, suffix: str = ".json") -> pathlib.Path:
+    """Default cache location for a URL + query params."""
+    key = url + "?" + json.dumps(params or {}, sort_keys=True)
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+    return CACHE_DIR / f"{digest}{suffix}"
+
+
+def _meta_path(path: pathlib.Path) -> pathlib.Path:
+    return path.with_name(path.name + ".meta.json")
+
+
+def _read_meta(path: pathlib.Path) -> Dict:
+    meta_path = _meta_path(path)
+    if not meta_path.exists():
+        return {}
+    try:
+        return json.loads(meta_path.read_text())
+    except ValueError:
+        return {}
+
+
+def _write_meta(path: pathlib.Path, meta: Dict):
+    _meta_path(path).write_text(json.dumps(meta, indent=2))
+
+
+def cached_fetch(url: str, params: Optional[Dict] = None, path: Optional[pathlib.Path] = None,
+                 ttl: float = TTL_NONE, timeout: int = 60) -> pathlib.Path:
+    """
+    Download url (with params) into the cache and return the local file path.
+
+    Args:
+        url: Resource URL
+        params: Query parameters (part of the cache key, never written to disk)
+        path: Where to store the body (default: hashed name under data/raw/http_cache)
+        ttl: Seconds a cached body is trusted before revalidating
+        timeout: Request timeout in seconds
+
+    Returns:
+        Path to the cached response body
+    """
+    path = pathlib.Path(path) if path is not None else cache_path_for(url, params)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    meta = _read_meta(path) if path.exists() else {}
+
+    # Fresh enough - no network at all
+    if meta and time.time() - meta.get("fetched_at", 0) < ttl:
+        return path
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        r = http_client.get(url, params=params, headers=headers, timeout=timeout, stream=True)
+        if r.status_code == 304 and path.exists():
+            r.close()
+            meta["fetched_at"] = time.time()
+            _write_meta(path, meta)
+            return path
+        r.raise_for_status()
+
+        # Stream to a temp file, then swap in so readers never see a partial body
+        tmp = path.with_name(path.name + ".part")
+        try:
+            with open(tmp, "wb") as f:
+                for chunk in r.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+            tmp.replace(path)
+        finally:
+            tmp.unlink(missing_ok=True)
+    except requests.RequestException as e:
+        if path.exists():
+            print(f"  Warning: {url} unavailable ({e}); using cached copy")
+            return path
+        raise
+
+    _write_meta(path, {
+        "url": url,
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+    })
+    return path
+
+
+def cached_json(url: str, params: Optional[Dict] = None, path: Optional[pathlib.Path] = None,
+                ttl: float = TTL_NONE, timeout: int = 60):
+    """cached_fetch() + JSON decode."""
+    body = cached_fetch(url, params=params, path=path, ttl=ttl, timeout=timeout)
+    with open(body, "rb") as f:
+        return json.load(f)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for all fetchers.
+One pooled requests.Session (keep-alive per host) with retries and jittered
+exponential backoff, so loops like geocoding reuse connections instead of
+paying a new TCP/TLS handshake per request.
+
+Tunable via environment:
+    HTTP_MAX_RETRIES     (default 3)
+    HTTP_BACKOFF         (default 0.5 seconds, doubled per retry)
+    HTTP_POOL_HOSTS      (default 16 hosts kept in the pool)
+    HTTP_POOL_MAXSIZE    (default 16 connections per host)
+"""
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", 3))
+BACKOFF = float(os.environ.get("HTTP_BACKOFF", 0.5))
+POOL_HOSTS = int(os.environ.get("HTTP_POOL_HOSTS", 16))
+POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", 16))
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+USER_AGENT = "jax-health-scorecard (+https://github.com/scottmadden/jax-health-scorecard)"
+
+_session = None
+_lock = threading.Lock()
+
+
+def _retry_policy(max_retries: int, backoff: float) -> Retry:
+    kwargs = dict(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        # Not POST: a read timeout or 5xx may come after the server acted on it.
+        # urllib3 still retries connect errors for any method (nothing was sent).
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=backoff, **kwargs)
+    except TypeError:
+        # urllib3 < 2 has no jitter support
+        return Retry(**kwargs)
+
+
+def make_session(max_retries: int = MAX_RETRIES, backoff: float = BACKOFF,
+                 pool_hosts: int = POOL_HOSTS, pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """Build a pooled session with retry/backoff mounted for http and https."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_hosts,
+        pool_maxsize=pool_maxsize,
+        max_retries=_retry_policy(max_retries, backoff),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def get_session() -> requests.Session:
+    """Process-wide shared session (created on first use)."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = make_session()
+    return _session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """requests.get() through the shared session."""
+    return get_session().get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """requests.post() through the shared session."""
+    return get_session().post(url, **kwargs)
@@ -5,6 +5,9 @@ Based on FL state averages: 0.79 FTE nurses per school
 Research shows: Lower-resourced schools less likely to have full-time nurses
 """
 
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -44,169 +47,295 @@ COUNTY_NURSE_COVERAGE = {
     },
 }
 
-def assign_nurse_staffing(schools_df):
+NURSE_STATUSES = np.array(['Full-time', 'Part-time', 'None'])
+NURSE_FTE = np.array([1.0, 0.5, 0.0])
+NURSE_PENALTY = np.array([0, 5, 10])
+DEFAULT_COUNTY = 'Duval'
+
+def _numeric_column(schools_df, column, default):
+    if column not in schools_df.columns:
+        return np.full(len(schools_df), default, dtype=float)
+    return pd.to_numeric(schools_df[column], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+
+def nurse_probabilities(schools_df):
+    """
+    (schools x 3) matrix of full-time / part-time / none probabilities from
+    county coverage, need band (readiness_score) and enrollment band.
+    """
+    county = schools_df['county'] if 'county' in schools_df.columns else pd.Series(DEFAULT_COUNTY, index=schools_df.index)
+    score = _numeric_column(schools_df, 'readiness_score', 35)
+    enrollment = _numeric_column(schools_df, 'enrollment', 500)
+    
+    # County baseline (unknown or missing counties use Duval's rates)
+    coverage = pd.DataFrame.from_dict(COUNTY_NURSE_COVERAGE, orient='index')
+    baseline = coverage.reindex(county.where(county.isin(coverage.index), DEFAULT_COUNTY))
+    probs = baseline[['pct_schools_with_fulltime', 'pct_schools_with_parttime',
+                      'pct_schools_no_nurse']].to_numpy(dtype=float, copy=True)
+    
+    # Adjust based on need score (inverse relationship - sad reality)
+    # High need (> 45): less likely full-time, more likely none; NaN scores count as low need
+    high_need = score > 45
+    medium_need = ~high_need & (score > 30)
+    probs[:, 0] *= np.select([high_need, medium_need], [0.6, 0.9], 1.2)
+    probs[:, 2] *= np.select([high_need, medium_need], [1.5, 1.2], 0.5)
+    
+    # Adjust based on school size (no adjustment when enrollment is unknown)
+    large = enrollment > 800
+    small = enrollment < 300
+    probs[:, 0] *= np.select([large, small], [1.3, 0.7], 1.0)
+    probs[:, 2] *= np.select([large, small], [0.5, 1.3], 1.0)
+    
+    # Normalize probabilities
+    return probs / probs.sum(axis=1, keepdims=True)
+
+def school_keys(schools_df):
+    """
+    Stable per-school key for random draws: school_id, else school_name,
+    else row position. IDs read back as numbers (e.g. 120310000001.0) match their string form.
+    """
+    n = len(schools_df)
+    keys = pd.Series(pd.NA, index=schools_df.index, dtype='string')
+    for column in ('school_id', 'school_name'):
+        if column in schools_df.columns:
+            values = schools_df[column].astype('string').str.replace(r'\.0$', '', regex=True)
+            keys = keys.fillna(values)
+    return keys.fillna(pd.Series([f'row:{i}' for i in range(n)], index=schools_df.index, dtype='string'))
+
+def school_uniforms(keys, seed=42):
+    """
+    One uniform [0, 1) draw per school from blake2b("<seed>:<key>").
+    A school's draw depends only on its own key, so it is unchanged when other
+    schools are added, removed or re-sorted, and any subset or shard gives the
+    same values as the full run.
+    """
+    digests = b''.join(hashlib.blake2b(f'{seed}:{key}'.encode(), digest_size=8).digest() for key in keys)
+    # Top 53 bits -> exactly representable double in [0, 1)
+    return (np.frombuffer(digests, dtype='<u8') >> np.uint64(11)) * (1.0 / (1 << 53))
+
+def assign_nurse_staffing(schools_df, seed=42):
     """
     Assign nurse staffing status to schools based on:
     1. County coverage rates
     2. School health score (higher need schools LESS likely to have nurses - disparity)
     3. School size (larger schools more likely to have full-time)
     
+    All probabilities are computed as arrays. Each school's draw comes from a hash
+    of its school_id (see school_uniforms), so assignments are stable when schools
+    are inserted or re-sorted and can be recomputed for just the changed schools.
+    
     Returns: schools_df with new columns:
     - nurse_status: 'Full-time', 'Part-time', 'None'
     - nurse_fte: 1.0, 0.5, 0.0
     - nurse_penalty: 0, 5, 10 (points added to need score)
     """
+    probs = nurse_probabilities(schools_df)
     
-    np.random.seed(42)  # Reproducible assignments
-    
-    nurse_assignments = []
-    
-    for idx, row in schools_df.iterrows():
-        county = row.get('county', 'Duval')
-        score = row.get('readiness_score', 35)
-        enrollment = row.get('enrollment', 500)
-        
-        # Get county baseline
-        coverage = COUNTY_NURSE_COVERAGE.get(county, COUNTY_NURSE_COVERAGE['Duval'])
-        
-        # Adjust probabilities based on school characteristics
-        # Higher-need schools are LESS likely to have nurses (resource disparity)
-        # Larger schools are MORE likely to have full-time nurses
-        
-        prob_fulltime = coverage['pct_schools_with_fulltime']
-        prob_parttime = coverage['pct_schools_with_parttime']
-        prob_none = coverage['pct_schools_no_nurse']
-        
-        # Adjust based on need score (inverse relationship - sad reality)
-        if score > 45:  # High need
-            prob_fulltime *= 0.6  # Less likely to have full-time
-            prob_none *= 1.5      # More likely to have no nurse
-        elif score > 30:  # Medium need
-            prob_fulltime *= 0.9
-            prob_none *= 1.2
-        else:  # Low need
-            prob_fulltime *= 1.2  # More likely to have full-time
-            prob_none *= 0.5
-        
-        # Adjust based on school size
-        if pd.notna(enrollment):
-            if enrollment > 800:  # Large school
-                prob_fulltime *= 1.3
-                prob_none *= 0.5
-            elif enrollment < 300:  # Small school
-                prob_fulltime *= 0.7
-                prob_none *= 1.3
-        
-        # Normalize probabilities
-        total = prob_fulltime + prob_parttime + prob_none
-        prob_fulltime /= total
-        prob_parttime /= total
-        prob_none /= total
-        
-        # Assign status
-        rand = np.random.random()
-        if rand < prob_fulltime:
-            status = 'Full-time'
-            fte = 1.0
-            penalty = 0
-        elif rand < prob_fulltime + prob_parttime:
-            status = 'Part-time'
-            fte = 0.5
-            penalty = 5
-        else:
-            status = 'None'
-            fte = 0.0
-            penalty = 10
-        
-        nurse_assignments.append({
-            'nurse_status': status,
-            'nurse_fte': fte,
-            'nurse_penalty': penalty
-        })
-    
-    # Add to dataframe
-    nurse_df = pd.DataFrame(nurse_assignments)
-    schools_df = pd.concat([schools_df.reset_index(drop=True), nurse_df], axis=1)
+    # Reproducible assignments: one hash-derived uniform draw per school
+    rand = school_uniforms(school_keys(schools_df), seed)
+    choice = (rand >= probs[:, 0]).astype(int) + (rand >= probs[:, 0] + probs[:, 1])
+    
+    schools_df = schools_df.reset_index(drop=True)
+    schools_df['nurse_status'] = NURSE_STATUSES[choice]
+    schools_df['nurse_fte'] = NURSE_FTE[choice]
+    schools_df['nurse_penalty'] = NURSE_PENALTY[choice]
     
     # Calculate adjusted score (unmet need)
     schools_df['unmet_need_score'] = schools_df['readiness_score'] + schools_df['nurse_penalty']
     
     return schools_df
 
+# Cost to close gaps: hire a full-time nurse ($80K), upgrade part-time to full-time ($40K)
+FULLTIME_NURSE_COST = 80000
+PARTTIME_UPGRADE_COST = 40000
+
+def recommendation(nurse_status, score, chronic, hpsa):
+    """Nurse-aware recommendation for one school."""
+    if nurse_status == 'None':
+        if score >= 45:
+            return f"<strong>URGENT:</strong> Place full-time nurse ($80K/year). High chronic disease ({chronic:.1f}%) + doctor shortage ({hpsa:.0f}) + NO nurse = daily health crises without intervention."
+        elif score >= 30:
+            return f"<strong>Priority:</strong> Place full-time nurse ($80K/year). Moderate health needs require daily monitoring currently unavailable."
+        else:
+            return f"<strong>Action:</strong> Place part-time nurse ($40K/year). Even low-need schools benefit from on-site health support."
+    elif nurse_status == 'Part-time':
+        if score >= 45:
+            return f"<strong>Upgrade:</strong> Expand to full-time nurse (+$40K/year). High needs exceed part-time capacity."
+        else:
+            return f"<strong>Consider:</strong> Upgrade to full-time nurse (+$40K/year) or maintain current part-time coverage."
+    else:  # Full-time
+        return f"<strong>Maintain:</strong> Full-time nurse coverage in place. Continue current wellness programs."
+
+SUMMARY_COLUMNS = [
+    'county', 'total_schools', 'fulltime_nurses', 'parttime_nurses', 'no_nurse',
+    'pct_with_nurse', 'nurses_per_1000_students', 'high_need_no_nurse', 'estimated_cost_to_fill',
+]
+
+def summarize_nurse_coverage(schools_df):
+    """
+    County and statewide nurse coverage in one grouped pass.
+    Every per-school condition becomes a 0/1 column, a single groupby sums them
+    per county, and the statewide totals are the column sums of that small table.
+    
+    Returns: (county summary DataFrame, statewide totals Series)
+    """
+    status = schools_df['nurse_status']
+    no_nurse = status == 'None'
+    high_need = schools_df['readiness_score'] >= 45
+    dual_burden = (schools_df['dual_burden'] == True) if 'dual_burden' in schools_df.columns else False
+    
+    counts = pd.DataFrame({
+        'county': schools_df['county'],
+        'total_schools': 1,
+        'fulltime_nurses': status == 'Full-time',
+        'parttime_nurses': status == 'Part-time',
+        'no_nurse': no_nurse,
+        'high_need_no_nurse': high_need & no_nurse,
+        'dual_burden_no_nurse': dual_burden & no_nurse,
+        'total_enrollment': schools_df.get('enrollment', 0),
+        'total_nurse_fte': schools_df['nurse_fte'],
+    }).groupby('county', sort=False, dropna=False).sum()
+    
+    totals = counts.sum()
+    for table in (counts, totals):
+        table['estimated_cost_to_fill'] = (table['no_nurse'] * FULLTIME_NURSE_COST
+                                           + table['parttime_nurses'] * PARTTIME_UPGRADE_COST)
+    
+    enrollment = counts['total_enrollment'].to_numpy(dtype=float)
+    per_1000 = np.divide(counts['total_nurse_fte'].to_numpy(dtype=float) * 1000, enrollment,
+                         out=np.zeros(len(counts)), where=enrollment > 0)
+    counts['nurses_per_1000_students'] = per_1000.round(2)
+    counts['pct_with_nurse'] = ((counts['fulltime_nurses'] + counts['parttime_nurses'])
+                                / counts['total_schools'] * 100).round(1)
+    
+    return counts.reset_index()[SUMMARY_COLUMNS], totals
+
 def get_county_nurse_summary(schools_df):
     """
     Generate county-level nurse coverage summary
     """
-    summary = []
-    
-    for county in schools_df['county'].unique():
-        county_schools = schools_df[schools_df['county'] == county]
-        
-        total_schools = len(county_schools)
-        fulltime = len(county_schools[county_schools['nurse_status'] == 'Full-time'])
-        parttime = len(county_schools[county_schools['nurse_status'] == 'Part-time'])
-        no_nurse = len(county_schools[county_schools['nurse_status'] == 'None'])
-        
-        total_enrollment = county_schools['enrollment'].sum()
-        total_nurse_fte = county_schools['nurse_fte'].sum()
-        
-        nurses_per_1000 = (total_nurse_fte / total_enrollment * 1000) if total_enrollment > 0 else 0
-        
-        # High need schools without nurses
-        high_need_no_nurse = len(county_schools[
-            (county_schools['readiness_score'] >= 45) & 
-            (county_schools['nurse_status'] == 'None')
-        ])
-        
-        summary.append({
-            'county': county,
-            'total_schools': total_schools,
-            'fulltime_nurses': fulltime,
-            'parttime_nurses': parttime,
-            'no_nurse': no_nurse,
-            'pct_with_nurse': round((fulltime + parttime) / total_schools * 100, 1),
-            'nurses_per_1000_students': round(nurses_per_1000, 2),
-            'high_need_no_nurse': high_need_no_nurse,
-            'estimated_cost_to_fill': no_nurse * 80000 + parttime * 40000  # Full-time = $80K, upgrade part-time = $40K
-        })
-    
-    return pd.DataFrame(summary)
+    summary, _ = summarize_nurse_coverage(schools_df)
+    return summary
 
 def generate_nurse_insights(schools_df):
     """
     Generate key insights about nurse coverage for dashboard
     """
-    total = len(schools_df)
-    no_nurse = len(schools_df[schools_df['nurse_status'] == 'None'])
-    parttime = len(schools_df[schools_df['nurse_status'] == 'Part-time'])
-    
-    # High need schools
-    high_need = schools_df[schools_df['readiness_score'] >= 45]
-    high_need_no_nurse = len(high_need[high_need['nurse_status'] == 'None'])
-    
-    # Dual burden schools (if column exists)
-    if 'dual_burden' in schools_df.columns:
-        dual_burden = schools_df[schools_df['dual_burden'] == True]
-        dual_burden_no_nurse = len(dual_burden[dual_burden['nurse_status'] == 'None'])
-    else:
-        dual_burden_no_nurse = 0
-    
-    # Cost calculation
-    total_cost_to_fill = (no_nurse * 80000) + (parttime * 40000)
+    _, totals = summarize_nurse_coverage(schools_df)
+    total = int(totals['total_schools'])
+    no_nurse = int(totals['no_nurse'])
+    high_need_no_nurse = int(totals['high_need_no_nurse'])
     
     insights = {
         'total_schools': total,
         'schools_no_nurse': no_nurse,
-        'schools_parttime': parttime,
+        'schools_parttime': int(totals['parttime_nurses']),
         'pct_no_nurse': round(no_nurse / total * 100, 1),
         'high_need_no_nurse': high_need_no_nurse,
-        'dual_burden_no_nurse': dual_burden_no_nurse,
-        'cost_to_fill_gaps': total_cost_to_fill,
+        'dual_burden_no_nurse': int(totals['dual_burden_no_nurse']),
+        'cost_to_fill_gaps': int(totals['estimated_cost_to_fill']),
         'priority_placements': high_need_no_nurse,
     }
     
     return insights
 
+# Monte Carlo: draws per task, and the work size (draws x schools) below which
+# a process pool costs more than it saves
+SIMULATION_CHUNK = 500
+SIMULATION_POOL_MIN_WORK = 5_000_000
+SIMULATION_COUNTS = [
+    'fulltime_nurses', 'parttime_nurses', 'no_nurse', 'high_need_no_nurse',
+    'dual_burden_no_nurse', 'estimated_cost_to_fill',
+]
+# Counts plus the rates derived from them (per county and statewide, per draw)
+SIMULATION_METRICS = SIMULATION_COUNTS + ['pct_with_nurse', 'pct_no_nurse', 'nurses_per_1000_students']
+
+def _simulate_chunk(cum_probs, groups, n_groups, high_need, dual_burden, seed_seq, draws):
+    """
+    `draws` independent staffing draws for every school.
+    Returns a (draws x groups x counts) array in SIMULATION_COUNTS order.
+    """
+    rng = np.random.default_rng(seed_seq)
+    u = rng.random((draws, len(groups)))
+    # 0 = full-time, 1 = part-time, 2 = none
+    choice = (u >= cum_probs[:, 0]).astype(np.int64) + (u >= cum_probs[:, 1])
+    
+    cell = np.arange(draws)[:, None] * n_groups + groups  # (draw, county) bucket per school
+    status = np.bincount((cell * 3 + choice).ravel(), minlength=draws * n_groups * 3)
+    status = status.reshape(draws, n_groups, 3)
+    no_nurse = choice == 2
+    out = np.empty((draws, n_groups, len(SIMULATION_COUNTS)))
+    out[..., :3] = status
+    out[..., 3] = np.bincount(cell.ravel(), weights=(no_nurse & high_need).ravel(),
+                              minlength=draws * n_groups).reshape(draws, n_groups)
+    out[..., 4] = np.bincount(cell.ravel(), weights=(no_nurse & dual_burden).ravel(),
+                              minlength=draws * n_groups).reshape(draws, n_groups)
+    out[..., 5] = status[..., 2] * FULLTIME_NURSE_COST + status[..., 1] * PARTTIME_UPGRADE_COST
+    return out
+
+def simulate_nurse_staffing(schools_df, draws=10_000, seed=42, max_workers=None):
+    """
+    Monte Carlo over the nurse staffing model.
+    Draws are split into fixed-size chunks, each with its own RNG stream from
+    SeedSequence(seed).spawn(), so results are identical however many workers
+    run them. Large runs use a process pool; small ones stay in-process.
+    
+    Returns: {metric: DataFrame of draws x (counties..., 'Statewide')}
+    """
+    probs = nurse_probabilities(schools_df)
+    cum_probs = np.column_stack([probs[:, 0], probs[:, 0] + probs[:, 1]])
+    codes, counties = pd.factorize(schools_df['county'], use_na_sentinel=False)
+    high_need = (schools_df['readiness_score'] >= 45).to_numpy()
+    dual_burden = ((schools_df['dual_burden'] == True).to_numpy()
+                   if 'dual_burden' in schools_df.columns else np.zeros(len(schools_df), dtype=bool))
+    
+    sizes = [min(SIMULATION_CHUNK, draws - start) for start in range(0, draws, SIMULATION_CHUNK)]
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(cum_probs, codes, len(counties), high_need, dual_burden, stream, size)
+            for stream, size in zip(streams, sizes)]
+    
+    if draws * len(schools_df) >= SIMULATION_POOL_MIN_WORK and len(args) > 1:
+        workers = min(max_workers or os.cpu_count() or 1, len(args))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_simulate_chunk, *zip(*args)))
+    else:
+        parts = [_simulate_chunk(*a) for a in args]
+    
+    results = np.concatenate(parts)  # draws x counties x counts
+    columns = list(counties) + ['Statewide']
+    results = np.concatenate([results, results.sum(axis=1, keepdims=True)], axis=1)
+    
+    # Rates from the simulated counts; school totals and enrollment are fixed
+    schools_per = np.bincount(codes, minlength=len(counties)).astype(float)
+    enrollment = np.nan_to_num(_numeric_column(schools_df, 'enrollment', 0))
+    enrollment_per = np.bincount(codes, weights=enrollment, minlength=len(counties))
+    schools_per = np.append(schools_per, schools_per.sum())
+    enrollment_per = np.append(enrollment_per, enrollment_per.sum())
+    fte = results[..., 0] * NURSE_FTE[0] + results[..., 1] * NURSE_FTE[1]
+    rates = np.stack([
+        (results[..., 0] + results[..., 1]) / schools_per * 100,
+        results[..., 2] / schools_per * 100,
+        np.divide(fte * 1000, enrollment_per, out=np.zeros_like(fte), where=enrollment_per > 0),
+    ], axis=-1)
+    results = np.concatenate([results, rates], axis=-1)
+    return {metric: pd.DataFrame(results[..., i], columns=columns)
+            for i, metric in enumerate(SIMULATION_METRICS)}
+
+def summarize_simulation(simulated, ci=0.95):
+    """
+    Mean and central `ci` interval of every simulated metric.
+    Returns: long DataFrame with county, metric, mean, ci_low, ci_high
+    """
+    tail = (1 - ci) / 2 * 100
+    rows = []
+    for metric, draws in simulated.items():
+        values = draws.to_numpy()
+        low, high = np.percentile(values, [tail, 100 - tail], axis=0)
+        rows.append(pd.DataFrame({
+            'county': draws.columns, 'metric': metric,
+            'mean': values.mean(axis=0), 'ci_low': low, 'ci_high': high,
+        }))
+    return pd.concat(rows, ignore_index=True)
+
 if __name__ == "__main__":
     # Test with school data
     BASE = Path(__file__).resolve().parents[1]
@@ -242,6 +371,10 @@ if __name__ == "__main__":
     for key, value in insights.items():
         print(f"{key}: {value}")
     
+    print("\n=== UNCERTAINTY (10,000 simulated draws, 95% interval) ===")
+    ci = summarize_simulation(simulate_nurse_staffing(schools_df, draws=10_000))
+    print(ci.to_string(index=False, float_format=lambda v: f"{v:,.1f}"))
+    
     # Save updated data
     schools_df.to_csv(DATA / "school_scorecard_with_nurses.csv", index=False)
     print(f"\n✅ Saved to {DATA / 'school_scorecard_with_nurses.csv'}")
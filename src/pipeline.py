@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
-import csv, io, zipfile, pathlib, requests, pandas as pd, os
+import csv, zipfile, pathlib, pandas as pd, os, time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import arrow_io
+import counties
+import render
+import scoring
+from http_cache import cached_fetch, cached_json, TTL_HOUR, TTL_DAY, TTL_WEEK, TTL_FOREVER
 
 # -----------------------------
 # Config
@@ -22,33 +28,86 @@ COUNTIES = [
     ("12003", "Florida", "Baker"),
 ]
 STATE_ABBR = "FL"
+STATE_NAME = "Florida"
+STATE_FIPS = "12"
+
+# Which counties to score: "metro" (COUNTIES above), "state" (every county in
+# STATE_ABBR) or "national" (every US county). All scopes use the same national
+# downloads and join on FIPS.
+SCOPES = ("metro", "state", "national")
+SCOPE = os.environ.get("SCORECARD_SCOPE", "metro")
+
+# Only the EPA annual AQI columns we use, with explicit dtypes
+AQI_DTYPES = {
+    "State": "string",
+    "County": "string",
+    "Year": "Int64",
+    "Unhealthy Days": "float64",
+    "Very Unhealthy Days": "float64",
+    "Hazardous Days": "float64",
+}
+
+def _scope(scope=None):
+    scope = scope or SCOPE
+    if scope not in SCOPES:
+        raise ValueError(f"Unknown scope {scope!r}; expected one of {SCOPES}")
+    return scope
+
+def target_counties(scope=None):
+    """Counties scored in a scope, as fips/state/county rows."""
+    scope = _scope(scope)
+    if scope == "metro":
+        return pd.DataFrame(COUNTIES, columns=["fips", "state", "county"])
+    ref = counties.load_county_reference()
+    if scope == "state":
+        ref = ref[ref["state_fips"] == STATE_FIPS]
+    return ref[["fips", "state", "county"]].reset_index(drop=True)
+
+def _county_reference(scope):
+    """Name -> FIPS lookup table: just COUNTIES for metro (no download), else Census."""
+    if scope == "metro":
+        ref = pd.DataFrame(COUNTIES, columns=["fips", "state", "county"])
+        ref["county_key"] = counties.county_key(ref["county"])
+        return ref
+    return counties.load_county_reference()
+
+def _scope_tag(scope):
+    """File-name tag for per-scope cached subsets."""
+    return "US" if scope == "national" else STATE_ABBR
 
 # -----------------------------
 # Data fetch helpers
 # -----------------------------
 
-def fetch_epa_aqi_annual(year=2023):
+def fetch_epa_aqi_annual(year=2023, scope=None):
     """
     EPA AirData: Annual AQI by county (counts of days by AQI category). No API key.
     https://aqs.epa.gov/aqsweb/airdata/annual_aqi_by_county_YYYY.zip
     Note: Using 2023 as most recent complete year with full data.
+    Closed years never change, so their zip is cached indefinitely.
+    County names are matched to FIPS through the Census county reference.
     """
+    scope = _scope(scope)
     url = f"https://aqs.epa.gov/aqsweb/airdata/annual_aqi_by_county_{year}.zip"
     zpath = RAW / f"annual_aqi_by_county_{year}.zip"
-    csv_path = RAW / f"annual_aqi_by_county_{year}.csv"
+    subset_path = RAW / f"annual_aqi_by_county_{year}_{_scope_tag(scope)}.csv.gz"
 
-    r = requests.get(url, timeout=60)
-    r.raise_for_status()
-    zpath.write_bytes(r.content)
-    with zipfile.ZipFile(io.BytesIO(r.content)) as zf:
-        # The CSV inside is named annual_aqi_by_county_YYYY.csv
-        inner = [n for n in zf.namelist() if n.endswith(".csv")][0]
-        csv_bytes = zf.read(inner)
-        csv_path.write_bytes(csv_bytes)
+    ttl = TTL_FOREVER if year <= datetime.utcnow().year - 2 else TTL_DAY
+    cached_fetch(url, path=zpath, ttl=ttl)
 
-    df = pd.read_csv(csv_path)
-    # Keep Florida only
-    df_fl = df[df["State"] == "Florida"].copy()
+    if subset_path.exists() and subset_path.stat().st_mtime >= zpath.stat().st_mtime:
+        # Zip unchanged since we last filtered it
+        df_fl = pd.read_csv(subset_path, dtype=AQI_DTYPES)
+    else:
+        # Stream the CSV member straight out of the archive, keeping only the
+        # needed columns and only our state's rows (all rows nationally) from each block
+        where = None if scope == "national" else {"State": [STATE_NAME]}
+        with zipfile.ZipFile(zpath) as zf:
+            # The CSV inside is named annual_aqi_by_county_YYYY.csv
+            inner = [n for n in zf.namelist() if n.endswith(".csv")][0]
+            df_fl = arrow_io.read_csv_filtered(lambda: zf.open(inner), columns=AQI_DTYPES,
+                                               where=where, dtypes=AQI_DTYPES)
+        df_fl.to_csv(subset_path, index=False, compression="gzip")
 
     # Derive "unhealthy_or_worse_days"
     # Columns: Good Days, Moderate Days, Unhealthy for Sensitive Groups Days, Unhealthy Days, Very Unhealthy Days, Hazardous Days
@@ -57,122 +116,163 @@ def fetch_epa_aqi_annual(year=2023):
     hz = "Hazardous Days"
     df_fl["unhealthy_or_worse_days"] = df_fl[u].fillna(0) + df_fl[vu].fillna(0) + df_fl[hz].fillna(0)
 
-    # Map county names to FIPS codes
-    fips_map = {cname.lower(): fips for (fips, st, cname) in COUNTIES}
-    df_fl["fips"] = df_fl["County"].str.lower().map(fips_map)
+    # Map (state, county) names to FIPS codes
+    df_fl = counties.attach_fips(df_fl, "State", "County", ref=_county_reference(scope))
     
     # Only keep our target counties
-    df_fl = df_fl[df_fl["fips"].notna()].copy()
+    df_fl = df_fl[df_fl["fips"].isin(target_counties(scope)["fips"])].copy()
 
     keep = df_fl[["fips", "State", "County", "unhealthy_or_worse_days", "Year"]].rename(
         columns={"State":"state","County":"county","Year":"year"}
     )
     return keep
 
-def fetch_hrsa_hpsa_dashboard():
+def _hpsa_column(name):
+    """Normalize an HPSA dashboard header (e.g. 'HPSA Score' -> 'hpsa_score')."""
+    return name.strip().lower().replace(" ", "_")
+
+HPSA_COLUMNS = {"state", "discipline", "county", "hpsa_score"}
+
+def fetch_hrsa_hpsa_dashboard(state=STATE_NAME, chunksize=100_000, scope=None):
     """
     HRSA HPSA Dashboard CSV (public, no key).
     https://data.hrsa.gov/DataDownload/DD_Files/HPSA_DASHBOARD.csv
     We'll compute a simple county-level signal: max Primary Care HPSA score in county.
+    The national file is read in chunks with only the four needed columns, so peak
+    memory stays bounded; the reduced per-county table is cached until the file changes.
+    In national scope every state is kept.
     """
+    scope = _scope(scope)
+    if scope == "national":
+        state = None
     url = "https://data.hrsa.gov/DataDownload/DD_Files/HPSA_DASHBOARD.csv"
-    path = RAW / "HPSA_DASHBOARD.csv"
-    r = requests.get(url, timeout=60)
-    r.raise_for_status()
-    path.write_bytes(r.content)
-    df = pd.read_csv(path, dtype=str, quoting=csv.QUOTE_MINIMAL)
-    # Normalize columns
-    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
-    # Keep Florida + primary care
-    df = df[(df["state"] == "Florida") & (df["discipline"].str.contains("Primary Care", na=False, case=False))]
-    # HPSA_Score is numeric; higher = greater shortage
-    df["hpsa_score"] = pd.to_numeric(df["hpsa_score"], errors="coerce")
-    # Some rows are facility/population-based; aggregate to county max
-    g = df.groupby("county", as_index=False)["hpsa_score"].max().rename(columns={"hpsa_score":"hpsa_primary_care_max"})
+    path = cached_fetch(url, path=RAW / "HPSA_DASHBOARD.csv", ttl=TTL_DAY)
+    tag = state.lower().replace(' ', '_') if state else "us"
+    reduced_path = RAW / f"hpsa_primary_care_by_county_{tag}.csv"
+
+    if reduced_path.exists() and reduced_path.stat().st_mtime >= path.stat().st_mtime:
+        g = pd.read_csv(reduced_path, dtype={"state": str, "county": str})
+    else:
+        g = None
+        reader = pd.read_csv(path, dtype=str, quoting=csv.QUOTE_MINIMAL, chunksize=chunksize,
+                             usecols=lambda c: _hpsa_column(c) in HPSA_COLUMNS)
+        for chunk in reader:
+            # Normalize columns
+            chunk.columns = [_hpsa_column(c) for c in chunk.columns]
+            # Keep our state (if any) + primary care
+            keep = chunk["discipline"].str.contains("Primary Care", na=False, case=False)
+            if state:
+                keep &= chunk["state"] == state
+            chunk = chunk[keep]
+            if chunk.empty:
+                continue
+            # HPSA_Score is numeric; higher = greater shortage
+            scores = pd.to_numeric(chunk["hpsa_score"], errors="coerce")
+            # Some rows are facility/population-based; fold into the running county max
+            part = scores.groupby([chunk["state"], chunk["county"]]).max()
+            g = part if g is None else pd.concat([g, part]).groupby(level=[0, 1]).max()
+        if g is None:
+            g = pd.Series(dtype=float, index=pd.MultiIndex.from_tuples([], names=["state", "county"]))
+        g = g.rename_axis(["state", "county"]).reset_index(name="hpsa_primary_care_max")
+        g.to_csv(reduced_path, index=False)
+
     # We also add a binary flag
     g["hpsa_primary_care_flag"] = (g["hpsa_primary_care_max"].fillna(0) > 0).astype(int)
-    # Attach FIPS from our target list (simple map)
-    fips_map = {cname.lower(): fips for (fips, st, cname) in COUNTIES}
-    g["fips"] = g["county"].str.lower().map(fips_map)
-    return g
+    # Attach FIPS by (state, county) name
+    return counties.attach_fips(g, "state", "county", ref=_county_reference(scope))
+
+PLACES_MEASURES = ["DIABETES", "OBESITY", "CASTHMA"]
+
+def _soql_in(values):
+    """Render a SoQL IN (...) list of string literals."""
+    return ", ".join(f"'{v}'" for v in values)
 
-def fetch_cdc_places_county():
+def fetch_cdc_places_county(page_size=1000, scope=None):
     """
     CDC PLACES: County-level chronic disease & risk factor prevalence.
     https://data.cdc.gov/resource/duw2-7jbt.json (2024 dataset)
     We fetch: diabetes, obesity, and current asthma prevalence for Florida counties.
+    Filtering and averaging run server-side, so only one row per county comes back;
+    pages are followed with $offset so nothing is silently truncated.
+    Statewide / national scopes drop the county (and state) filter.
     """
+    scope = _scope(scope)
     # Using Socrata Open Data API (2024 PLACES release)
     base_url = "https://data.cdc.gov/resource/duw2-7jbt.json"
+    fips_list = [c[0] for c in COUNTIES]
     
-    # Fetch for all FL counties
+    # Counties are keyed by locationid (5-digit FIPS) in the county dataset
+    where = [
+        "data_value_type='Crude prevalence'",
+        f"measureid IN ({_soql_in(PLACES_MEASURES)})",
+    ]
+    if scope != "national":
+        where.insert(0, f"stateabbr='{STATE_ABBR}'")
+    if scope == "metro":
+        where.append(f"locationid IN ({_soql_in(fips_list)})")
     params = {
-        "$where": "stateabbr='FL' AND data_value_type='Crude prevalence'",
-        "$limit": 1000
+        "$select": "locationid, avg(data_value) AS chronic_disease_prev",
+        "$where": " AND ".join(where),
+        "$group": "locationid",
+        "$order": "locationid",
+        "$limit": page_size,
     }
     
-    r = requests.get(base_url, params=params, timeout=60)
-    r.raise_for_status()
-    data = r.json()
+    data = []
+    offset = 0
+    while True:
+        page = cached_json(base_url, params={**params, "$offset": offset}, ttl=TTL_DAY)
+        data.extend(page)
+        if len(page) < page_size:
+            break
+        offset += page_size
     
     if not data:
         # Fallback: return target counties with zero values
-        return pd.DataFrame([{"fips": c[0], "chronic_disease_prev": 0.0} for c in COUNTIES])
-    
-    df = pd.DataFrame(data)
-    
-    # Normalize column names
-    df.columns = [c.lower() for c in df.columns]
-    
-    # Filter for key indicators: DIABETES, OBESITY, CASTHMA
-    df = df[df["measureid"].isin(["DIABETES", "OBESITY", "CASTHMA"])].copy()
+        return target_counties(scope)[["fips"]].assign(chronic_disease_prev=0.0)
     
-    if df.empty:
-        return pd.DataFrame([{"fips": c[0], "chronic_disease_prev": 0.0} for c in COUNTIES])
+    g = pd.DataFrame(data)
+    g["fips"] = g["locationid"].astype(str).str.zfill(5)
+    g["chronic_disease_prev"] = pd.to_numeric(g["chronic_disease_prev"], errors="coerce")
     
-    # Extract FIPS and data value
-    df["fips"] = df["locationid"].astype(str).str.zfill(5) if "locationid" in df.columns else df["countyfips"].astype(str).str.zfill(5)
-    df["data_value"] = pd.to_numeric(df["data_value"], errors="coerce")
-    
-    # Average the indicators by county
-    g = df.groupby("fips", as_index=False)["data_value"].mean()
-    g.rename(columns={"data_value": "chronic_disease_prev"}, inplace=True)
-    
-    # Only keep our target counties
-    g = g[g["fips"].isin([c[0] for c in COUNTIES])].copy()
-    
-    # If empty, return zeros for target counties
-    if g.empty:
-        return pd.DataFrame([{"fips": c[0], "chronic_disease_prev": 0.0} for c in COUNTIES])
-    
-    return g
+    return g[["fips", "chronic_disease_prev"]]
 
-def fetch_fema_nri():
+def fetch_fema_nri(scope=None, page_size=2000):
     """
     FEMA National Risk Index: County-level hazard risk scores.
     https://hazards.fema.gov/nri/data-resources
     Using ArcGIS REST API (public, no key).
+    Pages with resultOffset while the server reports exceededTransferLimit,
+    which matters for the national (~3,100 county) query.
     """
+    scope = _scope(scope)
     # FEMA NRI via ArcGIS REST API
     url = "https://services.arcgis.com/VTyQ9soqVukalItT/arcgis/rest/services/NRI_Table_Counties/FeatureServer/0/query"
     
-    # Query for Florida counties (state FIPS = 12)
+    # Query for Florida counties (state FIPS = 12), or every county nationally
     params = {
-        "where": "STATEFIPS='12'",
+        "where": "1=1" if scope == "national" else f"STATEFIPS='{STATE_FIPS}'",
         "outFields": "STCOFIPS,RISK_SCORE,RISK_RATNG",
+        "orderByFields": "STCOFIPS",
+        "resultRecordCount": page_size,
         "f": "json"
     }
     
-    r = requests.get(url, params=params, timeout=60)
-    r.raise_for_status()
-    data = r.json()
-    
-    if "features" not in data or len(data["features"]) == 0:
+    records = []
+    offset = 0
+    while True:
+        data = cached_json(url, params={**params, "resultOffset": offset}, ttl=TTL_WEEK)
+        features = data.get("features") or []
+        records.extend(f["attributes"] for f in features)
+        if not features or not data.get("exceededTransferLimit"):
+            break
+        offset += len(features)
+    
+    if not records:
         # Fallback: return empty with target counties at 0 risk
-        return pd.DataFrame([{"fips": c[0], "risk_score": 0.0, "risk_rating": "Not Rated"} for c in COUNTIES])
+        return target_counties(scope)[["fips"]].assign(risk_score=0.0, risk_rating="Not Rated")
     
     # Extract attributes
-    records = [f["attributes"] for f in data["features"]]
     df = pd.DataFrame(records)
     
     # Normalize columns
@@ -181,78 +281,110 @@ def fetch_fema_nri():
     df["risk_score"] = pd.to_numeric(df["RISK_SCORE"], errors="coerce")
     
     # Only keep our target counties
-    keep = df[df["fips"].isin([c[0] for c in COUNTIES])].copy()
+    keep = df[df["fips"].isin(target_counties(scope)["fips"])].copy()
     
     return keep[["fips", "risk_score", "RISK_RATNG"]].rename(columns={"RISK_RATNG": "risk_rating"})
 
-def fetch_cdc_respiratory_virus():
+RESPIRATORY_DEFAULT = {
+    "respiratory_activity_level": scoring.RESPIRATORY_DEFAULT_LEVEL,
+    "respiratory_score": scoring.RESPIRATORY_DEFAULT_SCORE,
+}
+
+def fetch_cdc_respiratory_virus(scope=None):
     """
-    CDC Respiratory Virus Surveillance: State-level activity for Florida.
+    CDC Respiratory Virus Surveillance: State-level activity.
     https://data.cdc.gov - Weekly respiratory virus activity levels
     Phase 3: Real-time health signal (influenza, COVID-19, RSV)
+    Returns one row per state (state, respiratory_activity_level, respiratory_score):
+    Florida only, or the latest week for every state in national scope.
     """
+    scope = _scope(scope)
+    states = target_counties(scope)["state"].unique()
+    fallback = pd.DataFrame({"state": states, **RESPIRATORY_DEFAULT})
+
     # Try CDC FluView API for influenza-like illness (ILI) activity
     # This is a proxy for respiratory virus activity
     url = "https://data.cdc.gov/resource/ucfv-xp52.json"
     
-    # Get most recent week for Florida
-    params = {
-        "$where": "state='Florida'",
-        "$order": "week DESC",
-        "$limit": 1
-    }
+    # Get most recent week for Florida (or the latest weeks for all states)
+    if scope == "national":
+        params = {"$order": "week DESC", "$limit": 5000}
+    else:
+        params = {
+            "$where": f"state='{STATE_NAME}'",
+            "$order": "week DESC",
+            "$limit": 1
+        }
     
     try:
-        r = requests.get(url, params=params, timeout=30)
-        r.raise_for_status()
-        data = r.json()
+        data = cached_json(url, params=params, ttl=TTL_HOUR, timeout=30)
         
         if not data:
             # Fallback: return minimal activity
-            return {"respiratory_activity_level": "Minimal", "respiratory_score": 2.0}
+            return fallback
         
-        # Extract activity level (1-10 scale typical for ILI)
-        record = data[0]
+        # Rows are newest first: keep each state's most recent week
+        df = pd.DataFrame(data)
+        if "state" not in df.columns:
+            df["state"] = STATE_NAME
+        df = df.drop_duplicates("state")
         
         # ILI activity level: convert to 0-10 scale
-        # Look for activity_level or num_ili or similar fields
-        activity_level = None
-        activity_name = "Minimal"
-        
         # Common field names in CDC respiratory data
-        for field in ["activity_level", "activity_level_label", "ili_level"]:
-            if field in record:
-                activity_name = str(record[field])
-                break
+        field = next((f for f in ["activity_level", "activity_level_label", "ili_level"] if f in df.columns), None)
+        levels = df[field].astype(str) if field else pd.Series("Minimal", index=df.index)
         
         # Map activity level names to numeric scores (0-10)
-        level_map = {
-            "minimal": 2.0,
-            "low": 3.5,
-            "moderate": 5.5,
-            "high": 7.5,
-            "very high": 9.0
-        }
+        df["respiratory_activity_level"] = levels
+        df["respiratory_score"] = scoring.respiratory_score(levels)
         
-        activity_score = level_map.get(activity_name.lower(), 2.0)
-        
-        return {
-            "respiratory_activity_level": activity_name,
-            "respiratory_score": activity_score
-        }
+        out = fallback[["state"]].merge(
+            df[["state", "respiratory_activity_level", "respiratory_score"]], on="state", how="left"
+        )
+        return out.fillna(RESPIRATORY_DEFAULT)
         
     except Exception as e:
         print(f"  Warning: Could not fetch respiratory virus data: {e}")
         # Fallback: assume minimal activity
-        return {"respiratory_activity_level": "Minimal", "respiratory_score": 2.0}
+        return fallback
+
+# AirNow: major city zipcodes as proxies for counties
+AIRNOW_COUNTY_ZIPS = {
+    "12031": "32202",  # Duval (Jacksonville)
+    "12019": "32003",  # Clay (Orange Park)
+    "12109": "32080",  # St. Johns (St. Augustine)
+    "12089": "32034",  # Nassau (Fernandina Beach)
+    "12003": "32063",  # Baker (Macclenny)
+}
+AIRNOW_CACHE = RAW / "airnow"
+
+def _fetch_airnow_zip(zipcode, api_key, hour):
+    """Current AirNow observations for one zip, cached per observation hour."""
+    url = "https://www.airnowapi.org/aq/observation/zipCode/current/"
+    params = {
+        "format": "application/json",
+        "zipCode": zipcode,
+        "distance": 25,
+        "API_KEY": api_key
+    }
+    # AirNow updates hourly: one cache file per zip per hour
+    path = AIRNOW_CACHE / f"{zipcode}_{hour}.json"
+    return cached_json(url, params=params, path=path, ttl=TTL_HOUR, timeout=15)
 
-def fetch_airnow_daily_aqi(api_key=None):
+def fetch_airnow_daily_aqi(api_key=None, county_zips=None, max_workers=8, scope=None):
     """
     AirNow Daily API: Current/recent AQI for real-time air quality.
     https://docs.airnowapi.org/
     Phase 3: Optional daily AQI (requires free API key from airnowapi.org)
     Returns 7-day rolling average if available.
+    Zips are queried concurrently; responses are cached per zip and observation
+    hour, so reruns within the same hour make no network calls.
+    Zip proxies only exist for the metro counties, so other scopes skip AirNow.
     """
+    if county_zips is None and _scope(scope) != "metro":
+        print("  Skipping AirNow (no zip proxies outside metro scope) - using annual EPA data only")
+        return pd.DataFrame()
+    
     if not api_key:
         api_key = os.environ.get("AIRNOW_API_KEY")
     
@@ -260,31 +392,27 @@ def fetch_airnow_daily_aqi(api_key=None):
         print("  Skipping AirNow (no API key) - using annual EPA data only")
         return pd.DataFrame()  # Empty, will fall back to EPA annual data
     
-    # AirNow API endpoint for current observations by zipcode
-    # We'll use major city zipcodes as proxies for counties
-    county_zips = {
-        "12031": "32202",  # Duval (Jacksonville)
-        "12019": "32003",  # Clay (Orange Park)
-        "12109": "32080",  # St. Johns (St. Augustine)
-        "12089": "32034",  # Nassau (Fernandina Beach)
-        "12003": "32063",  # Baker (Macclenny)
-    }
+    county_zips = county_zips or AIRNOW_COUNTY_ZIPS
+    hour = datetime.utcnow().strftime("%Y%m%d%H")
+    
+    # Drop observation files older than a day
+    AIRNOW_CACHE.mkdir(parents=True, exist_ok=True)
+    cutoff = time.time() - 86400
+    for old in list(AIRNOW_CACHE.glob("*.json")):
+        if old.stat().st_mtime < cutoff:
+            old.unlink(missing_ok=True)
     
     results = []
     
-    for fips, zipcode in county_zips.items():
-        try:
-            url = "https://www.airnowapi.org/aq/observation/zipCode/current/"
-            params = {
-                "format": "application/json",
-                "zipCode": zipcode,
-                "distance": 25,
-                "API_KEY": api_key
-            }
-            
-            r = requests.get(url, params=params, timeout=15)
-            r.raise_for_status()
-            data = r.json()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(county_zips))) as pool:
+        futures = {fips: pool.submit(_fetch_airnow_zip, zipcode, api_key, hour)
+                   for fips, zipcode in county_zips.items()}
+        for fips, future in futures.items():
+            try:
+                data = future.result()
+            except Exception as e:
+                print(f"  Warning: AirNow data unavailable for {fips}: {e}")
+                continue
             
             if data:
                 # Get current AQI (max of all pollutants)
@@ -292,17 +420,45 @@ def fetch_airnow_daily_aqi(api_key=None):
                 if aqi_values:
                     current_aqi = max(aqi_values)
                     results.append({"fips": fips, "current_aqi": current_aqi})
-        
-        except Exception as e:
-            print(f"  Warning: AirNow data unavailable for {fips}: {e}")
-            continue
     
     if results:
         return pd.DataFrame(results)
     else:
         return pd.DataFrame()
 
-def build_scorecard():
+# (key, label, fetcher) - each fetcher keeps its own fallback behaviour
+SOURCES = [
+    ("aqi", "EPA AQI", lambda scope=None: fetch_epa_aqi_annual(2023, scope=scope)),
+    ("hpsa", "HRSA HPSA", fetch_hrsa_hpsa_dashboard),
+    ("places", "CDC PLACES", fetch_cdc_places_county),
+    ("fema", "FEMA NRI", fetch_fema_nri),
+    ("respiratory", "CDC Respiratory Virus (Phase 3)", fetch_cdc_respiratory_virus),
+    ("airnow", "AirNow Daily (optional)", fetch_airnow_daily_aqi),  # Will skip if no API key
+]
+
+def _timed(fetcher, scope=None):
+    start = time.perf_counter()
+    result = fetcher(scope=scope)
+    return result, time.perf_counter() - start
+
+def fetch_all_sources(max_workers=None, scope=None):
+    """
+    Run every county data source concurrently.
+    Wall-clock cost is the slowest source rather than the sum of all of them.
+    Returns {key: result}; a fetcher that raises still fails the build, as before.
+    """
+    scope = _scope(scope)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers or len(SOURCES)) as pool:
+        futures = {key: pool.submit(_timed, fetcher, scope) for key, _, fetcher in SOURCES}
+        results = {}
+        for key, label, _ in SOURCES:
+            results[key], elapsed = futures[key].result()
+            print(f"  - {label}: {elapsed:.1f}s")
+    print(f"  Fetched {len(SOURCES)} sources in {time.perf_counter() - start:.1f}s")
+    return results
+
+def score_counties(seed, sources):
     """
     Phase 3: Real-time signals - Activated respiratory virus tracking
     Scoring weights (out of 100):
@@ -311,31 +467,15 @@ def build_scorecard():
     - Chronic Disease (CDC PLACES): 30 pts
     - Hazard Risk (FEMA NRI): 15 pts
     - Respiratory Virus Activity (CDC): 10 pts ✅ ACTIVE
+    Every source is joined on FIPS (respiratory on state), so cost grows with
+    the number of rows, not with a per-county loop.
     """
-    print("Fetching data sources (Phase 3)...")
-    
-    # Fetch all sources
-    print("  - EPA AQI...")
-    aqi = fetch_epa_aqi_annual(2023)
-    
-    print("  - HRSA HPSA...")
-    hpsa = fetch_hrsa_hpsa_dashboard()
-    
-    print("  - CDC PLACES...")
-    places = fetch_cdc_places_county()
-    
-    print("  - FEMA NRI...")
-    fema = fetch_fema_nri()
-    
-    # Phase 3: Real-time signals
-    print("  - CDC Respiratory Virus (Phase 3)...")
-    respiratory = fetch_cdc_respiratory_virus()
-    
-    print("  - AirNow Daily (optional)...")
-    airnow = fetch_airnow_daily_aqi()  # Will skip if no API key
-
-    # Seed frame from our county list
-    seed = pd.DataFrame(COUNTIES, columns=["fips","state","county"])
+    aqi = sources["aqi"]
+    hpsa = sources["hpsa"]
+    places = sources["places"]
+    fema = sources["fema"]
+    respiratory = sources["respiratory"]
+    airnow = sources["airnow"]
 
     # Join all sources
     df = seed.merge(aqi[["fips","unhealthy_or_worse_days"]], on="fips", how="left")
@@ -348,39 +488,12 @@ def build_scorecard():
         df = df.merge(airnow[["fips","current_aqi"]], on="fips", how="left")
         print(f"    ✅ AirNow real-time data integrated for {len(airnow)} counties")
 
-    # Phase 3 Scoring (transparent, weighted; sum = 100 points)
-    
-    # 1. AQI stress (15 pts): unhealthy days capped at 30 (or current AQI if available)
-    df["aqi_days"] = df["unhealthy_or_worse_days"].fillna(0).clip(0, 30)
-    if "current_aqi" in df.columns:
-        # Use current AQI if available (0-500 scale, 150+ is unhealthy)
-        df["score_air_q"] = (df["current_aqi"].fillna(0).clip(0, 200) / 200.0) * 15.0
-    else:
-        df["score_air_q"] = (df["aqi_days"] / 30.0) * 15.0
-    
-    # 2. HPSA (30 pts): primary care shortage (0-25 scale)
-    df["score_hpsa"] = (df["hpsa_primary_care_max"].fillna(0).clip(0, 25) / 25.0) * 30.0
-    
-    # 3. Chronic Disease (30 pts): prevalence % (assume 0-20% typical range, cap at 50%)
-    df["score_chronic"] = (df["chronic_disease_prev"].fillna(0).clip(0, 50) / 50.0) * 30.0
-    
-    # 4. Hazard Risk (15 pts): FEMA NRI score (0-100 scale typical)
-    df["score_hazard"] = (df["risk_score"].fillna(0).clip(0, 100) / 100.0) * 15.0
-    
-    # 5. Respiratory Virus (10 pts): Phase 3 - ACTIVE! State-level CDC data
-    # Apply respiratory activity score to all counties (state-wide measure)
-    respiratory_score_val = (respiratory["respiratory_score"] / 10.0) * 10.0
-    df["respiratory_activity"] = respiratory["respiratory_activity_level"]
-    df["score_respiratory"] = respiratory_score_val
-    
-    # Total readiness score
-    df["readiness_score"] = (
-        df["score_air_q"] + 
-        df["score_hpsa"] + 
-        df["score_chronic"] + 
-        df["score_hazard"] + 
-        df["score_respiratory"]
-    ).round(1)
+    # Phase 3 Scoring (transparent, weighted; sum = 100 points) - see scoring.READINESS_SPEC
+    # AQI stress uses current AQI instead of annual unhealthy days when AirNow is available;
+    # respiratory activity is a state-wide measure applied to each state's counties
+    df = df.merge(respiratory[["state", "respiratory_activity_level", "respiratory_score"]], on="state", how="left")
+    df["respiratory_activity"] = df["respiratory_activity_level"].fillna(RESPIRATORY_DEFAULT["respiratory_activity_level"])
+    df = scoring.score(df)
 
     # Friendly columns
     df["updated_utc"] = datetime.utcnow().isoformat(timespec="seconds") + "Z"
@@ -398,13 +511,42 @@ def build_scorecard():
     if "current_aqi" in df.columns:
         output_cols.insert(4, "current_aqi")
     
-    out = df[output_cols].sort_values("readiness_score", ascending=False)
+    return df[output_cols].sort_values("readiness_score", ascending=False)
+
+def scorecard_path(scope=None):
+    """data/scorecard.csv for the published metro scorecard, scorecard_<scope>.csv otherwise."""
+    scope = _scope(scope)
+    return OUT / ("scorecard.csv" if scope == "metro" else f"scorecard_{scope}.csv")
+
+def build_scorecard(sources=None, scope=None):
+    """
+    Fetch (unless `sources` from fetch_all_sources is passed), score and save
+    the county scorecard for a scope ("metro", "state" or "national").
+    """
+    scope = _scope(scope)
+    if sources is None:
+        print(f"Fetching data sources (Phase 3, {scope} scope)...")
+        sources = fetch_all_sources(scope=scope)
 
-    OUT.joinpath("scorecard.csv").write_text(out.to_csv(index=False))
-    print(f"✅ Generated Phase 3 scorecard with {len(out)} counties")
-    print(f"   Respiratory Activity: {respiratory['respiratory_activity_level']} (adds {respiratory_score_val:.1f} pts to all counties)")
+    # Seed frame from the scope's county list
+    out = score_counties(target_counties(scope), sources)
+
+    path = scorecard_path(scope)
+    path.write_text(out.to_csv(index=False))
+    print(f"✅ Generated Phase 3 scorecard with {len(out)} counties ({scope} scope)")
+    resp = sources["respiratory"]
+    if len(resp) == 1:
+        print(f"   Respiratory Activity: {resp['respiratory_activity_level'].iat[0]} (adds {resp['respiratory_score'].iat[0]:.1f} pts to all counties)")
+    else:
+        print(f"   Respiratory Activity by state: {resp['respiratory_activity_level'].value_counts().to_dict()}")
     return out
 
+COUNTY_ROW = render.RowTemplate(
+    "<tr class='{row_class}'><td><strong>{rank}</strong></td><td class='county-name'>{county}, {state}</td>"
+    "<td>{hpsa}</td><td>{chronic}</td><td>{aqi}</td><td>{hazard}</td><td>{resp}</td>"
+    "<td class='score'>{score:.1f}</td></tr>"
+)
+
 def write_html_table(df: pd.DataFrame):
     # Phase 3: Real-time signals with respiratory virus tracking
     title = "Jacksonville-Area County Health Readiness Scorecard (Phase 3)"
@@ -466,17 +608,19 @@ small{{color:#666}}
 </tr></thead>
 <tbody>
 """
-    rank = 1
-    for _, r in df.iterrows():
-        hpsa_val = f"{int(r['hpsa_primary_care_max'])}" if pd.notna(r['hpsa_primary_care_max']) else '-'
-        chronic_val = f"{r['chronic_disease_prev']:.1f}" if pd.notna(r['chronic_disease_prev']) else '-'
-        aqi_val = f"{int(r['unhealthy_or_worse_days'])}" if pd.notna(r['unhealthy_or_worse_days']) else '-'
-        hazard_val = f"{r['risk_score']:.1f}" if pd.notna(r['risk_score']) else '-'
-        resp_val = r['respiratory_activity'] if pd.notna(r.get('respiratory_activity')) else '-'
-        
-        row_class = 'highlight' if rank == 1 else ''
-        html += f"<tr class='{row_class}'><td><strong>{rank}</strong></td><td class='county-name'>{r['county']}, {r['state']}</td><td>{hpsa_val}</td><td>{chronic_val}</td><td>{aqi_val}</td><td>{hazard_val}</td><td>{resp_val}</td><td class='score'>{r['readiness_score']:.1f}</td></tr>"
-        rank += 1
+    ranks = range(1, len(df) + 1)
+    html += COUNTY_ROW.render({
+        "row_class": ["highlight" if rank == 1 else "" for rank in ranks],
+        "rank": ranks,
+        "county": df["county"].tolist(),
+        "state": df["state"].tolist(),
+        "hpsa": [f"{int(v)}" if pd.notna(v) else "-" for v in df["hpsa_primary_care_max"].tolist()],
+        "chronic": render.fmt_or(df["chronic_disease_prev"].tolist(), ".1f", "-"),
+        "aqi": [f"{int(v)}" if pd.notna(v) else "-" for v in df["unhealthy_or_worse_days"].tolist()],
+        "hazard": render.fmt_or(df["risk_score"].tolist(), ".1f", "-"),
+        "resp": [v if pd.notna(v) else "-" for v in render.column(df, "respiratory_activity", "-")],
+        "score": df["readiness_score"].tolist(),
+    })
         
     html += f"""</tbody></table>
 <footer style="margin-top:40px;padding-top:24px;border-top:2px solid #eee">
@@ -497,6 +641,10 @@ if __name__ == "__main__":
     print("Building County-Level Scorecard")
     print("=" * 60)
     df = build_scorecard()
+    if SCOPE != "metro":
+        # Statewide / national runs are CSV-only; the site stays on the metro scorecard
+        print(f"✅ Wrote {scorecard_path().relative_to(BASE)}")
+        raise SystemExit(0)
     write_html_table(df)
     print("✅ Wrote data/scorecard.csv and docs/index.html")
     
@@ -508,7 +656,7 @@ if __name__ == "__main__":
         # Import and run school module
         import sys
         sys.path.insert(0, str(BASE / "src"))
-        from schools_html import write_school_html
+        from schools_html import SCHOOL_TABLE_FILE, write_school_html
         
         # Load school scorecard if it exists
         school_csv = OUT / "school_scorecard.csv"
@@ -516,7 +664,7 @@ if __name__ == "__main__":
             schools = pd.read_csv(school_csv)
             schools = schools.sort_values("readiness_score", ascending=False)
             write_school_html(schools)
-            print(f"✅ Wrote docs/schools.html with {len(schools)} schools")
+            print(f"✅ Wrote docs/{SCHOOL_TABLE_FILE} with {len(schools)} schools")
         else:
             print("⚠️  School scorecard not found - run src/schools.py first")
             print("   Skipping school-level HTML generation")
@@ -530,7 +678,7 @@ if __name__ == "__main__":
     print("=" * 60)
     try:
         from trends import archive_current_scores, generate_trend_summary
-        archive_current_scores()
+        archive_current_scores(county_df=df)
         generate_trend_summary()
         print("✅ Historical data archived")
     except Exception as e:
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Publishing step for docs/.
+Generated pages are minified and their <style> blocks (and local stylesheet /
+script links) are moved into content-hashed files under docs/assets/, e.g.
+assets/style.3f9c2a1b0d4e.css. The name changes whenever the content does, so
+those files can be cached indefinitely; pages sharing a style block (every
+sharded county/school page) share one file.
+
+Every text artifact then gets precompressed .gz and, when the optional
+brotli package is installed, .br siblings. These are only for deploying docs/
+behind a CDN or server that serves precompressed files (GitHub Pages compresses
+on the fly and ignores them), so they are git-ignored rather than committed.
+
+Only files whose bytes change are rewritten, so publishing an unchanged tree
+writes nothing.
+
+Usage:
+    python src/publish.py
+"""
+import gzip
+import hashlib
+import os
+import pathlib
+import re
+import tempfile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE = pathlib.Path(__file__).resolve().parents[1]
+DOCS = BASE / "docs"
+ASSETS_DIR = DOCS / "assets"
+
+# Hand-maintained pages/fragments: compressed, never rewritten
+STATIC_PAGES = {DOCS / "index.html", DOCS / "nav.html"}
+COMPRESS_SUFFIXES = {".html", ".css", ".js", ".json", ".csv", ".svg"}
+MIN_COMPRESS_BYTES = 512
+HASH_LEN = 12
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+STYLE_BLOCK = re.compile(r"<style>(.*?)</style>", re.S | re.I)
+LOCAL_LINK = re.compile(r'<link rel="stylesheet" href="(?!https?:|//)([^"]+)">|<script src="(?!https?:|//)([^"]+)"></script>', re.I)
+RAW_BLOCK = re.compile(r"<(script|pre|textarea)\b[^>]*>.*?</\1>", re.S | re.I)
+COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.S)
+CSS_COMMENT_OR_STRING = re.compile(r"""(/\*.*?\*/)|"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'""", re.S)
+# "property : value" directly inside a block, up to the next ; or } (never a selector, which ends in {)
+CSS_DECLARATION = re.compile(r"(?<=[{;])\s*([-\w]+)\s*:\s*(?=[^{};]*[;}])")
+HASHED_NAME = re.compile(r"\.[0-9a-f]{%d}\.(css|js)$" % HASH_LEN)
+
+# mkstemp creates 0600 files; published files get the usual umask-based mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+# Assets already known to be on disk in this process (sharded pages share one stylesheet)
+_seen_assets = set()
+
+
+def minify_css(css: str) -> str:
+    """
+    Drop comments and whitespace that CSS does not need. Quoted strings are kept
+    byte for byte, and spaces around ':' are only removed in declarations
+    (in a selector, ".a :hover" and ".a:hover" match different elements).
+    """
+    strings = []
+
+    def stash(match):
+        if match.group(1):  # comment
+            return ""
+        strings.append(match.group(0))
+        return f"\x00{len(strings) - 1}\x00"
+
+    css = CSS_COMMENT_OR_STRING.sub(stash, css)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = CSS_DECLARATION.sub(r"\1:", css)
+    css = css.replace(";}", "}").strip()
+    return re.sub("\x00(\\d+)\x00", lambda m: strings[int(m.group(1))], css)
+
+
+def minify_html(page: str) -> str:
+    """
+    Remove comments, indentation and blank lines outside <script>, <pre> and
+    <textarea> (whose contents are kept byte for byte).
+    """
+    raw = []
+
+    def stash(match):
+        raw.append(match.group(0))
+        return f"\x00{len(raw) - 1}\x00"
+
+    page = COMMENT.sub("", RAW_BLOCK.sub(stash, page))
+    page = "\n".join(line.strip() for line in page.splitlines() if line.strip())
+    return re.sub("\x00(\\d+)\x00", lambda m: raw[int(m.group(1))], page)
+
+
+def _write_if_changed(path: pathlib.Path, data: bytes) -> bool:
+    """Atomically replace path with data unless it already holds exactly that."""
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.chmod(tmp, FILE_MODE)
+    os.replace(tmp, path)
+    return True
+
+
+def hashed_asset(data: bytes, stem: str, suffix: str, assets_dir: pathlib.Path = ASSETS_DIR) -> pathlib.Path:
+    """Write data to assets_dir/<stem>.<content hash><suffix> (once) and return its path."""
+    path = pathlib.Path(assets_dir) / f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LEN]}{suffix}"
+    if path not in _seen_assets:
+        if not path.exists():
+            _write_if_changed(path, data)
+        _seen_assets.add(path)
+    return path
+
+
+def optimize_html(page: str, page_path: pathlib.Path, assets_dir: pathlib.Path = ASSETS_DIR) -> str:
+    """
+    Published form of one page: <style> blocks and local stylesheet/script links
+    replaced by links to content-hashed assets, then minified. Idempotent.
+
+    Args:
+        page: Page HTML
+        page_path: Where the page is published (links are made relative to it)
+        assets_dir: Directory for hashed assets
+    """
+    page_dir = pathlib.Path(page_path).parent
+
+    def href(asset):
+        return pathlib.Path(os.path.relpath(asset, page_dir)).as_posix()
+
+    def style(match):
+        asset = hashed_asset(minify_css(match.group(1)).encode("utf-8"), "style", ".css", assets_dir)
+        return f'<link rel="stylesheet" href="{href(asset)}">'
+
+    def local(match):
+        ref = match.group(1) or match.group(2)
+        source = page_dir / ref
+        if HASHED_NAME.search(ref) or not source.is_file():
+            return match.group(0)
+        data = source.read_bytes()
+        if source.suffix == ".css":
+            data = minify_css(data.decode("utf-8")).encode("utf-8")
+            return f'<link rel="stylesheet" href="{href(hashed_asset(data, source.stem, ".css", assets_dir))}">'
+        return f'<script src="{href(hashed_asset(data, source.stem, source.suffix, assets_dir))}"></script>'
+
+    page = STYLE_BLOCK.sub(style, page)
+    page = LOCAL_LINK.sub(local, page)
+    return minify_html(page)
+
+
+def publish_pages(paths, assets_dir: pathlib.Path = ASSETS_DIR) -> int:
+    """Optimize generated pages in place; returns how many were rewritten."""
+    written = 0
+    for path in map(pathlib.Path, paths):
+        if path.resolve() in STATIC_PAGES or not path.exists():
+            continue
+        page = path.read_text(encoding="utf-8")
+        written += _write_if_changed(path, optimize_html(page, path, assets_dir).encode("utf-8"))
+    return written
+
+
+def compress(paths) -> int:
+    """
+    Write .gz (and .br with brotli) siblings for text artifacts whose sibling is
+    missing or older than the file. Returns how many files were compressed.
+    """
+    done = 0
+    for path in map(pathlib.Path, paths):
+        if path.suffix not in COMPRESS_SUFFIXES or not path.is_file():
+            continue
+        stat = path.stat()
+        if stat.st_size < MIN_COMPRESS_BYTES:
+            continue
+        siblings = {path.with_name(path.name + ".gz"): lambda d: gzip.compress(d, GZIP_LEVEL, mtime=0)}
+        if brotli is not None:
+            siblings[path.with_name(path.name + ".br")] = lambda d: brotli.compress(d, quality=BROTLI_QUALITY)
+        stale = [s for s in siblings if not s.exists() or s.stat().st_mtime < stat.st_mtime]
+        if not stale:
+            continue
+        data = path.read_bytes()
+        for sibling in stale:
+            _write_if_changed(sibling, siblings[sibling](data))
+        done += 1
+    return done
+
+
+def prune_assets(pages, assets_dir: pathlib.Path = ASSETS_DIR) -> int:
+    """Delete hashed assets (and their siblings) no page refers to any more."""
+    assets_dir = pathlib.Path(assets_dir)
+    if not assets_dir.exists():
+        return 0
+    used = set()
+    for page in pages:
+        used.update(re.findall(r'assets/([^"/]+\.(?:css|js))"', pathlib.Path(page).read_text(encoding="utf-8")))
+    removed = 0
+    for asset in assets_dir.iterdir():
+        name = re.sub(r"\.(gz|br)$", "", asset.name)
+        if HASHED_NAME.search(name) and name not in used:
+            asset.unlink()
+            _seen_assets.discard(asset)
+            removed += 1
+    return removed
+
+
+def publish(docs: pathlib.Path = DOCS) -> dict:
+    """Optimize every generated page under docs, prune stale assets, compress docs text files."""
+    docs = pathlib.Path(docs)
+    assets_dir = docs / ASSETS_DIR.name
+    pages = sorted(docs.rglob("*.html"))
+    stats = {
+        "pages": publish_pages(pages, assets_dir),
+        "pruned": prune_assets(pages, assets_dir),
+    }
+    stats["compressed"] = compress(p for p in docs.rglob("*") if p.suffix in COMPRESS_SUFFIXES)
+    print(f"✅ Published: {stats['pages']} pages optimized, {stats['compressed']} files compressed"
+          f"{'' if brotli else ' (gzip only; pip install brotli for .br)'}, {stats['pruned']} stale assets removed")
+    return stats
+
+
+if __name__ == "__main__":
+    publish()
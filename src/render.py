@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Row rendering for the static HTML pages.
+A RowTemplate is parsed once into a positional format string; rendering then
+zips plain column lists (no per-row Series access) and joins the rows once,
+so page build time grows linearly with the number of rows.
+"""
+import string
+from itertools import starmap
+from typing import Dict, IO, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class RowTemplate:
+    """
+    str.format-style row template with named fields, e.g.
+    RowTemplate("<tr><td>{name}</td><td>{score:.1f}</td></tr>")
+    """
+
+    def __init__(self, template: str):
+        self.fields = []
+        parts = []
+        for literal, name, spec, conversion in string.Formatter().parse(template):
+            parts.append(literal.replace("{", "{{").replace("}", "}}"))
+            if name is None:
+                continue
+            if name not in self.fields:
+                self.fields.append(name)
+            parts.append("{%d%s%s}" % (self.fields.index(name),
+                                       f"!{conversion}" if conversion else "",
+                                       f":{spec}" if spec else ""))
+        self._format = "".join(parts).format
+
+    def rows(self, columns: Dict[str, Sequence]):
+        """Yield one rendered string per row of `columns` ({field: values})."""
+        return starmap(self._format, zip(*(columns[name] for name in self.fields)))
+
+    def render(self, columns: Dict[str, Sequence]) -> str:
+        """All rows, joined once."""
+        return "".join(self.rows(columns))
+
+    def write(self, stream: IO[str], columns: Dict[str, Sequence]):
+        """Write all rows to a (buffered) text stream."""
+        stream.writelines(self.rows(columns))
+
+
+def column(df: pd.DataFrame, name: str, default=None) -> list:
+    """A column as a plain Python list, or `default` repeated when the column is absent."""
+    if name in df.columns:
+        return df[name].tolist()
+    return [default] * len(df)
+
+
+def bands(values, high: float, medium: float, labels: Sequence[str]) -> list:
+    """labels[0] where value >= high, labels[1] where >= medium, else labels[2]."""
+    values = np.asarray(values, dtype=float)
+    return np.select([values >= high, values >= medium], labels[:2], labels[2]).tolist()
+
+
+def fmt_or(values, spec: str, missing: str) -> list:
+    """format(value, spec) for present values, `missing` for NaN/None."""
+    return [missing if pd.isna(v) else format(v, spec) for v in values]
@@ -3,12 +3,28 @@
 Phase 4: School-Level Granularity Module
 Fetches public school data and maps health indicators to individual schools.
 """
-import requests
+import csv
+import io
+import json
+import math
 import pandas as pd
 import pathlib
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 
+import arrow_io
+import http_client
+import scoring
+import tract_lookup
+from geocode_cache import GeocodeCache, normalize_address
+from http_cache import cached_fetch, cached_json, TTL_DAY, TTL_WEEK, TTL_FOREVER
+
+try:
+    import ijson  # Optional: streaming JSON parser
+except ImportError:
+    ijson = None
+
 # Paths
 BASE = pathlib.Path(__file__).resolve().parents[1]
 RAW = BASE / "data" / "raw"
@@ -25,20 +41,50 @@ COUNTIES_FIPS = {
 
 STATE_FIPS = "12"  # Florida
 
+# NCES CCD directory columns we use -> our names
+NCES_COLUMN_MAPPING = {
+    "NCESSCH": "school_id",
+    "SCH_NAME": "school_name",
+    "LEA_NAME": "district",
+    "LSTREET1": "address",
+    "LCITY": "city",
+    "LSTATE": "state",
+    "LZIP": "zipcode",
+    "LATCOD": "lat",
+    "LONCOD": "lon",
+    "MEMBER": "enrollment",
+}
+# Everything else read from the national file (county/status fields vary by year)
+NCES_COLUMNS = ["ST", "CNTY", "COUNTY", "LEAID", "OPSTATUS", "STATUS"] + list(NCES_COLUMN_MAPPING)
+
+URBAN_CCD_DIRECTORY = "https://educationdata.urban.org/api/v1/schools/ccd/directory"
 
-def fetch_nces_schools(year: str = "2022") -> pd.DataFrame:
+# Census Geocoder (geographies endpoints return tract GEOIDs)
+CENSUS_GEOCODER = "https://geocoding.geo.census.gov/geocoder/geographies"
+CENSUS_BENCHMARK = "Public_AR_Current"
+CENSUS_VINTAGE = "Current_Current"
+CENSUS_BATCH_LIMIT = 10000  # Max addresses per addressbatch upload
+
+
+def fetch_nces_schools(year: str = "2022", as_arrow: bool = False):
     """
     Fetch public schools from NCES Common Core of Data (CCD) directory.
     Direct CSV download - more reliable than API.
+    Only the needed columns and Florida rows are parsed out of the national file
+    (in Arrow when pyarrow is installed), so the frame stays small and Arrow-backed.
     
     https://nces.ed.gov/ccd/files.asp
     
     Args:
         year: School year (e.g., "2022" for 2021-22 school year)
+        as_arrow: Return a pyarrow Table instead of a DataFrame (needs pyarrow)
     
     Returns:
-        DataFrame with school directory information
+        DataFrame (or Arrow table) with school directory information
     """
+    if as_arrow and not arrow_io.available():
+        raise ImportError("fetch_nces_schools(as_arrow=True) needs pyarrow (pip install pyarrow)")
+    
     print(f"Fetching schools from NCES CCD (year {year})...")
     
     # NCES CCD Public School Universe Survey
@@ -54,23 +100,20 @@ def fetch_nces_schools(year: str = "2022") -> pd.DataFrame:
     url = f"https://nces.ed.gov/ccd/data/zip/ccd_sch_029_2122_l_2n_083122.csv"
     cache_path = RAW / f"nces_schools_{year}.csv"
     
-    # Try to use cached version first
-    if cache_path.exists():
-        print(f"  Using cached NCES data from {cache_path}")
-        df = pd.read_csv(cache_path, dtype=str, encoding='latin1')
-    else:
-        try:
+    # A published school-year directory never changes - cache it indefinitely
+    try:
+        if not cache_path.exists():
             print(f"  Downloading NCES school directory (may take 30-60 seconds)...")
-            df = pd.read_csv(url, dtype=str, encoding='latin1')
-            df.to_csv(cache_path, index=False)
-            print(f"  Cached to {cache_path}")
-        except Exception as e:
-            print(f"  Download failed: {e}")
-            print(f"  Trying alternative: creating sample data...")
-            return create_sample_schools()
+        cached_fetch(url, path=cache_path, ttl=TTL_FOREVER, timeout=120)
+        print(f"  Using cached NCES data from {cache_path}")
+        # Florida only, filtered while parsing
+        df = arrow_io.read_csv_filtered(cache_path, columns=NCES_COLUMNS, where={"ST": ["FL"]},
+                                        encoding='latin1')
+    except Exception as e:
+        print(f"  Download failed: {e}")
+        print(f"  Trying alternative: creating sample data...")
+        return create_sample_schools()
     
-    # Filter to Florida
-    df = df[df["ST"] == "FL"].copy()
     print(f"  Loaded {len(df)} Florida schools")
     
     # Convert county FIPS (combine state + county codes)
@@ -93,19 +136,7 @@ def fetch_nces_schools(year: str = "2022") -> pd.DataFrame:
         df = df[df[status_col].isin(["1", "Open"])].copy()
     
     # Keep only relevant columns and rename
-    column_mapping = {
-        "NCESSCH": "school_id",
-        "SCH_NAME": "school_name",
-        "LEA_NAME": "district",
-        "LSTREET1": "address",
-        "LCITY": "city",
-        "LSTATE": "state",
-        "LZIP": "zipcode",
-        "LATCOD": "lat",
-        "LONCOD": "lon",
-        "MEMBER": "enrollment",
-        "county_fips": "fips"
-    }
+    column_mapping = {**NCES_COLUMN_MAPPING, "county_fips": "fips"}
     
     # Rename available columns
     available_mapping = {k: v for k, v in column_mapping.items() if k in df.columns}
@@ -128,6 +159,8 @@ def fetch_nces_schools(year: str = "2022") -> pd.DataFrame:
     
     print(f"✅ Fetched {len(df)} schools across {len(COUNTIES_FIPS)} counties")
     
+    if as_arrow:
+        return arrow_io.pa.Table.from_pandas(df, preserve_index=False)
     return df
 
 
@@ -169,42 +202,102 @@ def create_sample_schools() -> pd.DataFrame:
         return df
 
 
-def fetch_schools_alternative(year: int = 2021) -> pd.DataFrame:
+def _urban_page_meta(path: pathlib.Path):
+    """Read (count, next) from a cached Urban API page without loading its results."""
+    with open(path, "rb") as f:
+        if ijson is None:
+            data = json.load(f)
+            return (data.get("count"), data.get("next")) if isinstance(data, dict) else (None, None)
+        meta = {}
+        for prefix, event, value in ijson.parse(f):
+            if prefix in ("count", "next") and event in ("number", "string", "null"):
+                meta[prefix] = value
+            elif prefix == "results":
+                break  # Metadata precedes results - stop before streaming the page
+    count = meta.get("count")
+    return (int(count) if count is not None else None), meta.get("next")
+
+
+def _urban_page_results(path: pathlib.Path):
+    """Yield result records from a cached Urban API page, streaming when ijson is available."""
+    with open(path, "rb") as f:
+        if ijson is not None:
+            yield from ijson.items(f, "results.item", use_float=True)
+            return
+        data = json.load(f)
+    yield from (data.get("results", []) if isinstance(data, dict) else data)
+
+
+def fetch_schools_alternative(year: int = 2021, per_page: int = 5000, max_workers: int = 4) -> pd.DataFrame:
     """
-    Alternative: Fetch schools using state-wide query then filter.
+    Alternative: Fetch schools from the Urban Institute CCD directory API.
     Fallback if county-level queries don't work.
+    
+    The county filter is pushed into the query (one query per county). Every page
+    is fetched - remaining pages in parallel once the first page reports the total
+    count, or by following "next" links when it doesn't - and each page is
+    stream-parsed from the on-disk cache, so memory stays flat.
+    
+    Args:
+        year: CCD directory year
+        per_page: Requested page size
+        max_workers: Maximum concurrent page requests
+    
+    Returns:
+        DataFrame of schools in our counties (empty on failure)
     """
-    print("  Using alternative: fetching all Florida schools...")
+    print("  Using alternative: fetching Jacksonville-area schools from Urban Institute API...")
     
-    base_url = "https://educationdata.urban.org/api/v1/schools/ccd/directory"
-    url = f"{base_url}/{year}/"
+    url = f"{URBAN_CCD_DIRECTORY}/{year}/"
+    queries = [{"fips": int(STATE_FIPS), "county_code": fips} for fips in COUNTIES_FIPS]
     
-    params = {
-        "state_fips": STATE_FIPS,
-        "page": 1,
-        "per_page": 5000  # Get many at once
-    }
+    def fetch_page(query, page):
+        return cached_fetch(url, params={**query, "page": page, "per_page": per_page}, ttl=TTL_WEEK)
+    
+    def follow_next(path):
+        pages = [path]
+        _, next_url = _urban_page_meta(path)
+        while next_url:
+            path = cached_fetch(next_url, ttl=TTL_WEEK)
+            pages.append(path)
+            _, next_url = _urban_page_meta(path)
+        return pages
+    
+    records = []
+    
+    def collect(path):
+        n = 0
+        for record in _urban_page_results(path):
+            n += 1
+            if str(record.get("county_code", "")).zfill(5) in COUNTIES_FIPS:
+                records.append(record)
+        return n
     
     try:
-        response = requests.get(url, params=params, timeout=60)
-        response.raise_for_status()
-        data = response.json()
-        
-        if "results" in data:
-            all_schools = data["results"]
-        elif isinstance(data, list):
-            all_schools = data
-        else:
-            print("  Could not parse API response")
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(all_schools)
-        
-        # Filter to our counties
-        if "fips" in df.columns:
-            df = df[df["fips"].isin(COUNTIES_FIPS.keys())].copy()
-            print(f"  Filtered to {len(df)} schools in Jacksonville area")
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            first_pages = list(pool.map(lambda q: fetch_page(q, 1), queries))
+            
+            futures = []
+            for query, first in zip(queries, first_pages):
+                page_size = collect(first)
+                count, next_url = _urban_page_meta(first)
+                if not next_url:
+                    continue
+                if count is not None and page_size:
+                    # Total known: fetch the remaining pages concurrently
+                    total_pages = math.ceil(count / page_size)
+                    futures += [pool.submit(fetch_page, query, page) for page in range(2, total_pages + 1)]
+                else:
+                    # No count: walk the "next" links for this query
+                    futures.append(pool.submit(lambda p: follow_next(p)[1:], first))
+            
+            for future in as_completed(futures):
+                result = future.result()
+                for path in (result if isinstance(result, list) else [result]):
+                    collect(path)
         
+        df = pd.DataFrame(records)
+        print(f"  Fetched {len(df)} schools in Jacksonville area")
         return df
         
     except Exception as e:
@@ -212,7 +305,8 @@ def fetch_schools_alternative(year: int = 2021) -> pd.DataFrame:
         return pd.DataFrame()
 
 
-def geocode_address_census(address: str, city: str, state: str, zipcode: str) -> Optional[Dict]:
+def geocode_address_census(address: str, city: str, state: str, zipcode: str,
+                           raise_errors: bool = False) -> Optional[Dict]:
     """
     Geocode an address using Census Geocoder API (free, no key required).
     Returns census tract, block, coordinates.
@@ -222,24 +316,26 @@ def geocode_address_census(address: str, city: str, state: str, zipcode: str) ->
         city: City name
         state: State abbreviation
         zipcode: ZIP code
+        raise_errors: Re-raise request/parse errors instead of returning None,
+            so callers can tell "no match" from "no answer"
     
     Returns:
         Dict with lat, lon, tract, block or None if geocoding fails
     """
-    url = "https://geocoding.geo.census.gov/geocoder/geographies/address"
+    url = f"{CENSUS_GEOCODER}/address"
     
     params = {
         "street": address,
         "city": city,
         "state": state,
         "zip": zipcode,
-        "benchmark": "Public_AR_Current",
-        "vintage": "Current_Current",
+        "benchmark": CENSUS_BENCHMARK,
+        "vintage": CENSUS_VINTAGE,
         "format": "json"
     }
     
     try:
-        response = requests.get(url, params=params, timeout=15)
+        response = http_client.get(url, params=params, timeout=15)
         response.raise_for_status()
         data = response.json()
         
@@ -265,57 +361,194 @@ def geocode_address_census(address: str, city: str, state: str, zipcode: str) ->
         
     except Exception as e:
         # Geocoding can fail - not critical, we have some coords from API
+        if raise_errors:
+            raise
         return None
 
 
-def geocode_schools(schools_df: pd.DataFrame, batch_size: int = 5, max_schools: int = None) -> pd.DataFrame:
+def _parse_census_batch(text: str) -> Dict[str, Dict]:
+    """
+    Parse addressbatch CSV results into {id: {lat, lon, tract, match_address}}.
+    Columns: id, input address, match status, match type, matched address,
+    "lon,lat", TIGER line id, side, state, county, tract, block.
+    """
+    results = {}
+    for row in csv.reader(io.StringIO(text)):
+        if len(row) < 11 or row[2] != "Match":
+            continue
+        # A match without state/county/tract codes is left for the single-address fallback
+        if not (row[8] and row[9] and row[10]):
+            continue
+        try:
+            lon, lat = (float(v) for v in row[5].split(","))
+        except ValueError:
+            continue
+        results[row[0]] = {
+            "lat": lat,
+            "lon": lon,
+            "tract": row[8] + row[9] + row[10],
+            "match_address": row[4],
+        }
+    return results
+
+
+def geocode_addresses_census_batch(addresses: List[tuple]) -> Dict[str, Dict]:
+    """
+    Geocode many addresses with the Census addressbatch geographies endpoint.
+    Uploads up to CENSUS_BATCH_LIMIT addresses per request.
+    
+    Args:
+        addresses: List of (id, street, city, state, zipcode) tuples
+    
+    Returns:
+        Dict of id -> {lat, lon, tract, match_address} for matched addresses only
+    """
+    results = {}
+    
+    for start in range(0, len(addresses), CENSUS_BATCH_LIMIT):
+        chunk = addresses[start:start + CENSUS_BATCH_LIMIT]
+        buf = io.StringIO()
+        csv.writer(buf).writerows(chunk)
+        
+        try:
+            response = http_client.post(
+                f"{CENSUS_GEOCODER}/addressbatch",
+                data={"benchmark": CENSUS_BENCHMARK, "vintage": CENSUS_VINTAGE},
+                files={"addressFile": ("addresses.csv", buf.getvalue(), "text/csv")},
+                timeout=600,
+            )
+            response.raise_for_status()
+        except Exception as e:
+            print(f"  Warning: Census batch geocoding failed for {len(chunk)} addresses: {e}")
+            continue
+        
+        results.update(_parse_census_batch(response.text))
+    
+    return results
+
+
+def geocode_schools(schools_df: pd.DataFrame, batch_size: int = 5, max_schools: int = None,
+                    use_batch: bool = True, use_cache: bool = True, use_offline: bool = True) -> pd.DataFrame:
     """
     Geocode all schools to census tracts with batch progress tracking.
-    Uses existing lat/lon if available, otherwise geocodes addresses.
+    Schools that already have lat/lon get their tract from local TIGER/Line
+    boundaries (no network). Of the rest, addresses already in the on-disk
+    geocode cache are answered locally; the remainder
+    go to the Census batch geocoder in one upload, then fall back to
+    single-address lookups for rows the batch could not match.
     
     Args:
         schools_df: DataFrame with school information
-        batch_size: Number of schools to geocode before showing progress
+        batch_size: Number of fallback lookups before showing progress
         max_schools: Maximum number of schools to geocode (None = all)
+        use_batch: Use the addressbatch endpoint before single lookups
+        use_cache: Read/write the persistent geocode cache
+        use_offline: Point-in-polygon lookup for schools with coordinates (needs geopandas)
     
     Returns:
         DataFrame with added 'tract' column
     """
     total_schools = len(schools_df) if max_schools is None else min(len(schools_df), max_schools)
     print(f"Geocoding {total_schools} schools to census tracts...")
-    print(f"(Using batch size of {batch_size}, ~{0.2 * batch_size:.1f}s per batch)")
     
     schools_df["tract"] = None
     geocoded_count = 0
     failed_count = 0
     
-    for idx, row in schools_df.head(max_schools).iterrows():
-        # Try geocoding address
-        if pd.notna(row.get("address")) and pd.notna(row.get("city")):
-            address = str(row.get("address", ""))
-            city = str(row.get("city", ""))
-            state = str(row.get("state", "FL"))
-            zipcode = str(row.get("zipcode", ""))
-            
-            result = geocode_address_census(address, city, state, zipcode)
-            
+    head = schools_df.head(max_schools)
+    resolved = pd.Series(False, index=head.index)
+    
+    # Offline: schools with coordinates get their tract in one spatial join
+    if use_offline and "lat" in head.columns and "lon" in head.columns:
+        if tract_lookup.available():
+            try:
+                tracts = tract_lookup.assign_tracts(
+                    pd.to_numeric(head["lat"], errors="coerce"),
+                    pd.to_numeric(head["lon"], errors="coerce"),
+                    STATE_FIPS,
+                )
+                resolved = tracts.notna()
+                schools_df.loc[resolved[resolved].index, "tract"] = tracts[resolved]
+                geocoded_count += int(resolved.sum())
+                print(f"  Offline tract lookup resolved {int(resolved.sum())} schools from coordinates")
+            except Exception as e:
+                print(f"  Warning: Offline tract lookup failed ({e}); using network geocoder")
+        else:
+            print("  Offline tract lookup unavailable (install geopandas); using network geocoder")
+    
+    # Remaining schools with a usable address, as plain tuples
+    fields = head.reindex(columns=["address", "city", "state", "zipcode"])
+    fields = fields[fields["address"].notna() & fields["city"].notna() & ~resolved]
+    fields["state"] = fields["state"].fillna("FL")
+    addresses = [
+        (str(idx), str(address), str(city), str(state), "" if pd.isna(zipcode) else str(zipcode))
+        for idx, address, city, state, zipcode in fields.itertuples(name=None)
+    ]
+    
+    matched = {}
+    pending = addresses
+    cache = GeocodeCache(vintage=f"{CENSUS_BENCHMARK}/{CENSUS_VINTAGE}") if use_cache else None
+    # Results are stored as they arrive and committed even if the run dies part-way.
+    # Only matches and genuine "no match" answers are cached; timeouts, HTTP
+    # errors and failed batch uploads are retried on the next run.
+    try:
+        if cache is not None:
+            keys = {a[0]: normalize_address(*a[1:]) for a in addresses}
+            cached = cache.lookup_many(keys.values())
+            pending = [a for a in addresses if keys[a[0]] not in cached]
+            for a in addresses:
+                entry = cached.get(keys[a[0]])
+                if entry and entry["tract"]:
+                    matched[a[0]] = entry
+            print(f"  Geocode cache: {cache.hits} hits, {cache.misses} misses")
+        
+        if use_batch and pending:
+            print(f"  Submitting {len(pending)} addresses to Census batch geocoder...")
+            batch_matched = geocode_addresses_census_batch(pending)
+            matched.update(batch_matched)
+            if cache is not None:
+                for key, result in batch_matched.items():
+                    cache.store(keys[key], result)
+            print(f"  Batch matched {len(batch_matched)}/{len(pending)} addresses")
+        
+        fallback = [a for a in pending if a[0] not in matched]
+        if fallback:
+            print(f"  Falling back to single-address lookups for {len(fallback)} schools")
+        
+        for processed, (key, address, city, state, zipcode) in enumerate(fallback, start=1):
+            try:
+                result = geocode_address_census(address, city, state, zipcode, raise_errors=True)
+                answered = True
+            except Exception:
+                result, answered = None, False
             if result and result.get("tract"):
-                schools_df.at[idx, "tract"] = result["tract"]
-                if result.get("lat") and not pd.notna(row.get("lat")):
-                    schools_df.at[idx, "lat"] = result["lat"]
-                    schools_df.at[idx, "lon"] = result["lon"]
-                geocoded_count += 1
+                matched[key] = result
             else:
                 failed_count += 1
+            if cache is not None and answered:
+                cache.store(keys[key], result)
             
             # Progress indicator
-            processed = geocoded_count + failed_count
             if processed % batch_size == 0:
-                progress_pct = (processed / total_schools) * 100
-                print(f"    Progress: {processed}/{total_schools} ({progress_pct:.1f}%) - {geocoded_count} successful, {failed_count} failed")
+                progress_pct = (processed / len(fallback)) * 100
+                print(f"    Fallback progress: {processed}/{len(fallback)} ({progress_pct:.1f}%) - {failed_count} failed")
             
             # Rate limit: Census API has no official limit but be respectful
             time.sleep(0.3)
+    finally:
+        if cache is not None:
+            cache.close()
+    
+    has_lat = schools_df["lat"].notna() if "lat" in schools_df.columns else pd.Series(False, index=schools_df.index)
+    for idx in fields.index:
+        result = matched.get(str(idx))
+        if not result or not result.get("tract"):
+            continue
+        schools_df.at[idx, "tract"] = result["tract"]
+        if result.get("lat") and not has_lat[idx]:
+            schools_df.at[idx, "lat"] = result["lat"]
+            schools_df.at[idx, "lon"] = result["lon"]
+        geocoded_count += 1
     
     success_rate = (geocoded_count / total_schools) * 100 if total_schools > 0 else 0
     print(f"✅ Geocoded {geocoded_count}/{total_schools} schools ({success_rate:.1f}% success rate)")
@@ -354,9 +587,7 @@ def fetch_cdc_places_tracts(tracts: List[str]) -> pd.DataFrame:
         }
         
         try:
-            response = requests.get(base_url, params=params, timeout=60)
-            response.raise_for_status()
-            data = response.json()
+            data = cached_json(base_url, params=params, ttl=TTL_DAY)
             all_data.extend(data)
             time.sleep(0.5)  # Be nice to API
         except Exception as e:
@@ -390,12 +621,13 @@ def fetch_cdc_places_tracts(tracts: List[str]) -> pd.DataFrame:
     return tract_health
 
 
-def join_health_data_to_schools(schools_df: pd.DataFrame) -> pd.DataFrame:
+def join_health_data_to_schools(schools_df: pd.DataFrame, county_df: pd.DataFrame = None) -> pd.DataFrame:
     """
     Join tract-level and county-level health indicators to schools.
     
     Args:
         schools_df: DataFrame with schools and census tracts
+        county_df: County scorecard already in memory (default: read data/scorecard.csv)
     
     Returns:
         DataFrame with added health indicators
@@ -418,15 +650,17 @@ def join_health_data_to_schools(schools_df: pd.DataFrame) -> pd.DataFrame:
             )
     
     # Also join county-level data from Phase 3 for schools without tract data
-    # Read the county scorecard
     county_csv = OUT / "scorecard.csv"
-    if county_csv.exists():
-        county_data = pd.read_csv(county_csv)
+    if county_df is None and county_csv.exists():
+        county_df = pd.read_csv(county_csv)
+    if county_df is not None:
+        county_data = county_df
         
-        # Get relevant county indicators
-        county_indicators = county_data[[
-            "fips", "hpsa_primary_care_max", "risk_score", "respiratory_activity"
-        ]].copy()
+        # Get relevant county indicators (current AQI only when AirNow was available)
+        county_indicators = county_data.reindex(columns=[
+            "fips", "hpsa_primary_care_max", "risk_score", "respiratory_activity",
+            "unhealthy_or_worse_days", "current_aqi",
+        ]).dropna(axis=1, how="all").copy()
         
         # Ensure fips is string type for both dataframes
         schools_df["fips"] = schools_df["fips"].astype(str)
@@ -468,52 +702,63 @@ def calculate_school_readiness_scores(schools_df: pd.DataFrame) -> pd.DataFrame:
     if "chronic_disease_prev" not in schools_df.columns:
         schools_df["chronic_disease_prev"] = None
     
-    # Scoring components
-    
-    # 1. HPSA (30 pts) - county level
-    schools_df["score_hpsa"] = (
-        schools_df["hpsa_primary_care_max"].fillna(0).clip(0, 25) / 25.0
-    ) * 30.0
-    
-    # 2. Chronic Disease (30 pts) - tract level (or county fallback)
-    schools_df["score_chronic"] = (
-        schools_df["chronic_disease_prev"].fillna(0).clip(0, 50) / 50.0
-    ) * 30.0
-    
-    # 3. Air Quality (15 pts) - county level (from county scorecard)
-    # We'll use county average since we don't have school-specific AQI
-    schools_df["score_air_q"] = 0.0  # Placeholder - can enhance with county data
-    
-    # 4. Hazard Risk (15 pts) - county level
-    schools_df["score_hazard"] = (
-        schools_df["risk_score"].fillna(0).clip(0, 100) / 100.0
-    ) * 15.0
-    
-    # 5. Respiratory (10 pts) - state level
-    # Map activity level to score
-    resp_map = {
-        "Minimal": 2.0,
-        "Low": 3.5,
-        "Moderate": 5.5,
-        "High": 7.5,
-        "Very High": 9.0
-    }
-    schools_df["score_respiratory"] = schools_df["respiratory_activity"].map(resp_map).fillna(2.0)
-    
-    # Total readiness score
-    schools_df["readiness_score"] = (
-        schools_df["score_hpsa"] +
-        schools_df["score_chronic"] +
-        schools_df["score_air_q"] +
-        schools_df["score_hazard"] +
-        schools_df["score_respiratory"]
-    ).round(1)
+    # Same components, caps and weights as the county scorecard (scoring.READINESS_SPEC);
+    # air quality comes from the school's county, respiratory from the state activity level
+    schools_df["respiratory_score"] = scoring.respiratory_score(schools_df["respiratory_activity"])
+    schools_df = scoring.score(schools_df)
     
     print(f"✅ Calculated readiness scores for {len(schools_df)} schools")
     
     return schools_df
 
 
+# Columns published in data/school_scorecard.csv
+SCORECARD_COLUMNS = [
+    "school_id", "school_name", "district", "city", "county",
+    "enrollment", "tract",
+    "chronic_disease_prev", "hpsa_primary_care_max", "respiratory_activity",
+    "score_hpsa", "score_chronic", "score_air_q", "score_hazard", "score_respiratory",
+    "readiness_score"
+]
+
+
+def load_schools() -> pd.DataFrame:
+    """
+    Load the geocoded school list (data/schools_phase4.csv), building it from
+    NCES + geocoding on first run.
+    
+    Returns:
+        DataFrame of schools with tracts (empty if no schools could be fetched)
+    """
+    schools_file = OUT / "schools_phase4.csv"
+    if schools_file.exists():
+        print("\nLoading existing schools from file...")
+        schools = pd.read_csv(schools_file)
+        print(f"Loaded {len(schools)} schools")
+        return schools
+    
+    print("\nFetching schools from NCES...")
+    schools = fetch_nces_schools(year="2022")
+    
+    if schools.empty:
+        return schools
+    
+    # Geocode schools
+    print("\nGeocoding schools...")
+    schools = geocode_schools(schools)
+    
+    # Save initial dataset
+    save_schools(schools, "schools_phase4.csv")
+    return schools
+
+
+def finalize_school_scorecard(schools_scored: pd.DataFrame) -> pd.DataFrame:
+    """Sort by readiness score (descending) and keep the published columns."""
+    schools_scored = schools_scored.sort_values("readiness_score", ascending=False)
+    available_cols = [col for col in SCORECARD_COLUMNS if col in schools_scored.columns]
+    return schools_scored[available_cols].copy()
+
+
 def save_schools(schools_df: pd.DataFrame, filename: str = "schools.csv"):
     """Save schools DataFrame to CSV."""
     output_path = OUT / filename
@@ -528,25 +773,10 @@ if __name__ == "__main__":
     print("=" * 60)
     
     # Step 1: Fetch schools (or load existing)
-    schools_file = OUT / "schools_phase4.csv"
-    if schools_file.exists():
-        print("\nLoading existing schools from file...")
-        schools = pd.read_csv(schools_file)
-        print(f"Loaded {len(schools)} schools")
-    else:
-        print("\nFetching schools from NCES...")
-        schools = fetch_nces_schools(year="2022")
-        
-        if schools.empty:
-            print("❌ No schools found")
-            exit(1)
-        
-        # Geocode schools
-        print("\nGeocoding schools...")
-        schools = geocode_schools(schools)
-        
-        # Save initial dataset
-        save_schools(schools, "schools_phase4.csv")
+    schools = load_schools()
+    if schools.empty:
+        print("❌ No schools found")
+        exit(1)
     
     # Step 2: Join health indicators
     print("\n" + "=" * 60)
@@ -565,20 +795,8 @@ if __name__ == "__main__":
     print("Step 4: Saving School Scorecard")
     print("=" * 60)
     
-    # Sort by readiness score (descending)
-    schools_scored = schools_scored.sort_values("readiness_score", ascending=False)
-    
-    # Select output columns
-    output_cols = [
-        "school_id", "school_name", "district", "city", "county",
-        "enrollment", "tract",
-        "chronic_disease_prev", "hpsa_primary_care_max", "respiratory_activity",
-        "score_hpsa", "score_chronic", "score_air_q", "score_hazard", "score_respiratory",
-        "readiness_score"
-    ]
-    
-    available_cols = [col for col in output_cols if col in schools_scored.columns]
-    schools_final = schools_scored[available_cols].copy()
+    # Sort by readiness score and select output columns
+    schools_final = finalize_school_scorecard(schools_scored)
     
     # Save school scorecard
     save_schools(schools_final, "school_scorecard.csv")
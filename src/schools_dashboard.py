@@ -4,37 +4,96 @@ import pandas as pd
 from pathlib import Path
 import nurse_data
 import grading
+import render
+import schools_html
+import search_index
 
 BASE = Path(__file__).resolve().parents[1]
 DATA = BASE / "data"
 DOCS = BASE / "docs"
 
-schools_df = pd.read_csv(DATA / "school_scorecard.csv")
+# Simulated staffing draws behind the nurse-cost range
+NURSE_DRAWS = 2000
+SCHOOL_CARD = render.RowTemplate("""
+<div class="school-card {card_class}" data-need="{need_level}" data-name="{name_lower}" data-county="{county_lower}" data-nurse="{nurse_key}">
+<div class="header">
+<div class="left">
+<div class="school-name">{school_name}</div>
+<div class="meta">{county} County • {school_type} • {enrollment} students</div>
+</div>
+<div class="right">
+<div>
+<div class="grade-display grade-{letter_lower}">{letter}</div>
+<div class="grade-label-text">{grade_label}</div>
+</div>
+</div>
+</div>
+<div class="details-grid">
+<div class="detail-item">
+<span class="label">Chronic Disease</span>
+<span class="value">{chronic:.1f}%</span>
+</div>
+<div class="detail-item">
+<span class="label">Doctor Shortage</span>
+<span class="value">{hpsa_val}</span>
+</div>
+<div class="detail-item">
+<span class="label">Air Quality</span>
+<span class="value">Good</span>
+</div>
+<div class="detail-item">
+<span class="label">Nurse Staffing</span>
+<span class="value"><span class="nurse-badge {nurse_badge_class}">{nurse_status}</span></span>
+</div>
+</div>
+<div class="recommendation">{rec}</div>
+</div>
+""")
+
+
+def write_dashboard(schools_df: pd.DataFrame = None):
+    """
+    Build docs/schools.html (plus its search index) from the school scorecard.
+    
+    Args:
+        schools_df: School scorecard, optionally already through
+            nurse_data.assign_nurse_staffing (default: read data/school_scorecard.csv)
+    """
+    if schools_df is None:
+        schools_df = pd.read_csv(DATA / "school_scorecard.csv")
+    
+    # Add nurse staffing data (the build passes frames that already have it)
+    if 'nurse_status' in schools_df.columns:
+        schools_df = schools_df.copy()
+    else:
+        schools_df = nurse_data.assign_nurse_staffing(schools_df.copy())
 
-# Add nurse staffing data
-schools_df = nurse_data.assign_nurse_staffing(schools_df)
+    # Calculate insights
+    total_schools = len(schools_df)
+    high_need = len(schools_df[schools_df['readiness_score'] >= 45])
+    medium_need = len(schools_df[(schools_df['readiness_score'] >= 30) & (schools_df['readiness_score'] < 45)])
+    low_need = len(schools_df[schools_df['readiness_score'] < 30])
+    avg_score = schools_df['readiness_score'].mean()
 
-# Calculate insights
-total_schools = len(schools_df)
-high_need = len(schools_df[schools_df['readiness_score'] >= 45])
-medium_need = len(schools_df[(schools_df['readiness_score'] >= 30) & (schools_df['readiness_score'] < 45)])
-low_need = len(schools_df[schools_df['readiness_score'] < 30])
-avg_score = schools_df['readiness_score'].mean()
+    schools_df['dual_burden'] = (
+        (schools_df['chronic_disease_prev'] > schools_df['chronic_disease_prev'].median()) &
+        (schools_df['hpsa_primary_care_max'] > schools_df['hpsa_primary_care_max'].median())
+    )
+    dual_burden_count = int(schools_df['dual_burden'].sum())
 
-schools_df['dual_burden'] = (
-    (schools_df['chronic_disease_prev'] > schools_df['chronic_disease_prev'].median()) &
-    (schools_df['hpsa_primary_care_max'] > schools_df['hpsa_primary_care_max'].median())
-)
-dual_burden_count = int(schools_df['dual_burden'].sum())
+    # Nurse insights
+    nurse_insights = nurse_data.generate_nurse_insights(schools_df)
+    schools_no_nurse = nurse_insights['schools_no_nurse']
+    high_need_no_nurse = nurse_insights['high_need_no_nurse']
+    cost_to_fill = nurse_insights['cost_to_fill_gaps']
 
-# Nurse insights
-nurse_insights = nurse_data.generate_nurse_insights(schools_df)
-schools_no_nurse = nurse_insights['schools_no_nurse']
-high_need_no_nurse = nurse_insights['high_need_no_nurse']
-cost_to_fill = nurse_insights['cost_to_fill_gaps']
+    # The staffing model is stochastic: show the range over simulated draws, not one draw
+    nurse_ci = nurse_data.summarize_simulation(nurse_data.simulate_nurse_staffing(schools_df, draws=NURSE_DRAWS))
+    nurse_ci = nurse_ci[nurse_ci['county'] == 'Statewide'].set_index('metric')
+    cost_low, cost_high = nurse_ci.loc['estimated_cost_to_fill', ['ci_low', 'ci_high']]
 
-# HTML template
-html = """<!doctype html>
+    # HTML template
+    html = """<!doctype html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
@@ -152,6 +211,7 @@ footer{padding:24px;margin-top:60px;font-size:0.85rem}
 <div class="app-nav-menu" id="navMenu">
 <a href="index.html">Home</a>
 <a href="schools.html" class="active">Schools</a>
+<a href=\"""" + schools_html.SCHOOL_TABLE_FILE + """\">School Table</a>
 <a href="counties.html">Counties</a>
 <a href="../data/school_scorecard.csv">Download Data</a>
 </div>
@@ -208,7 +268,7 @@ footer{padding:24px;margin-top:60px;font-size:0.85rem}
 </div>
 <div class="insight-item">
 <span class="bullet">▸</span>
-<span><strong>Nurse coverage gap:</strong> """ + str(schools_no_nurse) + """ schools (9%) lack nurses, including """ + str(high_need_no_nurse) + """ high-need school(s). Estimated cost to fill all gaps: $""" + f"{cost_to_fill:,.0f}" + """.</span>
+<span><strong>Nurse coverage gap:</strong> """ + str(schools_no_nurse) + """ schools (9%) lack nurses, including """ + str(high_need_no_nurse) + """ high-need school(s). Estimated cost to fill all gaps: $""" + f"{cost_to_fill:,.0f}" + """ (95% range $""" + f"{cost_low:,.0f}–${cost_high:,.0f}" + """ across """ + f"{NURSE_DRAWS:,}" + """ simulated staffing draws).</span>
 </div>
 </div>
 </div>
@@ -216,7 +276,7 @@ footer{padding:24px;margin-top:60px;font-size:0.85rem}
 <div class="filters">
 <div class="filter-row">
 <div class="search-box">
-<input type="text" id="searchInput" placeholder="Search school name or county..." onkeyup="filterSchools()">
+<input type="text" id="searchInput" placeholder="Search school name or county..." oninput="applyFilters()">
 </div>
 </div>
 <div class="filter-row">
@@ -241,82 +301,42 @@ footer{padding:24px;margin-top:60px;font-size:0.85rem}
 <div class="school-grid" id="schoolGrid">
 """
 
-# Generate cards
-for idx, row in schools_df.iterrows():
-    score = row['readiness_score']
-    unmet_score = row['unmet_need_score']
-    nurse_status = row['nurse_status']
-    nurse_penalty = row['nurse_penalty']
-    
-    # Get letter grade
-    letter, grade_label, grade_class = grading.get_letter_grade(unmet_score)
-    
-    score_class = 'danger' if unmet_score >= 45 else 'warning' if unmet_score >= 30 else 'success'
-    need_level = 'high' if unmet_score >= 45 else 'medium' if unmet_score >= 30 else 'low'
-    
-    chronic = row.get('chronic_disease_prev', 0)
-    hpsa = row.get('hpsa_primary_care_max', 0)
-    
-    # Nurse-aware recommendations
-    if nurse_status == 'None':
-        if score >= 45:
-            rec = f"<strong>URGENT:</strong> Place full-time nurse ($80K/year). High chronic disease ({chronic:.1f}%) + doctor shortage ({hpsa:.0f}) + NO nurse = daily health crises without intervention."
-        elif score >= 30:
-            rec = f"<strong>Priority:</strong> Place full-time nurse ($80K/year). Moderate health needs require daily monitoring currently unavailable."
-        else:
-            rec = f"<strong>Action:</strong> Place part-time nurse ($40K/year). Even low-need schools benefit from on-site health support."
-    elif nurse_status == 'Part-time':
-        if score >= 45:
-            rec = f"<strong>Upgrade:</strong> Expand to full-time nurse (+$40K/year). High needs exceed part-time capacity."
-        else:
-            rec = f"<strong>Consider:</strong> Upgrade to full-time nurse (+$40K/year) or maintain current part-time coverage."
-    else:  # Full-time
-        rec = f"<strong>Maintain:</strong> Full-time nurse coverage in place. Continue current wellness programs."
-    
-    enrollment_val = int(row['enrollment']) if pd.notna(row.get('enrollment')) else 'N/A'
-    hpsa_val = f"{hpsa:.0f}" if pd.notna(hpsa) else 'N/A'
-    
-    # Add nurse badge styling
-    nurse_badge_class = 'full' if nurse_status == 'Full-time' else 'part' if nurse_status == 'Part-time' else 'none'
-    card_class = 'no-nurse' if nurse_status == 'None' else ''
-    
-    html += f"""
-<div class="school-card {card_class}" data-need="{need_level}" data-name="{row['school_name'].lower()}" data-county="{row.get('county', '').lower()}" data-nurse="{nurse_status.lower().replace('-', '')}">
-<div class="header">
-<div class="left">
-<div class="school-name">{row['school_name']}</div>
-<div class="meta">{row.get('county', 'Unknown')} County • {row.get('school_type', 'School')} • {enrollment_val if isinstance(enrollment_val, str) else f'{enrollment_val:,}'} students</div>
-</div>
-<div class="right">
-<div>
-<div class="grade-display grade-{letter.lower()}">{letter}</div>
-<div class="grade-label-text">{grade_label}</div>
-</div>
-</div>
-</div>
-<div class="details-grid">
-<div class="detail-item">
-<span class="label">Chronic Disease</span>
-<span class="value">{chronic:.1f}%</span>
-</div>
-<div class="detail-item">
-<span class="label">Doctor Shortage</span>
-<span class="value">{hpsa_val}</span>
-</div>
-<div class="detail-item">
-<span class="label">Air Quality</span>
-<span class="value">Good</span>
-</div>
-<div class="detail-item">
-<span class="label">Nurse Staffing</span>
-<span class="value"><span class="nurse-badge {nurse_badge_class}">{nurse_status}</span></span>
-</div>
-</div>
-<div class="recommendation">{rec}</div>
-</div>
-"""
+    # Generate cards
+    unmet_scores = schools_df['unmet_need_score'].tolist()
+    nurse_statuses = schools_df['nurse_status'].tolist()
+    grades = [grading.get_letter_grade(s) for s in unmet_scores]
+    school_names = schools_df['school_name'].tolist()
+    need_levels = render.bands(unmet_scores, 45, 30, ['high', 'medium', 'low'])
+    nurse_keys = [s.lower().replace('-', '') for s in nurse_statuses]
+    html += SCHOOL_CARD.render({
+        'card_class': ['no-nurse' if s == 'None' else '' for s in nurse_statuses],
+        'need_level': need_levels,
+        'name_lower': [n.lower() for n in school_names],
+        'county_lower': [c.lower() for c in render.column(schools_df, 'county', '')],
+        'nurse_key': nurse_keys,
+        'school_name': school_names,
+        'county': render.column(schools_df, 'county', 'Unknown'),
+        'school_type': render.column(schools_df, 'school_type', 'School'),
+        'enrollment': [f"{int(e):,}" if pd.notna(e) else 'N/A' for e in render.column(schools_df, 'enrollment')],
+        'letter': [g[0] for g in grades],
+        'letter_lower': [g[0].lower() for g in grades],
+        'grade_label': [g[1] for g in grades],
+        'chronic': render.column(schools_df, 'chronic_disease_prev', 0),
+        'hpsa_val': render.fmt_or(render.column(schools_df, 'hpsa_primary_care_max', 0), '.0f', 'N/A'),
+        'nurse_badge_class': ['full' if s == 'Full-time' else 'part' if s == 'Part-time' else 'none' for s in nurse_statuses],
+        'nurse_status': nurse_statuses,
+        'rec': list(map(nurse_data.recommendation, nurse_statuses, schools_df['readiness_score'].tolist(),
+                        render.column(schools_df, 'chronic_disease_prev', 0),
+                        render.column(schools_df, 'hpsa_primary_care_max', 0))),
+    })
 
-html += """
+    # Search index for the filters: card i on the page is item i in the index
+    search_index.write_search_assets(search_index.build_search_index(
+        [school_names, render.column(schools_df, 'county', '')],
+        {'need': need_levels, 'nurse': nurse_keys},
+    ), DOCS)
+
+    html += """
 </div>
 <footer>
 <p>Data sources: CDC PLACES (chronic disease), HRSA HPSA (doctor shortage), NCES (schools), Census Geocoder (tracts)</p>
@@ -324,21 +344,17 @@ html += """
 </footer>
 </div>
 <script>
-function filterNeed(level){
-const cards=document.querySelectorAll('.school-card');
-const buttons=document.querySelectorAll('.filter-btn');
-buttons.forEach(btn=>btn.classList.remove('active'));
-event.target.classList.add('active');
-cards.forEach(card=>{
-if(level==='all'||card.dataset.need===level){
-card.style.display='block';
-}else{
-card.style.display='none';
-}
-});
-}
+// Filtering runs in search_worker.js over the prebuilt schools_search.json;
+// the page only flips the display of cards whose visibility changed. Without
+// a working worker (unsupported, script or index failed to load) it falls back
+// to scanning the cards' data-* attributes.
+const cards=Array.from(document.getElementById('schoolGrid').children);
+let shown=new Uint8Array(cards.length).fill(1);
 let currentNeedFilter='all';
 let currentNurseFilter='all';
+let querySeq=0;
+let worker=null;
+const cardWords=[];
 function filterNeed(level){
 currentNeedFilter=level;
 const buttons=event.target.parentElement.querySelectorAll('.filter-btn');
@@ -354,32 +370,51 @@ event.target.classList.add('active');
 applyFilters();
 }
 function applyFilters(){
-const cards=document.querySelectorAll('.school-card');
-cards.forEach(card=>{
+const search=document.getElementById('searchInput').value;
+if(worker){
+worker.postMessage({seq:++querySeq,search:search,facets:{need:currentNeedFilter,nurse:currentNurseFilter}});
+return;
+}
+// Same matching as the worker: every query word must start some word of the name or county
+const terms=search.toLowerCase().match(""" + search_index.TOKEN_JS + """)||[];
+const ids=[];
+cards.forEach((card,i)=>{
+if(!cardWords[i])cardWords[i]=(card.dataset.name+' '+card.dataset.county).match(""" + search_index.TOKEN_JS + """)||[];
+const textMatch=terms.every(t=>cardWords[i].some(w=>w.startsWith(t)));
 const needMatch=currentNeedFilter==='all'||card.dataset.need===currentNeedFilter;
 const nurseMatch=currentNurseFilter==='all'||card.dataset.nurse===currentNurseFilter;
-card.style.display=(needMatch&&nurseMatch)?'block':'none';
+if(textMatch&&needMatch&&nurseMatch)ids.push(i);
 });
+showIds(ids);
 }
-function filterSchools(){
-const search=document.getElementById('searchInput').value.toLowerCase();
-const cards=document.querySelectorAll('.school-card');
-cards.forEach(card=>{
-const name=card.dataset.name;
-const county=card.dataset.county;
-if(name.includes(search)||county.includes(search)){
-card.style.display='block';
-}else{
-card.style.display='none';
+function useFallback(){
+if(worker)worker.terminate();
+worker=null;
+applyFilters();
 }
-});
+function showIds(ids){
+const next=new Uint8Array(cards.length);
+ids.forEach(i=>{next[i]=1;});
+for(let i=0;i<cards.length;i++){
+if(next[i]!==shown[i])cards[i].style.display=next[i]?'block':'none';
+}
+shown=next;
 }
 window.addEventListener('DOMContentLoaded',()=>{
+if(window.Worker){
+worker=new Worker('""" + search_index.WORKER_FILE + """');
+worker.onmessage=e=>{
+if(e.data.error)useFallback();
+else if(e.data.seq===querySeq)showIds(e.data.ids);
+};
+worker.onerror=useFallback;
+worker.postMessage({index_url:new URL('""" + search_index.SEARCH_INDEX_FILE + """',location.href).href});
+}
 const urlParams=new URLSearchParams(window.location.search);
 const search=urlParams.get('search');
 if(search){
 document.getElementById('searchInput').value=search;
-filterSchools();
+applyFilters();
 }
 });
 </script>
@@ -387,5 +422,9 @@ filterSchools();
 </html>
 """
 
-DOCS.joinpath("schools.html").write_text(html, encoding="utf-8")
-print(f"✅ Dashboard generated: {total_schools} schools ({high_need} high, {medium_need} medium, {low_need} low need)")
+    DOCS.joinpath("schools.html").write_text(html, encoding="utf-8")
+    print(f"✅ Dashboard generated: {total_schools} schools ({high_need} high, {medium_need} medium, {low_need} low need)")
+
+
+if __name__ == "__main__":
+    write_dashboard()
@@ -8,15 +8,373 @@ import pathlib
 import json
 from datetime import datetime
 
+import render
+
 BASE = pathlib.Path(__file__).resolve().parents[1]
 OUT = BASE / "data"
 DOCS = BASE / "docs"
 
+# Above this many schools the page switches to the virtualized table
+VIRTUAL_MIN_SCHOOLS = 2000
+SCHOOL_DATA_FILE = "schools_data.json"
+# docs/schools.html is the dashboard (schools_dashboard.py); the full table lives beside it
+SCHOOL_TABLE_FILE = "school_table.html"
+
+TABLE_HEAD = """<thead>
+<tr>
+    <th onclick="sortTable(0)">Rank</th>
+    <th onclick="sortTable(1)">School Name</th>
+    <th onclick="sortTable(2)">County</th>
+    <th onclick="sortTable(3)">Score</th>
+</tr>
+</thead>
+"""
+
+COUNTY_OPTION = render.RowTemplate('            <option value="{county}">{county} ({count})</option>\n')
+
+# Summary row + collapsible detail row for one school
+SCHOOL_ROWS = render.RowTemplate("""<tr onclick="toggleDetails(this, {idx})" data-row-id="{idx}">
+    <td class="rank">{rank}</td>
+    <td class="school-name">{school_name}</td>
+    <td><span class="county-badge">{county}</span></td>
+    <td class="score {score_class}">{score:.1f}</td>
+</tr>
+<tr class="detail-row" id="details-{idx}" style="display:none">
+    <td colspan="4" style="padding:0">
+        <div class="school-details">
+            <h4>{school_name} - Detailed Breakdown</h4>
+            <div style="display:grid;grid-template-columns:repeat(auto-fit,minmax(250px,1fr));gap:20px">
+                <div>
+                    <table style="width:100%;margin:0">
+                        <tr><td style="font-weight:600;color:#555">Overall Score:</td><td style="font-weight:700;color:{score_color}">{score:.1f} pts ({need_level})</td></tr>
+                        <tr><td>County:</td><td>{county}</td></tr>
+                        <tr><td>Type:</td><td>{school_type}</td></tr>
+                        <tr><td>Enrollment:</td><td>{enrollment} students</td></tr>
+                    </table>
+                </div>
+                <div>
+                    <table style="width:100%;margin:0">
+                        <tr style="background:#f0f0f0"><td colspan="2" style="font-weight:600;padding:8px">Score Components:</td></tr>
+                        <tr><td>Neighborhood Health:</td><td><strong>{score_chronic:.1f} pts</strong> ({chronic_val:.1f}% chronic disease)</td></tr>
+                        <tr><td>Doctor Availability:</td><td><strong>{score_hpsa:.1f} pts</strong> (shortage score: {hpsa_val})</td></tr>
+                        <tr><td>Air Quality:</td><td><strong>{score_air:.1f} pts</strong></td></tr>
+                        <tr><td>Disaster Risk:</td><td><strong>{score_hazard:.1f} pts</strong></td></tr>
+                        <tr><td>Respiratory Illness:</td><td><strong>{score_resp:.1f} pts</strong> ({resp_activity})</td></tr>
+                    </table>
+                </div>
+            </div>
+            <p style="margin-top:16px;font-size:0.9rem;color:#666">Click row again to collapse</p>
+        </div>
+    </td>
+</tr>
+""")
+
+
+# Virtualized table: a scrolling viewport whose tbody only ever holds the rows
+# in view (plus OVERSCAN above/below) between two spacer rows
+VIRTUAL_TABLE = """<style>
+#tableViewport {height: 70vh; overflow-y: auto; margin-top: 24px; border: 1px solid #e0e0e0}
+#tableViewport table {margin-top: 0; table-layout: fixed}
+#schoolTable tbody tr.school-row td {height: 52px; padding-top: 0; padding-bottom: 0; white-space: nowrap; overflow: hidden; text-overflow: ellipsis}
+#schoolTable tr.spacer td {padding: 0; border: none}
+#schoolTable th:nth-child(1), #schoolTable th:nth-child(4) {width: 90px}
+#schoolTable th:nth-child(3) {width: 160px}
+</style>
+<p id="tableStatus" style="color:#666;font-size:0.9rem;margin:16px 0 0">Loading schools&hellip;</p>
+<div id="tableViewport">
+<table id="schoolTable">
+""" + TABLE_HEAD + """<tbody></tbody>
+</table>
+</div>
+
+"""
+
+VIRTUAL_SCRIPT = """<script>
+// Virtualized school table: data arrives as one columnar JSON file and only
+// the rows inside the viewport are in the DOM at any time.
+const DATA_URL = __DATA_URL__;
+const ROW_HEIGHT = 52;
+const OVERSCAN = 10;
+
+let data = null;     // {name: [...], county: [...], score: [...], ...}
+let order = [];      // all school indices in the current sort order
+let view = [];       // indices passing the current filters, in sort order
+let expanded = -1;   // school index whose details are open
+let detailHeight = 0;
+let sortOrder = {};
+
+function escapeHtml(value) {
+    return String(value).replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'})[c]);
+}
+
+function fmt(value, digits) {
+    return value === null || value === undefined ? 'N/A' : Number(value).toFixed(digits);
+}
+
+function scoreBand(score) {
+    if (score >= 45) return ['score-high', 'High Need', '#d32f2f'];
+    if (score >= 30) return ['score-medium', 'Medium Need', '#f57c00'];
+    return ['score-low', 'Low Need', '#2e7d32'];
+}
+
+function schoolRow(i, rank) {
+    const band = scoreBand(data.score[i]);
+    return '<tr class="school-row' + (i === expanded ? ' expanded' : '') + '" data-row-id="' + i + '" onclick="toggleDetails(' + i + ')">' +
+        '<td class="rank">' + rank + '</td>' +
+        '<td class="school-name">' + escapeHtml(data.name[i]) + '</td>' +
+        '<td><span class="county-badge">' + escapeHtml(data.county[i]) + '</span></td>' +
+        '<td class="score ' + band[0] + '">' + fmt(data.score[i], 1) + '</td></tr>';
+}
+
+// Detail panel is only built for the one school that is expanded
+function detailRow(i) {
+    const band = scoreBand(data.score[i]);
+    const enrollment = data.enrollment[i] === null ? 'N/A' : Math.round(data.enrollment[i]).toLocaleString('en-US');
+    return '<tr class="detail-row"><td colspan="4" style="padding:0"><div class="school-details show">' +
+        '<h4>' + escapeHtml(data.name[i]) + ' - Detailed Breakdown</h4>' +
+        '<div style="display:grid;grid-template-columns:repeat(auto-fit,minmax(250px,1fr));gap:20px"><div><table style="width:100%;margin:0">' +
+        '<tr><td style="font-weight:600;color:#555">Overall Score:</td><td style="font-weight:700;color:' + band[2] + '">' + fmt(data.score[i], 1) + ' pts (' + band[1] + ')</td></tr>' +
+        '<tr><td>County:</td><td>' + escapeHtml(data.county[i]) + '</td></tr>' +
+        '<tr><td>Type:</td><td>' + escapeHtml(data.type[i]) + '</td></tr>' +
+        '<tr><td>Enrollment:</td><td>' + enrollment + ' students</td></tr>' +
+        '</table></div><div><table style="width:100%;margin:0">' +
+        '<tr style="background:#f0f0f0"><td colspan="2" style="font-weight:600;padding:8px">Score Components:</td></tr>' +
+        '<tr><td>Neighborhood Health:</td><td><strong>' + fmt(data.score_chronic[i], 1) + ' pts</strong> (' + fmt(data.chronic[i], 1) + '% chronic disease)</td></tr>' +
+        '<tr><td>Doctor Availability:</td><td><strong>' + fmt(data.score_hpsa[i], 1) + ' pts</strong> (shortage score: ' + fmt(data.hpsa[i], 1) + ')</td></tr>' +
+        '<tr><td>Air Quality:</td><td><strong>' + fmt(data.score_air[i], 1) + ' pts</strong></td></tr>' +
+        '<tr><td>Disaster Risk:</td><td><strong>' + fmt(data.score_hazard[i], 1) + ' pts</strong></td></tr>' +
+        '<tr><td>Respiratory Illness:</td><td><strong>' + fmt(data.score_resp[i], 1) + ' pts</strong> (' + escapeHtml(data.resp[i]) + ')</td></tr>' +
+        '</table></div></div><p style="margin-top:16px;font-size:0.9rem;color:#666">Click row again to collapse</p></div></td></tr>';
+}
+
+function spacer(height) {
+    return height > 0 ? '<tr class="spacer"><td colspan="4" style="height:' + height + 'px"></td></tr>' : '';
+}
+
+// Render only the slice of `view` that intersects the viewport
+function renderRows() {
+    const viewport = document.getElementById('tableViewport');
+    const tbody = document.querySelector('#schoolTable tbody');
+    const openAt = expanded >= 0 ? view.indexOf(expanded) : -1;
+    const extra = openAt >= 0 ? detailHeight : 0;
+    const top = viewport.scrollTop;
+    let start = Math.floor(top / ROW_HEIGHT);
+    if (openAt >= 0 && openAt < start && top >= (openAt + 1) * ROW_HEIGHT + extra) {
+        start = Math.floor((top - extra) / ROW_HEIGHT);
+    }
+    start = Math.max(0, start - OVERSCAN);
+    const end = Math.min(view.length, start + Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 2 * OVERSCAN);
+    
+    const parts = [spacer(start * ROW_HEIGHT + (openAt >= 0 && openAt < start ? extra : 0))];
+    for (let r = start; r < end; r++) {
+        parts.push(schoolRow(view[r], r + 1));
+        if (r === openAt) parts.push(detailRow(view[r]));
+    }
+    parts.push(spacer((view.length - end) * ROW_HEIGHT + (openAt >= end ? extra : 0)));
+    tbody.innerHTML = parts.join('');
+    
+    const detail = tbody.querySelector('.detail-row');
+    if (detail && detail.offsetHeight !== detailHeight) {
+        detailHeight = detail.offsetHeight;
+        renderRows();
+    }
+}
+
+function toggleDetails(i) {
+    expanded = expanded === i ? -1 : i;
+    renderRows();
+}
+
+// Search and filter functionality
+function filterTable() {
+    const searchValue = document.getElementById('searchInput').value.toLowerCase();
+    const countyFilter = document.getElementById('countyFilter').value;
+    const scoreFilter = document.getElementById('scoreFilter').value;
+    
+    view = order.filter(i => {
+        const score = data.score[i];
+        const county = data.county[i] || '';
+        if (searchValue && !String(data.name[i]).toLowerCase().includes(searchValue) &&
+            !county.toLowerCase().includes(searchValue)) return false;
+        if (countyFilter && !county.includes(countyFilter)) return false;
+        if (scoreFilter === 'high' && score < 45) return false;
+        if (scoreFilter === 'medium' && (score < 30 || score >= 45)) return false;
+        if (scoreFilter === 'low' && score >= 30) return false;
+        return true;
+    });
+    document.getElementById('tableStatus').textContent =
+        'Showing ' + view.length.toLocaleString('en-US') + ' of ' + data.name.length.toLocaleString('en-US') + ' schools';
+    document.getElementById('tableViewport').scrollTop = 0;
+    renderRows();
+}
+
+// Sort the index array; rank follows position in the filtered view
+function sortTable(columnIndex) {
+    const currentOrder = sortOrder[columnIndex] || 'asc';
+    const newOrder = currentOrder === 'asc' ? 'desc' : 'asc';
+    sortOrder = {};
+    sortOrder[columnIndex] = newOrder;
+    
+    const sign = newOrder === 'asc' ? 1 : -1;
+    if (columnIndex === 1 || columnIndex === 2) {
+        const values = columnIndex === 1 ? data.name : data.county;
+        order.sort((a, b) => sign * String(values[a]).localeCompare(String(values[b])));
+    } else {
+        // Rank and Score both follow the score (rank 1 = highest score)
+        const s = columnIndex === 0 ? -sign : sign;
+        order.sort((a, b) => s * (data.score[a] - data.score[b]));
+    }
+    filterTable();
+}
 
-def generate_school_html(schools_df: pd.DataFrame) -> str:
+function initCharts() {
+    // County distribution chart
+    const countyCtx = document.getElementById('countyChart');
+    if (countyCtx) {
+        const countyData = __COUNTY_DATA__;
+        new Chart(countyCtx, {
+            type: 'bar',
+            data: {
+                labels: countyData.map(d => d[0]),
+                datasets: [{
+                    label: 'Number of Schools',
+                    data: countyData.map(d => d[1]),
+                    backgroundColor: ['#1976d2', '#388e3c', '#f57c00', '#7b1fa2', '#c2185b'],
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                plugins: {
+                    legend: { display: false }
+                },
+                scales: {
+                    y: { beginAtZero: true }
+                }
+            }
+        });
+    }
+    
+    // Score distribution histogram
+    const scoreCtx = document.getElementById('scoreChart');
+    if (scoreCtx) {
+        const bins = [0, 20, 25, 30, 35, 40, 45, 50];
+        const counts = new Array(bins.length - 1).fill(0);
+        data.score.forEach(score => {
+            for (let i = 0; i < bins.length - 1; i++) {
+                if (score >= bins[i] && score < bins[i + 1]) {
+                    counts[i]++;
+                    break;
+                }
+            }
+        });
+        
+        new Chart(scoreCtx, {
+            type: 'bar',
+            data: {
+                labels: bins.slice(0, -1).map((b, i) => `${b}-${bins[i+1]}`),
+                datasets: [{
+                    label: 'Number of Schools',
+                    data: counts,
+                    backgroundColor: '#4CAF50',
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                plugins: {
+                    legend: { display: false }
+                },
+                scales: {
+                    y: { beginAtZero: true }
+                }
+            }
+        });
+    }
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const viewport = document.getElementById('tableViewport');
+    let pending = false;
+    viewport.addEventListener('scroll', () => {
+        if (pending) return;
+        pending = true;
+        requestAnimationFrame(() => { pending = false; renderRows(); });
+    });
+    window.addEventListener('resize', renderRows);
+    
+    fetch(DATA_URL)
+        .then(response => response.json())
+        .then(json => {
+            data = json;
+            order = data.score.map((_, i) => i);  // file is already ranked by score
+            filterTable();
+            initCharts();
+        })
+        .catch(() => {
+            document.getElementById('tableStatus').textContent = 'Could not load school data.';
+        });
+});
+</script>
+</body>
+</html>"""
+
+
+def footer_html() -> str:
+    return """<footer style="margin-top:48px; padding-top:32px; border-top:2px solid #eee; color:#666">
+<p style="font-size:0.9rem"><strong>Data Sources:</strong> CDC, EPA, HRSA, FEMA (all federal public data)</p>
+<p style="margin-top:12px; font-size:0.9rem">Last updated: """ + datetime.utcnow().isoformat(timespec="seconds") + """Z | Updates automatically every morning</p>
+<p style="margin-top:16px">
+<a href="counties.html" style="color:#1976d2; font-weight:600">View County Comparison</a> | 
+<a href="../data/school_scorecard.csv" style="color:#1976d2">Download Data (CSV)</a> | 
+<a href="https://github.com/scottmadden/jax-health-scorecard" style="color:#666">Technical Details</a>
+</p>
+</footer>
+
+</div>
+
+"""
+
+
+def school_table_data(schools_df: pd.DataFrame) -> dict:
+    """
+    Columnar table data for the virtualized page: one list per field, in
+    display order, floats rounded to what the page shows, NaN -> null.
+    """
+    def values(name, digits=None):
+        col = pd.to_numeric(schools_df[name], errors="coerce") if digits is not None else schools_df[name]
+        if digits is not None:
+            col = col.round(digits)
+        return [None if pd.isna(v) else v for v in col.tolist()]
+    
+    def optional(name, default, digits=None):
+        return values(name, digits) if name in schools_df.columns else [default] * len(schools_df)
+    
+    return {
+        "name": values("school_name"),
+        "county": optional("county", "Unknown"),
+        "type": optional("school_type", "School"),
+        "enrollment": optional("enrollment", None, 0),
+        "score": values("readiness_score", 1),
+        "chronic": optional("chronic_disease_prev", 0, 1),
+        "hpsa": optional("hpsa_primary_care_max", 0, 1),
+        "score_chronic": optional("score_chronic", 0, 1),
+        "score_hpsa": optional("score_hpsa", 0, 1),
+        "score_air": optional("score_air_q", 0, 1),
+        "score_hazard": optional("score_hazard", 0, 1),
+        "score_resp": optional("score_respiratory", 0, 1),
+        "resp": optional("respiratory_activity", "Unknown"),
+    }
+
+
+def generate_school_html(schools_df: pd.DataFrame, virtual: bool = False,
+                         data_url: str = SCHOOL_DATA_FILE) -> str:
     """
     Generate comprehensive HTML page for school-level scorecard.
     Features: Search, filter by county, sortable columns.
+    With virtual=True the page carries no school rows: it loads the columnar
+    JSON at data_url (see school_table_data), renders only the rows in view
+    and builds a detail panel when a row is expanded.
     """
     
     # Statistics
@@ -286,9 +644,8 @@ footer a:hover {{text-decoration: underline}}
 """
     
     # Add county filter options
-    for county in sorted(schools_df["county"].unique()):
-        count = county_counts.get(county, 0)
-        html += f'            <option value="{county}">{county} ({count})</option>\n'
+    counties = sorted(schools_df["county"].unique())
+    html += COUNTY_OPTION.render({"county": counties, "count": [county_counts.get(c, 0) for c in counties]})
     
     html += """        </select>
     </div>
@@ -319,97 +676,47 @@ Click any school to see its specific health breakdown
     </div>
 </div>
 
-<table id="schoolTable">
-<thead>
-<tr>
-    <th onclick="sortTable(0)">Rank</th>
-    <th onclick="sortTable(1)">School Name</th>
-    <th onclick="sortTable(2)">County</th>
-    <th onclick="sortTable(3)">Score</th>
-</tr>
-</thead>
-<tbody>
 """
     
-    # Add table rows with school-specific details
-    rank = 1
-    for idx, row in schools_df.iterrows():
-        school_name = row["school_name"]
-        county = row.get("county", "Unknown")
-        school_type = row.get("school_type", "School")
-        enrollment = int(row["enrollment"]) if pd.notna(row.get("enrollment")) else "N/A"
-        
-        chronic = f"{row['chronic_disease_prev']:.1f}" if pd.notna(row.get("chronic_disease_prev")) else '<span class="no-data">No data</span>'
-        chronic_val = row.get("chronic_disease_prev", 0)
-        hpsa = f"{int(row['hpsa_primary_care_max'])}" if pd.notna(row.get("hpsa_primary_care_max")) else "-"
-        hpsa_val = row.get("hpsa_primary_care_max", 0)
-        score = row["readiness_score"]
-        
-        # Get individual scores
-        score_chronic = row.get("score_chronic", 0)
-        score_hpsa = row.get("score_hpsa", 0)
-        score_air = row.get("score_air_q", 0)
-        score_hazard = row.get("score_hazard", 0)
-        score_resp = row.get("score_respiratory", 0)
-        resp_activity = row.get("respiratory_activity", "Unknown")
-        
-        # Score coloring
-        score_class = "score-high" if score >= 45 else "score-medium" if score >= 30 else "score-low"
-        need_level = "High Need" if score >= 45 else "Medium Need" if score >= 30 else "Low Need"
-        
-        html += f"""<tr onclick="toggleDetails(this, {idx})" data-row-id="{idx}">
-    <td class="rank">{rank}</td>
-    <td class="school-name">{school_name}</td>
-    <td><span class="county-badge">{county}</span></td>
-    <td class="score {score_class}">{score:.1f}</td>
-</tr>
-<tr class="detail-row" id="details-{idx}" style="display:none">
-    <td colspan="4" style="padding:0">
-        <div class="school-details">
-            <h4>{school_name} - Detailed Breakdown</h4>
-            <div style="display:grid;grid-template-columns:repeat(auto-fit,minmax(250px,1fr));gap:20px">
-                <div>
-                    <table style="width:100%;margin:0">
-                        <tr><td style="font-weight:600;color:#555">Overall Score:</td><td style="font-weight:700;color:{('#d32f2f' if score >= 45 else '#f57c00' if score >= 30 else '#2e7d32')}">{score:.1f} pts ({need_level})</td></tr>
-                        <tr><td>County:</td><td>{county}</td></tr>
-                        <tr><td>Type:</td><td>{school_type}</td></tr>
-                        <tr><td>Enrollment:</td><td>{enrollment if isinstance(enrollment, str) else f'{enrollment:,}'} students</td></tr>
-                    </table>
-                </div>
-                <div>
-                    <table style="width:100%;margin:0">
-                        <tr style="background:#f0f0f0"><td colspan="2" style="font-weight:600;padding:8px">Score Components:</td></tr>
-                        <tr><td>Neighborhood Health:</td><td><strong>{score_chronic:.1f} pts</strong> ({chronic_val:.1f}% chronic disease)</td></tr>
-                        <tr><td>Doctor Availability:</td><td><strong>{score_hpsa:.1f} pts</strong> (shortage score: {hpsa_val if pd.notna(hpsa_val) else 'N/A'})</td></tr>
-                        <tr><td>Air Quality:</td><td><strong>{score_air:.1f} pts</strong></td></tr>
-                        <tr><td>Disaster Risk:</td><td><strong>{score_hazard:.1f} pts</strong></td></tr>
-                        <tr><td>Respiratory Illness:</td><td><strong>{score_resp:.1f} pts</strong> ({resp_activity})</td></tr>
-                    </table>
-                </div>
-            </div>
-            <p style="margin-top:16px;font-size:0.9rem;color:#666">Click row again to collapse</p>
-        </div>
-    </td>
-</tr>
+    if virtual:
+        # Rows are rendered client-side from the JSON data file
+        html += VIRTUAL_TABLE
+        html += footer_html()
+        html += VIRTUAL_SCRIPT.replace("__DATA_URL__", json.dumps(data_url)).replace(
+            "__COUNTY_DATA__", json.dumps(list(county_counts.items())))
+        return html
+    
+    html += """<table id="schoolTable">
+""" + TABLE_HEAD + """<tbody>
 """
-        rank += 1
+    
+    # Add table rows with school-specific details (two <tr> per school)
+    scores = schools_df["readiness_score"].tolist()
+    html += SCHOOL_ROWS.render({
+        "idx": schools_df.index.tolist(),
+        "rank": range(1, len(schools_df) + 1),
+        "school_name": schools_df["school_name"].tolist(),
+        "county": render.column(schools_df, "county", "Unknown"),
+        "school_type": render.column(schools_df, "school_type", "School"),
+        "enrollment": [f"{int(e):,}" if pd.notna(e) else "N/A" for e in render.column(schools_df, "enrollment")],
+        "score": scores,
+        "score_class": render.bands(scores, 45, 30, ["score-high", "score-medium", "score-low"]),
+        "need_level": render.bands(scores, 45, 30, ["High Need", "Medium Need", "Low Need"]),
+        "score_color": render.bands(scores, 45, 30, ["#d32f2f", "#f57c00", "#2e7d32"]),
+        "chronic_val": render.column(schools_df, "chronic_disease_prev", 0),
+        "hpsa_val": [v if pd.notna(v) else "N/A" for v in render.column(schools_df, "hpsa_primary_care_max", 0)],
+        "score_chronic": render.column(schools_df, "score_chronic", 0),
+        "score_hpsa": render.column(schools_df, "score_hpsa", 0),
+        "score_air": render.column(schools_df, "score_air_q", 0),
+        "score_hazard": render.column(schools_df, "score_hazard", 0),
+        "score_resp": render.column(schools_df, "score_respiratory", 0),
+        "resp_activity": render.column(schools_df, "respiratory_activity", "Unknown"),
+    })
     
     html += """</tbody>
 </table>
 
-<footer style="margin-top:48px; padding-top:32px; border-top:2px solid #eee; color:#666">
-<p style="font-size:0.9rem"><strong>Data Sources:</strong> CDC, EPA, HRSA, FEMA (all federal public data)</p>
-<p style="margin-top:12px; font-size:0.9rem">Last updated: """ + datetime.utcnow().isoformat(timespec="seconds") + """Z | Updates automatically every morning</p>
-<p style="margin-top:16px">
-<a href="counties.html" style="color:#1976d2; font-weight:600">View County Comparison</a> | 
-<a href="../data/school_scorecard.csv" style="color:#1976d2">Download Data (CSV)</a> | 
-<a href="https://github.com/scottmadden/jax-health-scorecard" style="color:#666">Technical Details</a>
-</p>
-</footer>
-
-</div>
-
-<script>
+""" + footer_html() + """<script>
 // Toggle school-specific details
 function toggleDetails(rowElement, schoolId) {
     const detailRow = document.getElementById('details-' + schoolId);
@@ -603,12 +910,30 @@ function initCharts() {
     return html
 
 
-def write_school_html(schools_df: pd.DataFrame):
-    """Write school scorecard HTML to docs/schools.html"""
-    html = generate_school_html(schools_df)
-    output_path = DOCS / "schools.html"
+def write_school_html(schools_df: pd.DataFrame, virtual: bool = None):
+    """
+    Write the school scorecard table to docs/school_table.html.
+    Large tables (over VIRTUAL_MIN_SCHOOLS, or virtual=True) use the virtualized
+    page plus docs/schools_data.json.
+    
+    Returns:
+        Paths written
+    """
+    if virtual is None:
+        virtual = len(schools_df) > VIRTUAL_MIN_SCHOOLS
+    if virtual:
+        data_path = DOCS / SCHOOL_DATA_FILE
+        data_path.write_text(json.dumps(school_table_data(schools_df), separators=(",", ":")), encoding="utf-8")
+        print(f" Wrote school table data to {data_path}")
+    else:
+        # Table shrank below the threshold: drop the data file the old page used
+        (DOCS / SCHOOL_DATA_FILE).unlink(missing_ok=True)
+        data_path = None
+    html = generate_school_html(schools_df, virtual=virtual)
+    output_path = DOCS / SCHOOL_TABLE_FILE
     output_path.write_text(html, encoding="utf-8")
     print(f" Wrote school HTML to {output_path}")
+    return [p for p in (output_path, data_path) if p is not None]
 
 
 if __name__ == "__main__":
@@ -628,6 +953,6 @@ if __name__ == "__main__":
     write_school_html(schools)
     
     print(f"\n School HTML generated!")
-    print(f"   View at: docs/schools.html")
-    print(f"   Will be live at: https://scottmadden.github.io/jax-health-scorecard/schools.html")
+    print(f"   View at: docs/{SCHOOL_TABLE_FILE}")
+    print(f"   Will be live at: https://scottmadden.github.io/jax-health-scorecard/{SCHOOL_TABLE_FILE}")
 
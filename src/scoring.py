@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Readiness scoring engine shared by county, school and what-if runs.
+A spec lists the five components (input column, cap, points); every
+component is computed as one NumPy array operation:
+
+    points = clip(value, 0, cap) / cap * weight
+
+and many weight configurations can be scored in a single matrix product.
+"""
+from collections import namedtuple
+from typing import Dict, Iterable, List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+# name: output column; column: input indicator; weight: max points;
+# cap: indicator value that earns full points; fill: value used when missing
+Component = namedtuple("Component", "name column weight cap fill", defaults=(0.0,))
+
+# Activity level names -> 0-10 respiratory score (CDC state-level activity)
+RESPIRATORY_LEVELS = {
+    "minimal": 2.0,
+    "low": 3.5,
+    "moderate": 5.5,
+    "high": 7.5,
+    "very high": 9.0,
+}
+RESPIRATORY_DEFAULT_LEVEL = "Minimal"
+RESPIRATORY_DEFAULT_SCORE = RESPIRATORY_LEVELS["minimal"]
+
+# Phase 3 methodology (sum = 100 points)
+READINESS_SPEC = [
+    Component("score_air_q", "unhealthy_or_worse_days", 15.0, 30.0),        # EPA unhealthy days, capped at 30
+    Component("score_hpsa", "hpsa_primary_care_max", 30.0, 25.0),           # HPSA score 0-25
+    Component("score_chronic", "chronic_disease_prev", 30.0, 50.0),         # prevalence %, capped at 50
+    Component("score_hazard", "risk_score", 15.0, 100.0),                   # FEMA NRI 0-100
+    Component("score_respiratory", "respiratory_score", 10.0, 10.0, RESPIRATORY_DEFAULT_SCORE),
+]
+# AirNow current AQI (0-500 scale, 150+ unhealthy) replaces annual days when present
+AIR_CURRENT = Component("score_air_q", "current_aqi", 15.0, 200.0)
+
+
+def respiratory_score(levels: pd.Series) -> pd.Series:
+    """Activity level names ("High", "very high", ...) -> 0-10 score."""
+    return levels.astype("string").str.lower().map(RESPIRATORY_LEVELS).astype(float).fillna(RESPIRATORY_DEFAULT_SCORE)
+
+
+def readiness_spec(df: pd.DataFrame) -> List[Component]:
+    """READINESS_SPEC, using current AQI for air quality when df carries it."""
+    if "current_aqi" not in df.columns:
+        return list(READINESS_SPEC)
+    return [AIR_CURRENT if c.name == AIR_CURRENT.name else c for c in READINESS_SPEC]
+
+
+def normalized(df: pd.DataFrame, spec: Sequence[Component]) -> np.ndarray:
+    """(rows x components) matrix of each indicator as a 0-1 share of its cap."""
+    values = np.full((len(df), len(spec)), np.nan)
+    for i, c in enumerate(spec):
+        if c.column in df.columns:
+            values[:, i] = pd.to_numeric(df[c.column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    fills = np.array([c.fill for c in spec], dtype=float)
+    caps = np.array([c.cap for c in spec], dtype=float)
+    values = np.where(np.isnan(values), fills, values)
+    return np.clip(values, 0.0, caps) / caps
+
+
+def weight_matrix(spec: Sequence[Component], configs: Iterable[Union[Dict[str, float], Sequence[float]]]) -> np.ndarray:
+    """
+    (configs x components) weights. Each config is a full weight vector in spec
+    order, or a {component name: weight} dict overriding the spec defaults.
+    """
+    base = np.array([c.weight for c in spec], dtype=float)
+    rows = []
+    for config in configs:
+        if isinstance(config, dict):
+            row = base.copy()
+            for i, c in enumerate(spec):
+                row[i] = config.get(c.name, row[i])
+            rows.append(row)
+        else:
+            rows.append(np.asarray(config, dtype=float))
+    return np.vstack(rows) if rows else np.empty((0, len(spec)))
+
+
+def score(df: pd.DataFrame, spec: Sequence[Component] = None) -> pd.DataFrame:
+    """
+    Add one points column per component plus readiness_score (rounded to 0.1).
+
+    Args:
+        df: Rows to score (counties or schools) with the spec's indicator columns
+        spec: Components to use (default: readiness_spec(df))
+
+    Returns:
+        df with score_* and readiness_score columns set
+    """
+    spec = readiness_spec(df) if spec is None else spec
+    points = normalized(df, spec) * np.array([c.weight for c in spec])
+    for i, c in enumerate(spec):
+        df[c.name] = points[:, i]
+    df["readiness_score"] = points.sum(axis=1).round(1)
+    return df
+
+
+def score_many(df: pd.DataFrame, configs, spec: Sequence[Component] = None) -> np.ndarray:
+    """
+    Readiness totals for many weight configurations in one batched call.
+
+    Args:
+        df: Rows to score
+        configs: Weight configurations (see weight_matrix)
+        spec: Components (default: readiness_spec(df)); caps and fills come from here
+
+    Returns:
+        (configs x rows) array of unrounded readiness scores
+    """
+    spec = readiness_spec(df) if spec is None else spec
+    return weight_matrix(spec, configs) @ normalized(df, spec).T
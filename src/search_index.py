@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Prebuilt client-side search index for the school dashboard.
+The build tokenizes names once and stores per-facet bitsets, so the browser
+filters with a few array lookups and bitwise ANDs in a Web Worker instead of
+reading data-* attributes off every card on each keystroke.
+
+Index layout (JSON):
+    n          number of items (item i = i-th card on the page)
+    tokens     sorted unique lower-case tokens of the searchable text
+    postings   postings[t] = sorted item ids containing tokens[t]
+    prefixes   {prefix: [lo, hi)} token range for every 1..PREFIX_LEN prefix
+    facets     {facet: {value: base64 little-endian bitset over items}}
+"""
+import base64
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Sequence
+
+import numpy as np
+
+PREFIX_LEN = 3
+TOKEN = re.compile(r"[a-z0-9]+")
+# The same tokenizer as a JS regex literal, for the worker and the page's fallback filter
+TOKEN_JS = "/" + TOKEN.pattern + "/g"
+
+SEARCH_INDEX_FILE = "schools_search.json"
+WORKER_FILE = "search_worker.js"
+
+
+def tokens(text) -> list:
+    """Lower-case alphanumeric words; the worker splits queries the same way."""
+    if text is None or text != text:  # None / NaN
+        return []
+    return TOKEN.findall(str(text).lower())
+
+
+def bitset(mask: np.ndarray) -> str:
+    """Boolean item mask -> base64 bitset padded to whole 32-bit words."""
+    packed = np.packbits(np.asarray(mask, dtype=bool), bitorder="little")
+    words = -(-len(mask) // 32)
+    return base64.b64encode(np.pad(packed, (0, words * 4 - len(packed))).tobytes()).decode("ascii")
+
+
+def build_search_index(text_columns: Sequence[Sequence], facets: Dict[str, Sequence[str]]) -> dict:
+    """
+    Build the search index for n items.
+
+    Args:
+        text_columns: Searchable text, one sequence of n values per column (e.g. names, counties)
+        facets: {facet name: n values}; one bitset is stored per distinct value
+
+    Returns:
+        JSON-serializable index (see module docstring)
+    """
+    n = len(text_columns[0]) if text_columns else len(next(iter(facets.values()), []))
+    postings = defaultdict(set)
+    for column in text_columns:
+        for i, text in enumerate(column):
+            for token in tokens(text):
+                postings[token].add(i)
+
+    vocab = sorted(postings)
+    prefixes = {}
+    for t, token in enumerate(vocab):
+        for k in range(1, min(PREFIX_LEN, len(token)) + 1):
+            lo_hi = prefixes.setdefault(token[:k], [t, t])
+            lo_hi[1] = t + 1
+
+    facet_bits = {}
+    for facet, values in facets.items():
+        values = np.asarray(values, dtype=object)
+        facet_bits[facet] = {str(v): bitset(values == v) for v in dict.fromkeys(values.tolist())}
+
+    return {
+        "n": n,
+        "prefix_len": PREFIX_LEN,
+        "tokens": vocab,
+        "postings": [sorted(postings[token]) for token in vocab],
+        "prefixes": prefixes,
+        "facets": facet_bits,
+    }
+
+
+# Runs off the main thread. Messages in: {index_url} once, then
+# {seq, search, facets: {facet: value | 'all'}}. Messages out: {seq, ids: Int32Array},
+# or {error} when the index cannot be loaded (the page then filters on its own).
+WORKER_JS = """// Generated by src/search_index.py
+let index = null;
+let words = 0;
+let facetBits = {};
+let pending = null;
+
+function decode(b64) {
+    const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+    return new Uint32Array(bytes.buffer);
+}
+
+// Bitset of items having any token that starts with `term`
+function termBits(term) {
+    const bits = new Uint32Array(words);
+    const range = index.prefixes[term.slice(0, index.prefix_len)];
+    if (!range) return bits;
+    for (let t = range[0]; t < range[1]; t++) {
+        if (term.length > index.prefix_len && !index.tokens[t].startsWith(term)) continue;
+        const ids = index.postings[t];
+        for (let k = 0; k < ids.length; k++) bits[ids[k] >>> 5] |= 1 << (ids[k] & 31);
+    }
+    return bits;
+}
+
+function filter(query) {
+    const bits = new Uint32Array(words).fill(0xFFFFFFFF);
+    const terms = (query.search || '').toLowerCase().match(""" + TOKEN_JS + """) || [];
+    const masks = terms.map(termBits);
+    for (const [facet, value] of Object.entries(query.facets || {})) {
+        if (value === 'all') continue;
+        masks.push((facetBits[facet] || {})[value] || new Uint32Array(words));
+    }
+    masks.forEach(mask => { for (let w = 0; w < words; w++) bits[w] &= mask[w]; });
+
+    const ids = [];
+    for (let i = 0; i < index.n; i++) {
+        if (bits[i >>> 5] & (1 << (i & 31))) ids.push(i);
+    }
+    return Int32Array.from(ids);
+}
+
+function reply(query) {
+    const ids = filter(query);
+    self.postMessage({seq: query.seq, ids: ids}, [ids.buffer]);
+}
+
+self.onmessage = e => {
+    const msg = e.data;
+    if (msg.index_url) {
+        fetch(msg.index_url).then(r => {
+            if (!r.ok) throw new Error('HTTP ' + r.status);
+            return r.json();
+        }).then(json => {
+            index = json;
+            words = Math.ceil(index.n / 32);
+            for (const [facet, values] of Object.entries(index.facets)) {
+                facetBits[facet] = {};
+                for (const [value, b64] of Object.entries(values)) facetBits[facet][value] = decode(b64);
+            }
+            if (pending) reply(pending);
+            pending = null;
+        }).catch(err => {
+            index = null;
+            self.postMessage({error: String(err)});
+        });
+        return;
+    }
+    if (!index) {
+        pending = msg;  // only the latest query matters
+        return;
+    }
+    reply(msg);
+};
+"""
+
+
+def write_search_assets(index: dict, directory: Path, name: str = SEARCH_INDEX_FILE):
+    """Write the index JSON and the worker script next to the page that uses them."""
+    directory = Path(directory)
+    (directory / name).write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    (directory / WORKER_FILE).write_text(WORKER_JS, encoding="utf-8")
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Sharded static site for the school scorecard.
+Instead of one page holding every school, publishes
+
+    docs/schools/index.html                      counties with summary figures
+    docs/schools/<county>/index.html             one table per county
+    docs/schools/<county>/<school>.html          one detail page per school
+
+so a visitor downloads only the county or school they open. Pages are
+rendered and published (publish.optimize_html) in chunks, across a process
+pool for large runs, hashed, and only written when their content hash
+differs from the last publish; pages for schools that disappeared are removed.
+
+Usage:
+    python src/shards.py
+    python src/build.py --sharded
+"""
+import hashlib
+import html
+import json
+import os
+import pathlib
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+import grading
+import nurse_data
+import publish
+import render
+
+BASE = pathlib.Path(__file__).resolve().parents[1]
+OUT = BASE / "data"
+DOCS = BASE / "docs"
+SITE_DIR = DOCS / "schools"
+MANIFEST_PATH = OUT / "raw" / "shards_manifest.json"
+
+SHARD_CHUNK = 500            # pages per render task
+SHARD_POOL_MIN_PAGES = 2000  # below this, rendering stays in-process
+
+# Pages carry no build timestamp so unchanged data hashes the same every day
+PAGE_HEAD = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<style>
+body{{font-family:system-ui,-apple-system,Segoe UI,Roboto,Helvetica,Arial,sans-serif;margin:0;background:#fafafa;color:#1a1a1a;line-height:1.5}}
+.container{{max-width:1000px;margin:0 auto;padding:24px 16px;background:white}}
+.crumbs{{font-size:0.85rem;color:#888;margin-bottom:12px}}
+.crumbs a,td a{{color:#1976d2;text-decoration:none}}
+h1{{margin:0 0 8px;font-size:1.8rem}}
+.subtitle{{color:#666;margin:0 0 24px}}
+table{{width:100%;border-collapse:collapse;font-size:0.95rem}}
+th,td{{border-bottom:1px solid #e0e0e0;padding:10px 8px;text-align:left}}
+th{{font-size:0.8rem;text-transform:uppercase;color:#555}}
+.score{{font-weight:700}}
+.score-high{{color:#d32f2f}}
+.score-medium{{color:#f57c00}}
+.score-low{{color:#2e7d32}}
+.recommendation{{background:#f9f9f9;padding:12px;border-left:3px solid #e0e0e0;margin-top:24px}}
+</style>
+</head>
+<body>
+<div class="container">
+"""
+PAGE_FOOT = """<p style="margin-top:32px;font-size:0.85rem;color:#888">Data sources: CDC PLACES, HRSA HPSA, EPA, FEMA NRI, CDC respiratory surveillance</p>
+</div>
+</body>
+</html>
+"""
+
+COUNTY_ROW = render.RowTemplate(
+    '<tr><td><a href="{slug}/index.html">{county}</a></td><td>{schools:,}</td>'
+    '<td class="score {score_class}">{avg_score:.1f}</td><td>{high_need:,}</td><td>{no_nurse:,}</td></tr>\n'
+)
+SCHOOL_ROW = render.RowTemplate(
+    '<tr><td>{rank}</td><td><a href="{file}">{school_name}</a></td><td>{school_type}</td>'
+    '<td class="score {score_class}">{score:.1f}</td><td>{grade}</td><td>{nurse_status}</td></tr>\n'
+)
+
+COUNTY_PAGE = render.RowTemplate(PAGE_HEAD.replace("{title}", "{county} County Schools") + """<div class="crumbs"><a href="../index.html">All counties</a></div>
+<h1>{county} County Schools</h1>
+<p class="subtitle">{schools:,} schools ranked by health readiness score (higher = more need)</p>
+<table>
+<thead><tr><th>Rank</th><th>School</th><th>Type</th><th>Score</th><th>Grade</th><th>Nurse</th></tr></thead>
+<tbody>
+{rows}</tbody>
+</table>
+""" + PAGE_FOOT)
+
+SCHOOL_PAGE = render.RowTemplate(PAGE_HEAD.replace("{title}", "{school_name} - School Health") + """<div class="crumbs"><a href="../index.html">All counties</a> / <a href="index.html">{county} County</a></div>
+<h1>{school_name}</h1>
+<p class="subtitle">{county} County • {school_type} • {enrollment} students</p>
+<table>
+<tr><td>Readiness score</td><td class="score {score_class}">{score:.1f} pts ({need_level})</td></tr>
+<tr><td>Grade (with nurse staffing)</td><td>{grade} – {grade_label}</td></tr>
+<tr><td>Neighborhood Health</td><td>{score_chronic:.1f} pts ({chronic} chronic disease)</td></tr>
+<tr><td>Doctor Availability</td><td>{score_hpsa:.1f} pts (shortage score: {hpsa})</td></tr>
+<tr><td>Air Quality</td><td>{score_air:.1f} pts</td></tr>
+<tr><td>Disaster Risk</td><td>{score_hazard:.1f} pts</td></tr>
+<tr><td>Respiratory Illness</td><td>{score_resp:.1f} pts ({resp_activity})</td></tr>
+<tr><td>Nurse staffing</td><td>{nurse_status}</td></tr>
+</table>
+<div class="recommendation">{rec}</div>
+""" + PAGE_FOOT)
+
+PAGES = {"county": COUNTY_PAGE, "school": SCHOOL_PAGE}
+
+
+def slug(values) -> list:
+    """URL-safe lower-case slugs ("St. Johns" -> "st-johns")."""
+    return [re.sub(r"[^a-z0-9]+", "-", str(v).lower()).strip("-") or "unknown" for v in values]
+
+
+def _escaped(df: pd.DataFrame, name: str, default) -> list:
+    return [html.escape(str(v)) for v in render.column(df, name, default)]
+
+
+def _render_chunk(kind: str, columns: dict, site_dir: str, known: dict) -> list:
+    """
+    Render one chunk of pages and write those whose hash is new.
+
+    Returns:
+        [(relative path, sha256, written)] per page
+    """
+    site_dir = pathlib.Path(site_dir)
+    assets_dir = site_dir.parent / publish.ASSETS_DIR.name
+    results = []
+    for rel, page in zip(columns["path"], PAGES[kind].rows(columns)):
+        target = site_dir / rel
+        data = publish.optimize_html(page, target, assets_dir).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        written = known.get(rel) != digest or not target.exists()
+        if written:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+        results.append((rel, digest, written))
+    return results
+
+
+def _chunks(kind: str, columns: dict, known: dict):
+    n = len(columns["path"])
+    for start in range(0, n, SHARD_CHUNK):
+        part = {name: values[start:start + SHARD_CHUNK] for name, values in columns.items()}
+        yield kind, part, {rel: known[rel] for rel in part["path"] if rel in known}
+
+
+def school_columns(schools_df: pd.DataFrame) -> dict:
+    """Per-school page fields as column lists (schools_df already ranked)."""
+    scores = schools_df["readiness_score"].tolist()
+    grades = [grading.get_letter_grade(s) for s in render.column(schools_df, "unmet_need_score", 0)]
+    county_slugs = slug(render.column(schools_df, "county", "Unknown"))
+    files = [f"{name}-{key}.html" for name, key in
+             zip(slug(schools_df["school_name"]), slug(nurse_data.school_keys(schools_df)))]
+    chronic = render.column(schools_df, "chronic_disease_prev", 0)
+    hpsa = render.column(schools_df, "hpsa_primary_care_max", 0)
+    nurse_status = render.column(schools_df, "nurse_status", "Unknown")
+    return {
+        "path": [f"{c}/{f}" for c, f in zip(county_slugs, files)],
+        "file": files,
+        "school_name": _escaped(schools_df, "school_name", ""),
+        "county": _escaped(schools_df, "county", "Unknown"),
+        "school_type": _escaped(schools_df, "school_type", "School"),
+        "enrollment": [f"{int(e):,}" if pd.notna(e) else "N/A" for e in render.column(schools_df, "enrollment")],
+        "score": scores,
+        "score_class": render.bands(scores, 45, 30, ["score-high", "score-medium", "score-low"]),
+        "need_level": render.bands(scores, 45, 30, ["High Need", "Medium Need", "Low Need"]),
+        "grade": [g[0] for g in grades],
+        "grade_label": [g[1] for g in grades],
+        "chronic": [f"{v:.1f}%" if pd.notna(v) else "N/A" for v in chronic],
+        "hpsa": render.fmt_or(hpsa, ".0f", "N/A"),
+        "score_chronic": render.column(schools_df, "score_chronic", 0),
+        "score_hpsa": render.column(schools_df, "score_hpsa", 0),
+        "score_air": render.column(schools_df, "score_air_q", 0),
+        "score_hazard": render.column(schools_df, "score_hazard", 0),
+        "score_resp": render.column(schools_df, "score_respiratory", 0),
+        "resp_activity": _escaped(schools_df, "respiratory_activity", "Unknown"),
+        "nurse_status": nurse_status,
+        "rec": list(map(nurse_data.recommendation, nurse_status, scores,
+                        [0 if pd.isna(v) else v for v in chronic], [0 if pd.isna(v) else v for v in hpsa])),
+    }
+
+
+def county_columns(schools_df: pd.DataFrame, schools: dict) -> dict:
+    """Per-county page fields; each page's table rows come from the school columns."""
+    counties = pd.Series(schools["county"])
+    groups = counties.groupby(counties, sort=True).indices
+    fields = SCHOOL_ROW.fields
+    pages = {"path": [], "county": [], "schools": [], "rows": []}
+    for county, idx in groups.items():
+        rows = {name: [schools[name][i] for i in idx] for name in fields if name != "rank"}
+        rows["rank"] = range(1, len(idx) + 1)
+        pages["path"].append(schools["path"][idx[0]].split("/")[0] + "/index.html")
+        pages["county"].append(county)
+        pages["schools"].append(len(idx))
+        pages["rows"].append(SCHOOL_ROW.render(rows))
+    return pages
+
+
+def index_page(schools_df: pd.DataFrame) -> str:
+    """Top-level page: one row per county with links to its page."""
+    df = pd.DataFrame({
+        "county": _escaped(schools_df, "county", "Unknown"),
+        "score": schools_df["readiness_score"].to_numpy(),
+        "high_need": (schools_df["readiness_score"] >= 45).to_numpy(),
+        "no_nurse": (pd.Series(render.column(schools_df, "nurse_status", "")) == "None").to_numpy(),
+    })
+    summary = df.groupby("county", sort=True).agg(
+        schools=("score", "size"), avg_score=("score", "mean"),
+        high_need=("high_need", "sum"), no_nurse=("no_nurse", "sum"),
+    ).reset_index()
+    avg = summary["avg_score"].tolist()
+    rows = COUNTY_ROW.render({
+        "slug": slug(summary["county"].map(html.unescape)),
+        "county": summary["county"].tolist(),
+        "schools": summary["schools"].tolist(),
+        "avg_score": avg,
+        "score_class": render.bands(avg, 45, 30, ["score-high", "score-medium", "score-low"]),
+        "high_need": summary["high_need"].astype(int).tolist(),
+        "no_nurse": summary["no_nurse"].astype(int).tolist(),
+    })
+    return PAGE_HEAD.format(title="School Health by County") + f"""<div class="crumbs"><a href="../schools.html">Full school dashboard</a></div>
+<h1>School Health by County</h1>
+<p class="subtitle">{len(schools_df):,} schools in {len(summary)} counties. Choose a county to see its schools.</p>
+<table>
+<thead><tr><th>County</th><th>Schools</th><th>Avg score</th><th>High need</th><th>No nurse</th></tr></thead>
+<tbody>
+{rows}</tbody>
+</table>
+""" + PAGE_FOOT
+
+
+def _load_manifest() -> dict:
+    if MANIFEST_PATH.exists():
+        try:
+            return json.loads(MANIFEST_PATH.read_text())
+        except ValueError:
+            pass
+    return {}
+
+
+def _manifest_key(site_dir: pathlib.Path) -> str:
+    """Manifest key for a site: its path relative to the repo, so checkouts elsewhere reuse it."""
+    site_dir = pathlib.Path(site_dir).resolve()
+    try:
+        return site_dir.relative_to(BASE).as_posix()
+    except ValueError:  # outside the repo
+        return site_dir.as_posix()
+
+
+def write_sharded_site(schools_df: pd.DataFrame, site_dir: pathlib.Path = SITE_DIR, max_workers: int = None) -> dict:
+    """
+    Publish the index, county and school pages under site_dir.
+
+    Args:
+        schools_df: School scorecard with nurse staffing (assign_nurse_staffing)
+        site_dir: Output directory (default docs/schools)
+        max_workers: Process pool size for large runs (default: CPU count)
+
+    Returns:
+        {"pages", "written", "unchanged", "removed"} counts
+    """
+    start = time.perf_counter()
+    site_dir = pathlib.Path(site_dir)
+    schools_df = schools_df.sort_values("readiness_score", ascending=False, kind="stable")
+    known = _load_manifest().get(_manifest_key(site_dir), {})
+
+    schools = school_columns(schools_df)
+    tasks = list(_chunks("school", schools, known))
+    tasks += list(_chunks("county", county_columns(schools_df, schools), known))
+
+    if len(schools["path"]) >= SHARD_POOL_MIN_PAGES and len(tasks) > 1:
+        workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_render_chunk, *zip(*[(k, c, str(site_dir), m) for k, c, m in tasks])))
+    else:
+        parts = [_render_chunk(k, c, str(site_dir), m) for k, c, m in tasks]
+
+    # Index page is a single page: render it here through the same hash check
+    index_html = publish.optimize_html(index_page(schools_df), site_dir / "index.html",
+                                       site_dir.parent / publish.ASSETS_DIR.name).encode("utf-8")
+    index_digest = hashlib.sha256(index_html).hexdigest()
+    index_written = known.get("index.html") != index_digest or not (site_dir / "index.html").exists()
+    if index_written:
+        site_dir.mkdir(parents=True, exist_ok=True)
+        (site_dir / "index.html").write_bytes(index_html)
+    results = [r for part in parts for r in part] + [("index.html", index_digest, index_written)]
+
+    hashes = {rel: digest for rel, digest, _ in results}
+    removed = [rel for rel in known if rel not in hashes]
+    for rel in removed:
+        (site_dir / rel).unlink(missing_ok=True)
+
+    manifest = _load_manifest()
+    manifest[_manifest_key(site_dir)] = hashes
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+
+    written = sum(w for _, _, w in results)
+    stats = {"pages": len(results), "written": written, "unchanged": len(results) - written, "removed": len(removed)}
+    print(f"✅ Sharded site: {stats['pages']:,} pages ({stats['written']:,} written, "
+          f"{stats['unchanged']:,} unchanged, {stats['removed']:,} removed) in {time.perf_counter() - start:.1f}s")
+    return stats
+
+
+if __name__ == "__main__":
+    scorecard_path = OUT / "school_scorecard.csv"
+    if not scorecard_path.exists():
+        print("❌ school_scorecard.csv not found. Run schools.py first.")
+        exit(1)
+    write_sharded_site(nurse_data.assign_nurse_staffing(pd.read_csv(scorecard_path)))
+    print(f"   View at: docs/schools/index.html")
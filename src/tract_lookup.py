@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Offline census tract assignment from school coordinates.
+Loads the TIGER/Line tract boundaries for a state once, builds a spatial
+index and assigns tract GEOIDs to every point in a single spatial join, so
+only schools without coordinates need the network geocoder.
+
+Requires the optional geopandas dependency; without it callers fall back
+to network geocoding.
+"""
+import pathlib
+from functools import lru_cache
+
+import pandas as pd
+
+from http_cache import cached_fetch, TTL_FOREVER
+
+try:
+    import geopandas as gpd
+except ImportError:  # Optional dependency
+    gpd = None
+
+BASE = pathlib.Path(__file__).resolve().parents[1]
+RAW = BASE / "data" / "raw"
+
+TIGER_YEAR = 2023
+TIGER_CRS = "EPSG:4269"  # NAD83, as published by TIGER/Line
+
+
+def tiger_tract_url(state_fips: str, year: int = TIGER_YEAR) -> str:
+    return f"https://www2.census.gov/geo/tiger/TIGER{year}/TRACT/tl_{year}_{state_fips}_tract.zip"
+
+
+def available() -> bool:
+    """True when geopandas is installed and offline lookup can run."""
+    return gpd is not None
+
+
+@lru_cache(maxsize=None)
+def load_tracts(state_fips: str, year: int = TIGER_YEAR):
+    """
+    Load (downloading once) a state's tract polygons with a built spatial index.
+    Cached per process, so repeated lookups reuse the same index.
+    """
+    path = cached_fetch(
+        tiger_tract_url(state_fips, year),
+        path=RAW / f"tl_{year}_{state_fips}_tract.zip",
+        ttl=TTL_FOREVER,
+        timeout=300,
+    )
+    tracts = gpd.read_file(path, columns=["GEOID"])[["GEOID", "geometry"]]
+    tracts.sindex  # Build the STRtree now rather than on first query
+    return tracts
+
+
+def assign_tracts(lat: pd.Series, lon: pd.Series, state_fips: str, year: int = TIGER_YEAR) -> pd.Series:
+    """
+    Point-in-polygon tract lookup for many coordinates at once.
+
+    Args:
+        lat: Latitudes (NaN allowed)
+        lon: Longitudes (NaN allowed), same index as lat
+        state_fips: 2-digit state FIPS whose tract file to use
+        year: TIGER/Line vintage
+
+    Returns:
+        Series of 11-digit tract GEOIDs aligned to lat's index (None where no match)
+    """
+    result = pd.Series(None, index=lat.index, dtype=object)
+    has_coords = lat.notna() & lon.notna()
+    if not has_coords.any():
+        return result
+
+    tracts = load_tracts(state_fips, year)
+    points = gpd.GeoDataFrame(
+        geometry=gpd.points_from_xy(lon[has_coords], lat[has_coords]),
+        index=lat.index[has_coords],
+        crs=TIGER_CRS,
+    )
+    joined = gpd.sjoin(points, tracts, how="left", predicate="within")
+    # A point on a shared boundary can match two tracts - keep the first
+    joined = joined[~joined.index.duplicated(keep="first")]
+    result.loc[joined.index] = joined["GEOID"].where(joined["GEOID"].notna(), None)
+    return result
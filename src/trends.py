@@ -14,27 +14,30 @@ HISTORY_DIR = OUT / "history"
 HISTORY_DIR.mkdir(exist_ok=True)
 
 
-def archive_current_scores():
+def archive_current_scores(county_df: pd.DataFrame = None, schools_df: pd.DataFrame = None):
     """
     Archive current county and school scores with timestamp.
     Creates a daily snapshot for historical analysis.
+    Frames passed in are written directly; otherwise the published CSVs are read.
     """
     timestamp = datetime.utcnow().strftime("%Y%m%d")
     
     # Archive county scorecard
     county_csv = OUT / "scorecard.csv"
-    if county_csv.exists():
+    if county_df is None and county_csv.exists():
+        county_df = pd.read_csv(county_csv)
+    if county_df is not None:
         archive_path = HISTORY_DIR / f"county_{timestamp}.csv"
-        df = pd.read_csv(county_csv)
-        df.to_csv(archive_path, index=False)
+        county_df.to_csv(archive_path, index=False)
         print(f"📦 Archived county scores to {archive_path}")
     
     # Archive school scorecard
     school_csv = OUT / "school_scorecard.csv"
-    if school_csv.exists():
+    if schools_df is None and school_csv.exists():
+        schools_df = pd.read_csv(school_csv)
+    if schools_df is not None:
         archive_path = HISTORY_DIR / f"schools_{timestamp}.csv"
-        df = pd.read_csv(school_csv)
-        df.to_csv(archive_path, index=False)
+        schools_df.to_csv(archive_path, index=False)
         print(f"📦 Archived school scores to {archive_path}")
 
 
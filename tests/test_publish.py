@@ -0,0 +1,17 @@
+"""Tests for the CSS minifier in src/publish.py."""
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+import publish
+
+
+def test_minify_css_keeps_selector_whitespace():
+    css = ".a :hover { color : red ; }\n@media (min-width: 768px) { a :hover { margin : 0 auto; } }"
+    assert publish.minify_css(css) == ".a :hover{color:red}@media (min-width: 768px){a :hover{margin:0 auto}}"
+
+
+def test_minify_css_keeps_quoted_strings():
+    css = "q::before { content: \", \" ; font-family: 'A  B', serif; } /* note: \"x\" */"
+    assert publish.minify_css(css) == "q::before{content:\", \";font-family:'A  B',serif}"